@@ -20,6 +20,7 @@ import sys
 import argparse
 import logging
 import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Dict, List, Any, Optional
 
@@ -32,6 +33,17 @@ logger = logging.getLogger(__name__)
 
 # Constants
 DEFAULT_OUTPUT_DIR = "job_hunt_data"
+MAX_ANALYSIS_WORKERS = 8
+APPLICATION_STATUSES = ("preparing", "applied", "interview_scheduled", "rejected", "offer", "withdrawn")
+INTERVIEW_TYPES = ("phone", "video", "onsite", "technical", "other")
+STATUS_DISPLAY = {
+    "preparing": "🔄 PREPARING",
+    "applied": "📨 APPLIED",
+    "interview_scheduled": "📅 INTERVIEWS SCHEDULED",
+    "offer": "🎉 OFFERS",
+    "rejected": "❌ REJECTED",
+    "withdrawn": "⏹️ WITHDRAWN"
+}
 
 def find_resume_file():
     """
@@ -173,10 +185,16 @@ def analyze_jobs(args, jobs=None):
                 print("Error: No jobs to analyze.")
                 return []
         
-        # Analyze each job
-        for job in jobs:
+        if not jobs:
+            return jobs
+        
+        # Analyze jobs concurrently; each match is independent of the others
+        with ThreadPoolExecutor(max_workers=min(MAX_ANALYSIS_WORKERS, len(jobs))) as executor:
+            match_results = list(executor.map(job_finder.analyze_job_match, jobs))
+        
+        # Report results in the original order
+        for job, match_info in zip(jobs, match_results):
             print(f"\nAnalyzing: {job.title} - {job.company}")
-            match_info = job_finder.analyze_job_match(job)
             
             print(f"Match Score: {match_info['match_score']}%")
             print("\nMatching Skills:")
@@ -226,14 +244,7 @@ def track_applications(args):
         
         # Display applications by status group
         for status, apps in status_groups.items():
-            status_display = {
-                "preparing": "🔄 PREPARING",
-                "applied": "📨 APPLIED",
-                "interview_scheduled": "📅 INTERVIEWS SCHEDULED",
-                "offer": "🎉 OFFERS",
-                "rejected": "❌ REJECTED",
-                "withdrawn": "⏹️ WITHDRAWN"
-            }.get(status, status.upper())
+            status_display = STATUS_DISPLAY.get(status, status.upper())
             
             print(f"\n{status_display} ({len(apps)})")
             print("-" * len(status_display))
@@ -411,11 +422,11 @@ def main():
     apply_parser.add_argument("--url", help="Job URL")
     apply_parser.add_argument("--source", default="manual", help="Job source")
     apply_parser.add_argument("--job-file", help="Path to job listing file")
-    apply_parser.add_argument("--status", choices=["preparing", "applied", "interview_scheduled", "rejected", "offer", "withdrawn"],
+    apply_parser.add_argument("--status", choices=APPLICATION_STATUSES,
                                help="Application status")
     apply_parser.add_argument("--notes", help="Notes for the application")
     apply_parser.add_argument("--interview-date", help="Interview date (YYYY-MM-DD)")
-    apply_parser.add_argument("--interview-type", choices=["phone", "video", "onsite", "technical", "other"],
+    apply_parser.add_argument("--interview-type", choices=INTERVIEW_TYPES,
                                help="Interview type")
     apply_parser.add_argument("--create-materials", "-m", action="store_true", 
                                help="Create tailored resume and cover letter")
@@ -16,6 +16,13 @@ from datetime import datetime
 
 from resume_for_job_apps import process_resume_for_job_application
 
+# Patterns used to build the ATS-friendly text
+ATS_BULLETS = '•◦⦿⁃◘◙■►▷➢▪◾◽⬤'
+ATS_BULLET_TABLE = str.maketrans({bullet: '-' for bullet in ATS_BULLETS})
+# Any whitespace other than a lone space
+WHITESPACE_RE = re.compile(r'[^\S ]\s*|\s{2,}')
+BLANK_LINES_RE = re.compile(r'\n\s*\n\s*\n+')
+
 def highlight_skills(resume_text):
     """
     Extract and highlight potential skills from the resume text
@@ -108,14 +115,17 @@ def prepare_ats_friendly_text(resume_text):
     # Replace special characters
     ats_text = resume_text
     
-    # Replace bullets and special characters
-    ats_text = re.sub(r'[•◦⦿⁃◘◙■►▷➢▪◾◽⬤]', '-', ats_text)
+    # Replace bullets and special characters (skipped when none are present)
+    if any(bullet in ats_text for bullet in ATS_BULLETS):
+        ats_text = ats_text.translate(ATS_BULLET_TABLE)
     
-    # Replace non-standard whitespace
-    ats_text = re.sub(r'\s+', ' ', ats_text)
+    # Replace non-standard whitespace (skipped when the text is already single-spaced)
+    if WHITESPACE_RE.search(ats_text):
+        ats_text = WHITESPACE_RE.sub(' ', ats_text)
     
     # Clean up excessive spacing
-    ats_text = re.sub(r'\n\s*\n\s*\n+', '\n\n', ats_text)
+    if '\n' in ats_text:
+        ats_text = BLANK_LINES_RE.sub('\n\n', ats_text)
     
     return ats_text
 
@@ -144,8 +154,9 @@ def job_search_assistant(resume_pdf_path, output_dir="."):
     # 3. Prepare ATS-friendly version
     ats_friendly_text = prepare_ats_friendly_text(resume_text)
     ats_file = output_file.replace('.txt', '_ATS.txt')
-    with open(ats_file, 'w', encoding='utf-8') as f:
-        f.write(ats_friendly_text)
+    # Encode once and write the bytes in a single call
+    with open(ats_file, 'wb') as f:
+        f.write(ats_friendly_text.encode('utf-8'))
     
     print(f"\n✅ ATS-friendly version saved to: {ats_file}")
     
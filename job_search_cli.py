@@ -127,8 +127,8 @@ def main():
     
     # Output results
     if args.output:
-        with open(args.output, 'w') as f:
-            f.write(output)
+        with open(args.output, 'wb') as f:
+            f.write(output.encode('utf-8'))
         logger.info(f"Results saved to {args.output}")
     else:
         print(output)
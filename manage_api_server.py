@@ -8,8 +8,8 @@ the status of the ManageAI Resume API server.
 
 import os
 import sys
-import time
-import argparse
+import signal
+import threading
 import logging
 
 # Add the src directory to the Python path
@@ -23,8 +23,15 @@ logging.basicConfig(level=logging.INFO,
                     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Default server address
+DEFAULT_HOST = 'localhost'
+DEFAULT_PORT = 8080
+
 def parse_args():
     """Parse command line arguments."""
+    # Imported here so the plain status check doesn't pay for it
+    import argparse
+    
     parser = argparse.ArgumentParser(
         description="Manage the ManageAI Resume API server"
     )
@@ -37,15 +44,15 @@ def parse_args():
     
     parser.add_argument(
         '--host',
-        default='localhost',
-        help='Host for the server (default: localhost)'
+        default=DEFAULT_HOST,
+        help=f'Host for the server (default: {DEFAULT_HOST})'
     )
     
     parser.add_argument(
         '--port',
         type=int,
-        default=8080,
-        help='Port for the server (default: 8080)'
+        default=DEFAULT_PORT,
+        help=f'Port for the server (default: {DEFAULT_PORT})'
     )
     
     parser.add_argument(
@@ -56,8 +63,25 @@ def parse_args():
     
     return parser.parse_args()
 
+def wait_for_interrupt():
+    """Block until the process receives a signal such as SIGINT (Ctrl+C)."""
+    if hasattr(signal, 'pause'):
+        # POSIX: sleep in the kernel until a signal arrives
+        signal.pause()
+    else:
+        # Windows has no signal.pause(); an unset event blocks the same way
+        threading.Event().wait()
+
 def main():
     """Main function."""
+    # Fast path for the frequent `status` check with default settings
+    if sys.argv[1:] == ['status']:
+        if ManageAIAPIManager(host=DEFAULT_HOST, port=DEFAULT_PORT).is_server_running():
+            logger.info(f"ManageAI Resume API server is running on {DEFAULT_HOST}:{DEFAULT_PORT}")
+        else:
+            logger.info("ManageAI Resume API server is not running")
+        return 0
+    
     args = parse_args()
     
     # Create the API manager
@@ -74,8 +98,7 @@ def main():
             logger.info("Server started successfully")
             print("Server is running. Press Ctrl+C to exit (server will remain running in the background)")
             try:
-                while True:
-                    time.sleep(1)
+                wait_for_interrupt()
             except KeyboardInterrupt:
                 logger.info("Exiting... server will continue running")
         else:
@@ -96,8 +119,7 @@ def main():
             logger.info("Server restarted successfully")
             print("Server is running. Press Ctrl+C to exit (server will remain running in the background)")
             try:
-                while True:
-                    time.sleep(1)
+                wait_for_interrupt()
             except KeyboardInterrupt:
                 logger.info("Exiting... server will continue running")
         else:
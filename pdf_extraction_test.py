@@ -6,27 +6,67 @@ This script extracts and displays text and metadata from a PDF file
 to help diagnose issues with section detection.
 """
 
+import io
 import os
+import re
 import sys
 import json
 import argparse
+import contextlib
+from concurrent.futures import ProcessPoolExecutor
 from pprint import pprint
 
 # Add the project root to sys.path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-# Import the PDF extractor and replacer components
-from src.utils.pdf_extractor import PDFExtractor
-from src.utils.pdf_direct_replacer import PDFDirectReplacer
-from src.utils.pdf_content_replacer import PDFContentReplacer
-from src.utils.section_classifier import SectionClassifier
+from src.utils.text_utils import word_count
 
-def test_text_extraction(pdf_path):
-    """Test basic text extraction."""
+# The PDF extractor and replacer components pull in PyMuPDF and friends, so
+# each test imports what it needs only when it actually runs
+
+# Shared by every test so the section patterns are only compiled once
+_classifier = None
+
+def get_classifier():
+    """Return the shared section classifier, creating it on first use."""
+    global _classifier
+    if _classifier is None:
+        from src.utils.section_classifier import SectionClassifier
+        _classifier = SectionClassifier()
+    return _classifier
+
+# Per-span formatting record used by test_enhanced_fallback
+SPAN_DTYPE = [("size", "f4"), ("flags", "i4"), ("length", "i4"), ("upper", "?")]
+
+# Line heuristics for header candidates, applied to the whole text in one regex
+# pass. "All caps" means at least one uppercase and no lowercase ASCII letters.
+
+# Lines longer than three characters that are all caps or end with a colon
+CAPS_OR_COLON_LINE_RE = re.compile(
+    r'^[^\S\n]*((?=\S[^\n]{2}[^\n]*\S)(?:[^a-z\n]*[A-Z][^a-z\n]*|[^\n]*:))[^\S\n]*$',
+    re.MULTILINE
+)
+# Section headers: all caps, ending with a colon, or at most three words and
+# more than three characters
+HEADER_LINE_RE = re.compile(
+    r'^[^\S\n]*('
+    r'[^a-z\n]*[A-Z][^a-z\n]*'
+    r'|[^\n]*:'
+    r'|(?=\S[^\n]{2}[^\n]*\S)\S+(?:[^\S\n]+\S+){0,2}'
+    r')[^\S\n]*$',
+    re.MULTILINE
+)
+# Non-blank lines, captured without surrounding whitespace
+CONTENT_LINE_RE = re.compile(r'^[^\S\n]*(\S[^\n]*?)[^\S\n]*$', re.MULTILINE)
+
+def test_text_extraction(pdf_path, text=None):
+    """Test basic text extraction, reusing already extracted text if given."""
     print("\n=== Basic Text Extraction ===")
-    extractor = PDFExtractor()
     try:
-        text = extractor.extract(pdf_path)
+        from src.utils.pdf_extractor import PDFExtractor
+        
+        if text is None:
+            text = PDFExtractor().extract(pdf_path)
         print(f"Extracted {len(text)} characters")
         print("First 500 characters:")
         print("-" * 40)
@@ -35,10 +75,8 @@ def test_text_extraction(pdf_path):
         
         # Check for potential section headers
         print("\nPotential section headers (lines with uppercase or ending with :)")
-        for line in text.split('\n'):
-            line = line.strip()
-            if (line.isupper() and len(line) > 3) or (line.endswith(':') and len(line) > 3):
-                print(f"  - {line}")
+        for match in CAPS_OR_COLON_LINE_RE.finditer(text):
+            print(f"  - {match.group(1).strip()}")
     except Exception as e:
         print(f"Error in basic extraction: {e}")
         
@@ -47,6 +85,8 @@ def test_direct_replacer(pdf_path):
     print("\n=== Direct Replacer ===")
     
     try:
+        from src.utils.pdf_direct_replacer import PDFDirectReplacer
+        
         pdf_replacer = PDFDirectReplacer()
         structure = pdf_replacer.extract_document_structure(pdf_path)
         
@@ -56,7 +96,7 @@ def test_direct_replacer(pdf_path):
         # Get section details
         print(f"\nFound {len(structure.get('sections', []))} sections:")
         for i, section in enumerate(structure.get('sections', [])):
-            print(f"  {i+1}. {section.get('title', 'Untitled')}: {len(section.get('content', '').split())} words")
+            print(f"  {i+1}. {section.get('title', 'Untitled')}: {word_count(section.get('content', ''))} words")
         
         # Classified sections
         print("\nClassified sections:")
@@ -87,6 +127,8 @@ def test_content_replacer(pdf_path):
     print("\n=== Content Replacer ===")
     
     try:
+        from src.utils.pdf_content_replacer import PDFContentReplacer
+        
         pdf_replacer = PDFContentReplacer(use_enhanced=True, use_llm=False, use_ocr=False, use_direct=True)
         structure = pdf_replacer.analyze_structure(pdf_path)
         
@@ -97,50 +139,47 @@ def test_content_replacer(pdf_path):
         # Show sections
         print(f"\nDetected sections: {len(structure.get('sections', {}))}")
         for name, info in structure.get('sections', {}).items():
-            print(f"  - {name} ({info.get('type', 'unknown')}): {len(info.get('content', '').split())} words")
+            print(f"  - {name} ({info.get('type', 'unknown')}): {word_count(info.get('content', ''))} words")
             
     except Exception as e:
         print(f"Error in content replacer: {e}")
 
-def test_classifier(pdf_path):
-    """Test the section classifier directly."""
+def test_classifier(pdf_path, text=None):
+    """Test the section classifier directly, reusing already extracted text if given."""
     print("\n=== Section Classifier Test ===")
     
     try:
-        extractor = PDFExtractor()
-        text = extractor.extract(pdf_path)
+        from src.utils.pdf_extractor import PDFExtractor
+        
+        if text is None:
+            text = PDFExtractor().extract(pdf_path)
         
         # Split text into potential sections based on formatting
-        lines = text.split('\n')
         potential_sections = []
-        current_section = {"title": "Unknown", "content": ""}
+        title = "Unknown"
+        content_start = 0
         
-        # Simple heuristic: lines with few words, all caps, or ending with colon might be headers
-        for line in lines:
-            line = line.strip()
-            if not line:
-                continue
-                
-            if (len(line.split()) <= 3 and len(line) > 3) or line.isupper() or line.endswith(':'):
-                # This could be a header - save previous section and start new one
-                if current_section["content"].strip():
-                    potential_sections.append(current_section)
-                    
-                current_section = {"title": line, "content": ""}
-            else:
-                # This is content
-                current_section["content"] += line + "\n"
+        # Simple heuristic: lines with few words, all caps, or ending with colon might be headers.
+        # Each header closes the previous section; the content is the non-blank lines in between.
+        for match in HEADER_LINE_RE.finditer(text):
+            content_lines = CONTENT_LINE_RE.findall(text, content_start, match.start())
+            if content_lines:
+                potential_sections.append({"title": title, "content": "\n".join(content_lines) + "\n"})
+            title = match.group(1).strip()
+            content_start = match.end()
                 
         # Don't forget to add the last section
-        if current_section["content"].strip():
-            potential_sections.append(current_section)
+        content_lines = CONTENT_LINE_RE.findall(text, content_start)
+        if content_lines:
+            potential_sections.append({"title": title, "content": "\n".join(content_lines) + "\n"})
             
         print(f"Found {len(potential_sections)} potential sections using simple heuristics")
         
         # Classify the potential sections
-        classifier = SectionClassifier()
-        for i, section in enumerate(potential_sections):
-            section_type, confidence = classifier.classify_section(section["title"], section["content"])
+        classifications = get_classifier().classify_batch(
+            [(section["title"], section["content"]) for section in potential_sections]
+        )
+        for i, (section, (section_type, confidence)) in enumerate(zip(potential_sections, classifications)):
             print(f"  {i+1}. '{section['title']}' => {section_type} ({confidence:.2f})")
             print(f"     First 50 chars: {section['content'][:50].replace(chr(10), ' ')}...")
             
@@ -153,18 +192,14 @@ def test_enhanced_fallback(pdf_path):
     
     try:
         import fitz  # PyMuPDF
+        import numpy as np
         
         # Extract text blocks using TextPage which preserves more formatting
         doc = fitz.open(pdf_path)
         print(f"Document has {len(doc)} pages")
         
-        # Initialize a text classifier to help with section detection
-        classifier = SectionClassifier()
-        
         # Save the full text for debugging
-        full_text = ""
-        for page in doc:
-            full_text += page.get_text("text") + "\n"
+        full_text = "".join(page.get_text("text") + "\n" for page in doc)
             
         print("\nFull text from document (first 500 chars):")
         print(f"{'=' * 40}\n{full_text[:500]}\n{'=' * 40}\n")
@@ -177,19 +212,21 @@ def test_enhanced_fallback(pdf_path):
             print(f"  Found {len(blocks)} text blocks")
             
             # Analyze blocks to detect section headers
+            candidates = []
             for i, block in enumerate(blocks[:10]):  # Show first 10 blocks
                 text = block[4].strip()
-                if not text:
-                    continue
-                    
-                first_line = text.split('\n', 1)[0].strip()
-                
+                if text:
+                    candidates.append((i, text.split('\n', 1)[0].strip(), text))
+            
+            # Use classifier for section type prediction
+            classifications = get_classifier().classify_batch(
+                [(first_line, text) for _, first_line, text in candidates]
+            )
+            
+            for (i, first_line, text), (section_type, confidence) in zip(candidates, classifications):
                 # Show more content for debugging
                 content_preview = text[:100].replace('\n', ' ')
                 
-                # Use classifier for section type prediction
-                section_type, confidence = classifier.classify_section(first_line, text)
-                
                 # Print more detailed information
                 print(f"  Block {i+1}: {first_line[:30]}... => {section_type} ({confidence:.2f})")
                 print(f"      Content: {content_preview}...")
@@ -198,58 +235,59 @@ def test_enhanced_fallback(pdf_path):
         # Try direct text extraction with position and formatting data
         print("\nDetailed text extraction with formatting:")
         first_page = doc[0]
-        text_dict = first_page.get_text("dict")
+        # Flat (x0, y0, x1, y1, word, block_no, line_no, word_no) tuples and a flat
+        # list of spans, instead of the nested blocks -> lines -> spans dict
+        words = first_page.get_text("words")
+        spans = first_page.get_texttrace()
         
         # Count lines and spans
-        total_blocks = len(text_dict.get("blocks", []))
-        total_lines = sum(len(block.get("lines", [])) for block in text_dict.get("blocks", []))
-        total_spans = sum(sum(len(line.get("spans", [])) for line in block.get("lines", []))
-                         for block in text_dict.get("blocks", []))
+        total_blocks = len({word[5] for word in words})
+        total_lines = len({(word[5], word[6]) for word in words})
+        total_spans = len(spans)
         
         print(f"  Text structure: {total_blocks} blocks, {total_lines} lines, {total_spans} spans")
         
-        # Look for formatting clues
-        formatted_pieces = []
-        for block in text_dict.get("blocks", []):
-            for line in block.get("lines", []):
-                for span in line.get("spans", []):
-                    text = span.get("text", "").strip()
-                    if not text:
-                        continue
-                        
-                    size = span.get("size", 0)
-                    flags = span.get("flags", 0)
-                    is_bold = bool(flags & 1)
-                    
-                    formatted_pieces.append({
-                        "text": text,
-                        "size": size,
-                        "bold": is_bold,
-                        "flags": flags
-                    })
+        # Look for formatting clues, one record per non-empty span
+        texts = []
+        pieces = np.empty(len(spans), dtype=SPAN_DTYPE)
+        for span in spans:
+            text = "".join(chr(char[0]) for char in span["chars"]).strip()
+            if not text:
+                continue
+                
+            pieces[len(texts)] = (span.get("size", 0), span.get("flags", 0), len(text), text.upper() == text)
+            texts.append(text)
+        pieces = pieces[:len(texts)]
         
-        # Find potential headers by looking at formatting
-        potential_headers = []
-        for piece in formatted_pieces:
-            text = piece["text"]
-            size = piece["size"]
-            is_bold = piece["bold"]
-            
-            # Headers are often bigger, bolder, or ALL CAPS
-            if ((size > 11 and len(text) < 50) or 
-                (is_bold and len(text) < 50) or 
-                (text.upper() == text and len(text) > 3 and len(text) < 50)):
-                potential_headers.append(piece)
+        # Find potential headers by looking at formatting:
+        # headers are often bigger, bolder, or ALL CAPS
+        is_bold = (pieces["flags"] & 1).astype(bool)
+        header_mask = (pieces["length"] < 50) & (
+            (pieces["size"] > 11) | is_bold | (pieces["upper"] & (pieces["length"] > 3))
+        )
+        header_indices = np.flatnonzero(header_mask)
         
-        print(f"\nFound {len(potential_headers)} potential headers based on formatting")
-        for i, header in enumerate(potential_headers[:10]):  # Show first 10
-            print(f"  {i+1}. '{header['text']}' (size: {header['size']}, bold: {header['bold']})")
+        print(f"\nFound {len(header_indices)} potential headers based on formatting")
+        for i, index in enumerate(header_indices[:10]):  # Show first 10
+            print(f"  {i+1}. '{texts[index]}' (size: {pieces['size'][index]}, bold: {is_bold[index]})")
             
     except ImportError:
-        print("PyMuPDF (fitz) not available for enhanced analysis")
+        print("PyMuPDF (fitz) or NumPy not available for enhanced analysis")
     except Exception as e:
         print(f"Error in enhanced fallback: {e}")
 
+def run_captured(test, *args):
+    """
+    Run a test function and return everything it printed.
+    
+    The tests run in separate worker processes (PyMuPDF is not thread-safe),
+    so their output is buffered and returned rather than interleaved.
+    """
+    buffer = io.StringIO()
+    with contextlib.redirect_stdout(buffer):
+        test(*args)
+    return buffer.getvalue()
+
 def main():
     parser = argparse.ArgumentParser(description='Test PDF extraction and section detection')
     parser.add_argument('pdf_path', help='Path to the PDF file to test')
@@ -262,12 +300,32 @@ def main():
         
     print(f"Testing PDF extraction on: {args.pdf_path}")
     
-    # Run the tests
-    test_text_extraction(args.pdf_path)
-    test_direct_replacer(args.pdf_path)
-    test_content_replacer(args.pdf_path)
-    test_classifier(args.pdf_path)
-    test_enhanced_fallback(args.pdf_path)
+    # Run the tests in parallel and print each report in order once it is done
+    tests = [
+        test_text_extraction,
+        test_direct_replacer,
+        test_content_replacer,
+        test_classifier,
+        test_enhanced_fallback,
+    ]
+    with ProcessPoolExecutor(max_workers=len(tests)) as executor:
+        futures = {
+            test: executor.submit(run_captured, test, args.pdf_path)
+            for test in (test_direct_replacer, test_content_replacer, test_enhanced_fallback)
+        }
+        
+        # Extract the text once, while the other tests run, and share it
+        try:
+            from src.utils.pdf_extractor import PDFExtractor
+            
+            text = PDFExtractor().extract(args.pdf_path)
+        except Exception:
+            text = None  # The tests retry and report the extraction error themselves
+        for test in (test_text_extraction, test_classifier):
+            futures[test] = executor.submit(run_captured, test, args.pdf_path, text)
+        
+        for test in tests:
+            print(futures[test].result(), end="")
     
     return 0
 
@@ -15,7 +15,7 @@ import argparse
 import logging
 from datetime import datetime
 
-from targeted_ocr_improvement import TargetedOCRImprover
+from src.utils.text_utils import word_count
 
 # Set up logging
 logging.basicConfig(
@@ -24,13 +24,21 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-def process_resume_for_job_application(resume_pdf_path, output_dir="."):
+# Number of characters of the processed text shown as a sample
+PREVIEW_LENGTH = 500
+
+def process_resume_for_job_application(resume_pdf_path, output_dir=".", n_workers=None, use_gpu=False,
+                                       tessdata_dir=None):
     """
     Process a resume using our optimized OCR pipeline for job applications.
     
     Args:
         resume_pdf_path: Path to the resume PDF file
         output_dir: Directory to save the processed text
+        n_workers: Number of pages to OCR in parallel (default: number of CPUs)
+        use_gpu: Run OCR on the GPU with PaddleOCR instead of Tesseract
+        tessdata_dir: Directory with Tesseract's int8 "fast" models
+            (default: $TESSDATA_FAST_DIR; the float models are used without one)
         
     Returns:
         str: Path to the output text file
@@ -63,16 +71,24 @@ def process_resume_for_job_application(resume_pdf_path, output_dir="."):
         "Developrnent": "Development"
     }
     
+    # Imported here so --help and a missing PDF don't load the OCR stack
+    from targeted_ocr_improvement import TargetedOCRImprover
+    
+    # The integer-quantized "fast" models are only used when they are installed
+    tessdata_dir = tessdata_dir or os.environ.get("TESSDATA_FAST_DIR")
+    
     # Use the targeted OCR improver with our optimized settings
     improver = TargetedOCRImprover(
-        dpi=1500,  # High quality for best results
-        known_problematic_words=problem_words
+        dpi=400,  # Tesseract accuracy peaks around 300-400 DPI
+        fallback_dpi=800,  # Re-render pages that come out with low confidence
+        known_problematic_words=problem_words,
+        n_workers=n_workers or os.cpu_count(),
+        use_gpu=use_gpu,
+        model_precision="int8" if tessdata_dir else "float",
+        tessdata_dir=tessdata_dir,
+        pin_workers=True  # One physical core per OCR worker
     )
     
-    # Process the resume
-    print("\nExtracting text with optimized OCR (this may take a few minutes)...\n")
-    resume_text = improver.process_pdf(resume_pdf_path)
-    
     # Generate output filename
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     base_name = os.path.splitext(os.path.basename(resume_pdf_path))[0]
@@ -82,20 +98,32 @@ def process_resume_for_job_application(resume_pdf_path, output_dir="."):
     
     output_file = os.path.join(output_dir, f"{base_name}_job_app_{timestamp}.txt")
     
-    # Save the processed text
+    # Process the resume, writing each page to disk as soon as it is ready and
+    # keeping only the word count and a short preview in memory
+    print("\nExtracting text with optimized OCR (this may take a few minutes)...\n")
+    total_words = 0
+    text_length = 0
+    preview = ""
     with open(output_file, "w", encoding="utf-8") as f:
-        f.write(resume_text)
+        for page_number, page_text in enumerate(improver.process_pdf_iter(resume_pdf_path)):
+            total_words += word_count(page_text)
+            if page_number:
+                page_text = "\n\n" + page_text
+            f.write(page_text)
+            text_length += len(page_text)
+            if len(preview) < PREVIEW_LENGTH:
+                preview += page_text[:PREVIEW_LENGTH - len(preview)]
     
     # Calculate processing time
     elapsed_time = time.time() - start_time
     print(f"\nProcessing completed in {elapsed_time:.1f} seconds")
     print(f"Output saved to: {output_file}")
-    print(f"Word count: {len(resume_text.split())}")
+    print(f"Word count: {total_words}")
     
     # Show a sample of the processed text
-    print("\n--- Resume Text Sample (first 500 characters) ---")
+    print(f"\n--- Resume Text Sample (first {PREVIEW_LENGTH} characters) ---")
     print("="*70)
-    print(resume_text[:500] + "..." if len(resume_text) > 500 else resume_text)
+    print(preview + "..." if text_length > PREVIEW_LENGTH else preview)
     print("="*70)
     
     print("\n✅ Your resume is ready for job applications!")
@@ -108,6 +136,13 @@ def main():
     parser = argparse.ArgumentParser(description="Process your resume for job applications")
     parser.add_argument("resume_pdf", help="Path to your resume PDF file")
     parser.add_argument("--output", "-o", default=".", help="Output directory")
+    parser.add_argument("--workers", "-w", type=int, default=os.cpu_count(),
+                        help="Number of pages to OCR in parallel (default: number of CPUs)")
+    parser.add_argument("--gpu", action="store_true",
+                        help="Run OCR on the GPU with PaddleOCR (requires paddleocr)")
+    parser.add_argument("--tessdata-dir", default=os.environ.get("TESSDATA_FAST_DIR"),
+                        help="Directory with Tesseract's int8 tessdata_fast models "
+                             "(default: $TESSDATA_FAST_DIR; float models are used without one)")
     
     args = parser.parse_args()
     
@@ -117,7 +152,8 @@ def main():
         return 1
     
     try:
-        process_resume_for_job_application(args.resume_pdf, args.output)
+        process_resume_for_job_application(args.resume_pdf, args.output, args.workers, args.gpu,
+                                           args.tessdata_dir)
         return 0
     except Exception as e:
         logger.error(f"Error processing resume: {e}")
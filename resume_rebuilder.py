@@ -8,13 +8,16 @@ This script supports both GUI mode and command line interface for rebuilding res
 
 import os
 import sys
-import argparse
+import asyncio
 
 # Add the src directory to the Python path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
 def parse_args():
     """Parse command line arguments."""
+    # Imported here so the plain GUI launch doesn't pay for it
+    import argparse
+    
     parser = argparse.ArgumentParser(
         description="Resume Rebuilder - Extract, modify, and rebuild PDF resumes"
     )
@@ -50,6 +53,12 @@ def parse_args():
 
 def main():
     """Main entry point for the application."""
+    # Fast path: launching the GUI needs no argument parsing
+    if sys.argv[1:] in ([], ['--gui']):
+        from src.gui import main as gui_main
+        gui_main()
+        return
+    
     args = parse_args()
     
     # If GUI mode or no arguments specified, launch GUI
@@ -88,11 +97,11 @@ def main():
             output_path = args.output or 'new_resume.pdf'
             
             # Improve the resume
-            result_path = replacer.improve_resume(
+            result_path = asyncio.run(replacer.improve_resume_async(
                 args.pdf,
                 job_description,
                 output_path
-            )
+            ))
             
             print(f"Resume successfully processed and saved to: {result_path}")
             
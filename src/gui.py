@@ -4,31 +4,180 @@ GUI interface for the Resume Rebuilder application
 """
 
 import os
+import re
 import sys
+import logging
+import functools
+import importlib
+import importlib.util
+import queue
+import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor
 import tkinter as tk
 from tkinter import filedialog, ttk, scrolledtext, messagebox, simpledialog
 
-# Try to import real classes, fall back to mocks if not available
+# The API client is needed from the start; the heavier components (PDF
+# parsing, LLM and server management) are imported when first used
 try:
-    from utils.pdf_extractor import PDFExtractor
-    from utils.resume_generator import ResumeGenerator
-    from utils.job_analyzer import JobAnalyzer
-    from utils.api_client import APIClient
-    from utils.manageai_api_manager import ManageAIAPIManager
-    from utils.resume_api_integration import ResumeAPIIntegration, ConnectionType
-    from utils.pdf_content_replacer import PDFContentReplacer
+    from utils.api_client import APIClient, make_session
 except ImportError:
-    # Import mock classes when real ones are not available
-    from utils.mock_classes import (
-        MockPDFExtractor as PDFExtractor,
-        MockResumeGenerator as ResumeGenerator,
-        MockJobAnalyzer as JobAnalyzer,
-        MockAPIClient as APIClient,
-        MockManageAIAPIManager as ManageAIAPIManager,
-        MockResumeAPIIntegration as ResumeAPIIntegration,
-        MockConnectionType as ConnectionType,
-        MockPDFContentReplacer as PDFContentReplacer
-    )
+    from utils.mock_classes import MockAPIClient as APIClient
+    make_session = None
+from utils import analysis_cache
+try:
+    from src.utils.settings import app_settings
+except ImportError:
+    app_settings = None
+
+# Component name -> (module, class, mock class used when the module can't be imported)
+COMPONENTS = {
+    'PDFExtractor': ('utils.pdf_extractor', 'PDFExtractor', 'MockPDFExtractor'),
+    'ResumeGenerator': ('utils.resume_generator', 'ResumeGenerator', 'MockResumeGenerator'),
+    'JobAnalyzer': ('utils.job_analyzer', 'JobAnalyzer', 'MockJobAnalyzer'),
+    'ManageAIAPIManager': ('utils.manageai_api_manager', 'ManageAIAPIManager', 'MockManageAIAPIManager'),
+    'ResumeAPIIntegration': ('utils.resume_api_integration', 'ResumeAPIIntegration', 'MockResumeAPIIntegration'),
+    'ConnectionType': ('utils.resume_api_integration', 'ConnectionType', 'MockConnectionType'),
+    'PDFContentReplacer': ('utils.pdf_content_replacer', 'PDFContentReplacer', 'MockPDFContentReplacer'),
+}
+
+@functools.lru_cache(maxsize=None)
+def load_component(name):
+    """
+    Import an application component, falling back to its mock if it is not available.
+    
+    The result is memoized, so a missing module is only searched for once.
+    
+    Args:
+        name: Component name, a key of COMPONENTS
+        
+    Returns:
+        The component class
+    """
+    module_name, class_name, mock_name = COMPONENTS[name]
+    try:
+        return getattr(importlib.import_module(module_name), class_name)
+    except ImportError:
+        return getattr(importlib.import_module('utils.mock_classes'), mock_name)
+
+class FastScrolledText(scrolledtext.ScrolledText):
+    """ScrolledText without an undo stack that can swap its whole contents in one step."""
+    
+    def __init__(self, master=None, **kw):
+        kw.setdefault('undo', False)
+        super().__init__(master, **kw)
+    
+    def bulk_replace(self, new_text):
+        """
+        Replace the entire contents of the widget.
+        
+        Args:
+            new_text: Text to show, replacing whatever is there
+        """
+        state = self.cget('state')
+        autoseparators = self.cget('autoseparators')
+        self.config(state=tk.NORMAL, autoseparators=False)
+        try:
+            self.mark_set(tk.INSERT, '1.0')
+            self.delete('1.0', tk.END)
+            self.insert('1.0', new_text)
+            self.edit_reset()
+        finally:
+            self.config(state=state, autoseparators=autoseparators)
+
+@functools.lru_cache(maxsize=None)
+def module_available(name):
+    """
+    Check whether a module can be imported, without importing it.
+    
+    Args:
+        name: Module name, dotted for submodules
+        
+    Returns:
+        bool: True if the module is installed
+    """
+    return importlib.util.find_spec(name) is not None
+
+# A section in the sections editor: a title line underlined with dashes, then
+# its content up to the next underlined title
+_SECTION_RE = re.compile(
+    r'^([^\n]+)\n-+[ \t]*\n(.*?)(?=\n\n[^\n]+\n-+[ \t]*\n|\s*\Z)',
+    re.MULTILINE | re.DOTALL
+)
+
+_WORD_RE = re.compile(r'\S+')
+
+@functools.lru_cache(maxsize=128)
+def _dashes(n):
+    """Underline of n dashes for a section title."""
+    return '-' * n
+
+# Third-party loggers that log per token or per object while parsing a PDF;
+# with debug logging switched on they slow extraction down by an order of magnitude
+QUIET_LOGGERS = (
+    "pdfminer", "pdfminer.pdfparser", "pdfminer.pdfinterp", "pdfminer.cmapdb",
+    "pdfplumber", "pdf2image", "PIL", "fitz",
+)
+
+# Prompts for iterating on the resume with a local LLM
+ITERATION_SYSTEM_PROMPT = (
+    "You are a professional resume writer. Your task is to improve the user's resume "
+    "based on their feedback. Focus on making the improvements requested while maintaining "
+    "a professional tone and format."
+)
+ITERATION_USER_PROMPT = (
+    "Please improve this resume with a focus on {focus}.\n\n"
+    "Resume content:\n{resume}\n\n"
+    "Feedback: {feedback}\n\n"
+    "Please return the complete improved resume."
+)
+
+@functools.lru_cache(maxsize=8)
+def _iteration_prompt(focus):
+    """ITERATION_USER_PROMPT with the focus area filled in, leaving {resume} and {feedback}."""
+    focus = focus.replace('{', '{{').replace('}', '}}')
+    return ITERATION_USER_PROMPT.replace('{focus}', focus)
+
+# LLM Studio adapters kept by the app, one per (host, port, model)
+LLM_ADAPTER_CACHE_SIZE = 4
+
+# Focus areas offered in the Continue Iteration dialog, and the placeholder
+# shown in its feedback box until the user clicks into it
+FOCUS_AREAS = ("skills", "experience", "education", "summary", "formatting", "keywords")
+EXAMPLE_FEEDBACK = "Example: Make the summary more concise and highlight my leadership skills more prominently."
+
+# File type filters for the file dialogs
+PDF_FILETYPES = (("PDF files", "*.pdf"), ("All files", "*.*"))
+TEXT_FILETYPES = (("Text files", "*.txt"), ("All files", "*.*"))
+JSON_FILETYPES = (("JSON files", "*.json"), ("All files", "*.*"))
+
+# Job description files are read up to this size; real ones are a few KB
+MAX_JOB_DESCRIPTION_BYTES = 512 * 1024
+
+# Worker threads for PDF extraction, analysis and API calls
+MAX_WORKERS = 2
+
+# How often the Tk thread picks up results posted by the workers, in milliseconds
+QUEUE_POLL_MS = 50
+
+# Seconds to wait for the ManageAI server to stop when the window closes
+SERVER_STOP_TIMEOUT = 2
+
+# Quiet period after an edit before the preview is rebuilt, in milliseconds
+PREVIEW_DELAY_MS = 150
+
+# Number of streamed LLM chunks (roughly tokens) shown per widget update
+STREAM_CHUNKS_PER_UPDATE = 24
+
+# Local LLM Studio models offered in the Upload tab. The 4-bit Q4_K_M build
+# generates tokens roughly 2-3x faster than fp16 with little loss in quality;
+# Q8_0 on a 14B model can be slower than Q4_K_M, so it is not the default.
+LOCAL_LLM_MODELS = (
+    "qwen2.5-14b-instruct-q4_k_m.gguf",
+    "qwen2.5-14b-instruct-q5_k_m.gguf",
+    "qwen2.5-14b-instruct-q8_0.gguf",
+    "qwen-14b",
+)
 
 class ResumeRebuilderApp:
     """Main application class for the Resume Rebuilder GUI."""
@@ -41,42 +190,73 @@ class ResumeRebuilderApp:
         self.resume_content = None
         self.job_description = ""
         self.input_pdf_path = ""
+        self.input_pdf_bytes = None
         self.output_pdf_path = ""
         
+        # (mtime, size, file name) of the PDFs used on the Replace tab, see _stat_pdf
+        self._pdf_stat_cache = {}
+        
+        # (mtime, size, SHA-256) of the PDFs hashed for the analysis cache, see _pdf_digest
+        self._pdf_digests = {}
+        
+        # Folder the file dialogs open in, see _browse
+        self._last_browse_dir = None
+        
+        # Pending debounced preview refresh and what was last rendered
+        self._preview_after_id = None
+        self._last_preview = None
+        self._sections_dirty = False
+        
+        # Set while an extraction streams LLM output into the sections editor;
+        # that text is a preview, not edits to parse back into resume_content
+        self._extracting = False
+        
+        # The contact fields are copied into resume_content only after they
+        # change, or when resume_content has been replaced since the last copy
+        self._contact_dirty = False
+        self._contact_applied_to = None
+        
+        # Cache key of the job analysis whose results are on screen
+        self._last_analysis_key = None
+        
         # Create status var early so it's available before UI setup
         self.status_var = tk.StringVar()
         self.status_var.set("Initializing...")
         
-        # Initialize ManageAI API Manager
-        self.manageai_api_manager = ManageAIAPIManager(
-            host="localhost",
-            port=8080
-        )
+        # Created on first use, see the properties below
+        self._manageai_api_manager = None
+        self._api_integration = None
+        self._pdf_replacer = None
+        self._job_analyzer = None
+        self._manageai_lock = threading.Lock()
         
-        # Initialize unified API integration
-        self.api_integration = ResumeAPIIntegration(
-            connection_type=ConnectionType.LOCAL_SERVER,
-            local_url="http://localhost:8080",
-            manageai_url="http://localhost:8080",
-            api_key=os.environ.get("RESUME_API_KEY", "test-api-key-1234")
-        )
+        # LLM helpers, imported by _ensure_llm the first time an iteration runs
+        self._llm_refiner_cls = None
+        self._llm_adapter_cls = None
         
-        # Keep API client for backward compatibility
-        self.api_client = APIClient()
+        # LLM Studio adapters reused across tests, extractions and iterations, see _get_llm
+        self._llm_adapters = {}
+        self._has_llm_refiner = module_available('utils.llm_refiner')
         
-        # Check for PyMuPDF availability
-        has_pymupdf = self._check_pymupdf_availability()
+        # Set when the window is closing so background work stops posting to Tk
+        self._closing = threading.Event()
         
-        # Initialize PDF content replacer
-        self.pdf_replacer = PDFContentReplacer(
-            use_enhanced=True,
-            use_llm=True,
-            use_ocr=False,
-            use_direct=has_pymupdf
-        )
+        # Slow work runs on the executor; its results come back to the Tk
+        # thread through the work queue, see _run_async and _poll_queue
+        self._executor = ThreadPoolExecutor(max_workers=MAX_WORKERS, thread_name_prefix="resume-worker")
+        self._work_queue = queue.Queue()
+        
+        # One pooled keep-alive session shared by every HTTP client the app creates
+        self.http_session = make_session() if make_session is not None else None
         
-        # Store PyMuPDF availability for UI setup
-        self.has_pymupdf = has_pymupdf
+        # Keep API client for backward compatibility
+        self.api_client = APIClient(session=self.http_session)
+        self._load_api_settings()
+        
+        # API key shared by the Upload and API tabs
+        self.api_key_var = tk.StringVar(
+            value=os.environ.get("OPENAI_API_KEY", "") or getattr(self.api_client, 'api_key', "")
+        )
         
         # Setup the UI
         self.setup_ui()
@@ -84,9 +264,61 @@ class ResumeRebuilderApp:
         # Register window close handler
         self.root.protocol("WM_DELETE_WINDOW", self._on_window_close)
         
-        # Try to start the ManageAI API server (after UI is set up)
+        self.root.after(QUEUE_POLL_MS, self._poll_queue)
+        
+        # Start the ManageAI API server in the background; its startup waits
+        # for the server to answer, which would otherwise freeze the window
         self._start_manageai_server()
     
+    @property
+    def manageai_api_manager(self):
+        """ManageAI API manager, created on first use."""
+        # Also created from the server startup thread
+        with self._manageai_lock:
+            if self._manageai_api_manager is None:
+                ManageAIAPIManager = load_component('ManageAIAPIManager')
+                self._manageai_api_manager = ManageAIAPIManager(
+                    host="localhost",
+                    port=8080,
+                    session=self.http_session
+                )
+        return self._manageai_api_manager
+    
+    @property
+    def api_integration(self):
+        """Unified API integration, created on first use."""
+        if self._api_integration is None:
+            ResumeAPIIntegration = load_component('ResumeAPIIntegration')
+            ConnectionType = load_component('ConnectionType')
+            self._api_integration = ResumeAPIIntegration(
+                connection_type=ConnectionType.LOCAL_SERVER,
+                local_url="http://localhost:8080",
+                manageai_url="http://localhost:8080",
+                api_key=os.environ.get("RESUME_API_KEY", "test-api-key-1234"),
+                session=self.http_session
+            )
+        return self._api_integration
+    
+    @property
+    def pdf_replacer(self):
+        """PDF content replacer, created on first use."""
+        if self._pdf_replacer is None:
+            PDFContentReplacer = load_component('PDFContentReplacer')
+            self._pdf_replacer = PDFContentReplacer(
+                use_enhanced=True,
+                use_llm=True,
+                use_ocr=False,
+                use_direct=self.has_pymupdf
+            )
+        return self._pdf_replacer
+    
+    @property
+    def job_analyzer(self):
+        """Job analyzer, created on first use and reused so its compiled patterns are kept."""
+        if self._job_analyzer is None:
+            self._job_analyzer = load_component('JobAnalyzer')()
+        return self._job_analyzer
+    
     def setup_ui(self):
         """Set up the user interface."""
         # Create notebook (tabbed interface)
@@ -110,32 +342,49 @@ class ResumeRebuilderApp:
         self.notebook.add(self.tab_chat_workspace, text="Chat Workspace")  # New unified interface
         self.notebook.add(self.tab_api, text="API Settings")
         
-        # Setup Upload tab
-        self.setup_upload_tab()
-        
-        # Setup Edit tab
-        self.setup_edit_tab()
-        
-        # Setup Analyze tab
-        self.setup_analyze_tab()
-        
-        # Setup Generate tab
-        self.setup_generate_tab()
-        
-        # Setup Replace Content tab
-        self.setup_replace_tab()
-        
-        # Setup Chat Workspace tab
-        self.setup_chat_workspace_tab()
-        
-        # Setup API Settings tab
-        self.setup_api_tab()
+        # Only the visible Upload tab is built now; the other tabs are built
+        # when first selected, or in the background once the window is shown
+        self._tab_setups = [
+            self.setup_upload_tab,
+            self.setup_edit_tab,
+            self.setup_analyze_tab,
+            self.setup_generate_tab,
+            self.setup_replace_tab,
+            self.setup_chat_workspace_tab,
+            self.setup_api_tab,
+        ]
+        self._tabs_built = set()
+        self._build_tab(0)
+        self.notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
+        self.root.after_idle(self._build_next_tab)
         
         # Status bar (status_var is already created in __init__)
         self.status_var.set("Ready")
         self.status_bar = ttk.Label(self.root, textvariable=self.status_var, relief=tk.SUNKEN, anchor=tk.W)
         self.status_bar.pack(side=tk.BOTTOM, fill=tk.X)
     
+    def _build_tab(self, index):
+        """Build the widgets of a notebook tab if they haven't been built yet."""
+        if index not in self._tabs_built:
+            self._tabs_built.add(index)
+            self._tab_setups[index]()
+    
+    def _build_all_tabs(self):
+        """Build the widgets of every notebook tab."""
+        for index in range(len(self._tab_setups)):
+            self._build_tab(index)
+    
+    def _on_tab_changed(self, event):
+        """Build a tab's widgets the first time it is selected."""
+        self._build_tab(self.notebook.index(self.notebook.select()))
+    
+    def _build_next_tab(self):
+        """Build one remaining tab per idle period so the window stays responsive."""
+        remaining = [index for index in range(len(self._tab_setups)) if index not in self._tabs_built]
+        if remaining:
+            self._build_tab(remaining[0])
+            self.root.after_idle(self._build_next_tab)
+    
     def setup_upload_tab(self):
         """Setup the Upload Resume tab."""
         frame = ttk.Frame(self.tab_upload, padding="10")
@@ -151,6 +400,15 @@ class ResumeRebuilderApp:
         ttk.Entry(upload_frame, textvariable=self.file_path_var, width=50).pack(side=tk.LEFT, padx=5)
         ttk.Button(upload_frame, text="Browse...", command=self.browse_resume).pack(side=tk.LEFT)
         
+        # Fast extraction option (text-based PDFs only, no OCR)
+        self.use_fast_pdf_var = tk.BooleanVar(value=self.has_pdfium)
+        ttk.Checkbutton(
+            frame,
+            text="Use fast PDF text extraction (pypdfium2, no OCR for scanned resumes)",
+            variable=self.use_fast_pdf_var,
+            state=tk.NORMAL if self.has_pdfium else tk.DISABLED
+        ).pack(anchor=tk.W, padx=5)
+        
         # LLM refinement options
         llm_frame = ttk.LabelFrame(frame, text="LLM Refinement Options")
         llm_frame.pack(fill=tk.X, pady=10)
@@ -162,6 +420,22 @@ class ResumeRebuilderApp:
             text="Use LLM to improve extraction quality", 
             variable=self.use_llm_var
         ).pack(anchor=tk.W, padx=5, pady=5)
+        
+        # Send all sections to the LLM in a single request
+        self.llm_batch_var = tk.BooleanVar(value=True)
+        ttk.Checkbutton(
+            llm_frame,
+            text="Refine all sections in one LLM request",
+            variable=self.llm_batch_var
+        ).pack(anchor=tk.W, padx=5)
+        
+        # Extracting the same PDF again normally reuses the cached result
+        self.use_extract_cache_var = tk.BooleanVar(value=True)
+        ttk.Checkbutton(
+            llm_frame,
+            text="Reuse earlier results for the same PDF",
+            variable=self.use_extract_cache_var
+        ).pack(anchor=tk.W, padx=5)
 
         # LLM source selection
         llm_source_frame = ttk.Frame(llm_frame)
@@ -194,18 +468,36 @@ class ResumeRebuilderApp:
         self.llm_port_var = tk.StringVar(value="1234")
         ttk.Entry(local_llm_frame, textvariable=self.llm_port_var, width=6).grid(row=0, column=3, padx=5)
         
-        ttk.Button(
+        self.test_llm_button = ttk.Button(
             local_llm_frame, 
             text="Test Connection", 
             command=self.test_local_llm_connection
-        ).grid(row=0, column=4, padx=10)
+        )
+        self.test_llm_button.grid(row=0, column=4, padx=10)
+        
+        # The port is parsed as it is typed; Test Connection is only enabled for a valid one
+        self._llm_port = int(self.llm_port_var.get())
+        self.llm_port_var.trace_add("write", lambda *args: self._on_llm_port_changed())
+        
+        ttk.Label(local_llm_frame, text="Model:").grid(row=1, column=0, sticky=tk.W, pady=(5, 0))
+        self.llm_model_var = tk.StringVar(value=LOCAL_LLM_MODELS[0])
+        ttk.Combobox(
+            local_llm_frame,
+            textvariable=self.llm_model_var,
+            values=LOCAL_LLM_MODELS,
+            width=36
+        ).grid(row=1, column=1, columnspan=4, sticky=tk.W, padx=5, pady=(5, 0))
+        ttk.Label(
+            local_llm_frame,
+            text="Q4_K_M is 2-3x faster than fp16; Q8_0 can be slower than Q4_K_M on 14B models.",
+            foreground="gray"
+        ).grid(row=2, column=0, columnspan=5, sticky=tk.W)
         
         # API Key input
         api_frame = ttk.Frame(llm_frame)
         api_frame.pack(fill=tk.X, padx=5, pady=5)
         
         ttk.Label(api_frame, text="OpenAI API Key:").pack(side=tk.LEFT)
-        self.api_key_var = tk.StringVar(value=os.environ.get("OPENAI_API_KEY", ""))
         api_entry = ttk.Entry(api_frame, textvariable=self.api_key_var, width=50, show="*")
         api_entry.pack(side=tk.LEFT, padx=5)
         
@@ -226,12 +518,13 @@ class ResumeRebuilderApp:
         ).pack(side=tk.LEFT)
         
         # Extract button
-        ttk.Button(
+        self.extract_button = ttk.Button(
             frame, 
             text="Extract Resume Content", 
             command=self.extract_resume,
             style="Accent.TButton"
-        ).pack(pady=20)
+        )
+        self.extract_button.pack(pady=20)
         
         # Info text
         info_text = (
@@ -293,8 +586,13 @@ class ResumeRebuilderApp:
         sections_frame = ttk.LabelFrame(edit_frame, text="Resume Sections")
         sections_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
         
-        self.sections_text = scrolledtext.ScrolledText(sections_frame, wrap=tk.WORD, width=80, height=15)
+        self.sections_text = FastScrolledText(sections_frame, wrap=tk.WORD, width=80, height=15)
         self.sections_text.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        self.sections_text.bind("<<Modified>>", self._on_sections_modified)
+        
+        # Keep the preview in step with the contact fields too
+        for var in (self.name_var, self.email_var, self.phone_var, self.linkedin_var):
+            var.trace_add("write", lambda *args: self._on_contact_modified())
         
         # Save button
         ttk.Button(
@@ -311,7 +609,7 @@ class ResumeRebuilderApp:
         ttk.Label(frame, text="Enter Job Description:", font=("", 12)).pack(pady=10)
         
         # Job description input
-        self.job_text = scrolledtext.ScrolledText(frame, wrap=tk.WORD, width=80, height=10)
+        self.job_text = FastScrolledText(frame, wrap=tk.WORD, width=80, height=10)
         self.job_text.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
         
         # Or upload job description file
@@ -324,12 +622,13 @@ class ResumeRebuilderApp:
         ttk.Button(file_frame, text="Browse...", command=self.browse_job_description).pack(side=tk.LEFT)
         
         # Analyze button
-        ttk.Button(
+        self.analyze_job_button = ttk.Button(
             frame, 
             text="Analyze Resume Against Job", 
             command=self.analyze_job,
             style="Accent.TButton"
-        ).pack(pady=10)
+        )
+        self.analyze_job_button.pack(pady=10)
         
         # Results
         ttk.Label(frame, text="Analysis Results:", font=("", 12)).pack(pady=5)
@@ -344,7 +643,7 @@ class ResumeRebuilderApp:
         
         # Suggestions
         ttk.Label(results_frame, text="Suggestions:").pack(anchor=tk.W)
-        self.suggestions_text = scrolledtext.ScrolledText(results_frame, wrap=tk.WORD, width=80, height=8, state=tk.DISABLED)
+        self.suggestions_text = FastScrolledText(results_frame, wrap=tk.WORD, width=80, height=8, state=tk.DISABLED)
         self.suggestions_text.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
     
     def setup_generate_tab(self):
@@ -384,7 +683,7 @@ class ResumeRebuilderApp:
         preview_frame = ttk.Frame(frame, relief=tk.SUNKEN, borderwidth=1)
         preview_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
         
-        self.preview_text = scrolledtext.ScrolledText(preview_frame, wrap=tk.WORD, width=80, height=15)
+        self.preview_text = FastScrolledText(preview_frame, wrap=tk.WORD, width=80, height=15, state=tk.DISABLED)
         self.preview_text.pack(fill=tk.BOTH, expand=True)
         
         # Generate button
@@ -397,19 +696,21 @@ class ResumeRebuilderApp:
             command=self.update_preview
         ).pack(side=tk.LEFT, padx=5)
         
-        ttk.Button(
+        self.generate_button = ttk.Button(
             button_frame, 
             text="Generate PDF Resume", 
             command=self.generate_resume,
             style="Accent.TButton"
-        ).pack(side=tk.LEFT, padx=5)
+        )
+        self.generate_button.pack(side=tk.LEFT, padx=5)
         
         # Continue iteration button - newly added
-        ttk.Button(
+        self.iterate_button = ttk.Button(
             button_frame, 
             text="Continue to iterate?", 
             command=self.continue_iteration
-        ).pack(side=tk.LEFT, padx=5)
+        )
+        self.iterate_button.pack(side=tk.LEFT, padx=5)
     
     def setup_replace_tab(self):
         """Setup the Replace PDF Content tab."""
@@ -464,7 +765,7 @@ class ResumeRebuilderApp:
         job_frame = ttk.LabelFrame(frame, text="Job Description (Optional)")
         job_frame.pack(fill=tk.BOTH, expand=True, pady=10, padx=5)
         
-        self.replace_job_text = scrolledtext.ScrolledText(job_frame, wrap=tk.WORD, height=8)
+        self.replace_job_text = FastScrolledText(job_frame, wrap=tk.WORD, height=8)
         self.replace_job_text.pack(fill=tk.BOTH, expand=True, pady=5, padx=5)
         
         # Options frame
@@ -481,11 +782,12 @@ class ResumeRebuilderApp:
         ocr_check.pack(anchor=tk.W, pady=5, padx=5)
         
         # Use direct PDF manipulation option
-        self.use_direct_var = tk.BooleanVar(value=True)
+        self.use_direct_var = tk.BooleanVar(value=self.has_pymupdf)
         direct_check = ttk.Checkbutton(
             options_frame,
             text="Use direct PDF manipulation (better format preservation)",
-            variable=self.use_direct_var
+            variable=self.use_direct_var,
+            state=tk.NORMAL if self.has_pymupdf else tk.DISABLED
         )
         direct_check.pack(anchor=tk.W, pady=5, padx=5)
         
@@ -493,36 +795,41 @@ class ResumeRebuilderApp:
         button_frame = ttk.Frame(frame)
         button_frame.pack(fill=tk.X, pady=10)
         
-        ttk.Button(
+        self.load_pdf_button = ttk.Button(
             button_frame,
             text="Load PDF",
             command=self.load_pdf_for_replacement
-        ).pack(side=tk.LEFT, padx=5)
+        )
+        self.load_pdf_button.pack(side=tk.LEFT, padx=5)
         
-        ttk.Button(
+        self.analyze_pdf_button = ttk.Button(
             button_frame,
             text="Analyze PDF Structure",
             command=self.analyze_pdf_structure
-        ).pack(side=tk.LEFT, padx=5)
+        )
+        self.analyze_pdf_button.pack(side=tk.LEFT, padx=5)
         
-        ttk.Button(
+        self.replace_pdf_button = ttk.Button(
             button_frame,
             text="Replace Content",
             command=self.replace_pdf_content,
             style="Accent.TButton"
-        ).pack(side=tk.LEFT, padx=5)
+        )
+        self.replace_pdf_button.pack(side=tk.LEFT, padx=5)
         
         # Status and results frame
         results_frame = ttk.LabelFrame(frame, text="Analysis Results")
         results_frame.pack(fill=tk.BOTH, expand=True, pady=10, padx=5)
         
-        self.replace_results_text = scrolledtext.ScrolledText(results_frame, wrap=tk.WORD, height=6)
+        self.replace_results_text = FastScrolledText(results_frame, wrap=tk.WORD, height=6)
         self.replace_results_text.pack(fill=tk.BOTH, expand=True, pady=5, padx=5)
     
     def setup_api_tab(self):
         """Set up the API Settings tab."""
         frame = ttk.Frame(self.tab_api, padding="10")
         frame.pack(fill=tk.BOTH, expand=True)
+        # The entry column takes up any extra width
+        frame.columnconfigure(1, weight=1)
         
         # API URL
         ttk.Label(frame, text="API URL:").grid(column=0, row=0, sticky=tk.W, pady=5)
@@ -532,7 +839,6 @@ class ResumeRebuilderApp:
         
         # API Key
         ttk.Label(frame, text="API Key:").grid(column=0, row=1, sticky=tk.W, pady=5)
-        self.api_key_var = tk.StringVar(value=self.api_client.api_key)
         self.api_key_entry = ttk.Entry(frame, width=50, textvariable=self.api_key_var, show="*")
         self.api_key_entry.grid(column=1, row=1, sticky=(tk.W, tk.E), padx=5, pady=5)
         
@@ -554,12 +860,20 @@ class ResumeRebuilderApp:
         self.api_timeout_spin = ttk.Spinbox(frame, from_=1, to=120, width=5, textvariable=self.api_timeout_var)
         self.api_timeout_spin.grid(column=1, row=2, sticky=tk.W, padx=5, pady=5)
         
+        # APIClient attribute -> form variable
+        self._api_vars = {
+            'base_url': self.api_url_var,
+            'api_key': self.api_key_var,
+            'timeout': self.api_timeout_var,
+        }
+        
         # Save and Test buttons
         button_frame = ttk.Frame(frame)
         button_frame.grid(column=0, row=3, columnspan=3, pady=10)
         
         ttk.Button(button_frame, text="Save Settings", command=self.save_api_settings).pack(side=tk.LEFT, padx=5)
-        ttk.Button(button_frame, text="Test Connection", command=self.test_api_connection).pack(side=tk.LEFT, padx=5)
+        self.test_api_button = ttk.Button(button_frame, text="Test Connection", command=self.test_api_connection)
+        self.test_api_button.pack(side=tk.LEFT, padx=5)
         ttk.Button(button_frame, text="Reset to Default", command=self.reset_api_settings).pack(side=tk.LEFT, padx=5)
         
         # Status message
@@ -591,31 +905,35 @@ class ResumeRebuilderApp:
         else:
             self.api_key_entry.config(show="*")
     
+    def _on_llm_port_changed(self):
+        """Parse the LLM Studio port after an edit and enable Test Connection if it is valid."""
+        try:
+            port = int(self.llm_port_var.get())
+        except ValueError:
+            port = None
+        if port is not None and not 0 < port < 65536:
+            port = None
+        self._llm_port = port
+        self.test_llm_button.state(['!disabled'] if port is not None else ['disabled'])
+    
     def test_local_llm_connection(self):
         """Test connection to the local LLM server."""
         host = self.llm_host_var.get()
-        port = self.llm_port_var.get()
+        port = self._llm_port
+        model_name = self.llm_model_var.get()
         
-        if not host or not port:
+        if not host or port is None:
             messagebox.showerror("Error", "Please provide host and port for the local LLM server.")
             return
         
-        try:
-            # Update status
-            self.status_var.set(f"Testing connection to LLM Studio at {host}:{port}...")
-            self.root.update_idletasks()
-            
+        # Update status
+        self.status_var.set(f"Testing connection to LLM Studio at {host}:{port}...")
+        
+        def test_connection():
             # Use our adapter class for a proper test
-            from utils.local_llm_adapter import LocalLLMAdapter
-            adapter = LocalLLMAdapter(
-                host=host,
-                port=int(port),  # Convert to integer
-                model_name="qwen-14b"
-            )
-            
-            # Test the connection
-            success = adapter.test_connection()
-            
+            return self._get_llm(host, port, model_name).test_connection()
+        
+        def on_done(success):
             if success:
                 self.status_var.set(f"LLM Studio connection successful at {host}:{port}")
                 messagebox.showinfo("Success", f"Successfully connected to LLM Studio at {host}:{port}")
@@ -623,21 +941,50 @@ class ResumeRebuilderApp:
                 # Update API integration to use this connection
                 if self.use_local_llm_var.get():
                     self.api_integration.llm_host = host
-                    self.api_integration.llm_port = int(port)
-                    self.api_integration.switch_connection(ConnectionType.LLM_DIRECT)
+                    self.api_integration.llm_port = port
+                    self.api_integration.switch_connection(load_component('ConnectionType').LLM_DIRECT)
             else:
                 self.status_var.set(f"LLM Studio connection failed at {host}:{port}")
                 messagebox.showerror("Error", f"Failed to connect to LLM Studio at {host}:{port}")
-        except Exception as e:
+        
+        def on_error(e):
             self.status_var.set(f"Error connecting to LLM Studio: {str(e)}")
             messagebox.showerror("Error", f"Failed to connect to LLM Studio: {str(e)}")
+        
+        self._run_async(test_connection, on_done, on_error, button=self.test_llm_button)
+    
+    def _load_api_settings(self):
+        """Apply the API settings saved by a previous session to the API client."""
+        if app_settings is None or not hasattr(self.api_client, 'set_api_credentials'):
+            return
+        self.api_client.set_api_credentials(
+            base_url=app_settings.get("api", "manageai_url"),
+            api_key=app_settings.get("api", "api_key")
+        )
+        self.api_client.timeout = app_settings.get("api", "timeout", self.api_client.timeout)
+    
+    def _store_api_settings(self):
+        """Save the API client's settings for the next session."""
+        if app_settings is None:
+            return
+        app_settings.update_api_settings(
+            manageai_url=self.api_client.base_url,
+            api_key=self.api_client.api_key,
+            timeout=self.api_client.timeout
+        )
     
     def save_api_settings(self):
         """Save API settings from the form to the API client."""
         try:
-            self.api_client.base_url = self.api_url_var.get().strip()
-            self.api_client.api_key = self.api_key_var.get().strip()
-            self.api_client.timeout = self.api_timeout_var.get()
+            values = {name: var.get() for name, var in self._api_vars.items()}
+            values = {name: value.strip() if isinstance(value, str) else value for name, value in values.items()}
+            
+            # Update the existing client in place so its session stays alive
+            self.api_client.set_api_credentials(base_url=values.pop('base_url'))
+            for name, value in values.items():
+                setattr(self.api_client, name, value)
+            
+            self._store_api_settings()
             self.api_status_var.set("Settings saved successfully!")
         except Exception as e:
             self.api_status_var.set(f"Error saving settings: {str(e)}")
@@ -645,34 +992,54 @@ class ResumeRebuilderApp:
     def reset_api_settings(self):
         """Reset API settings to default values."""
         self.api_client.reset_to_defaults()
-        self.api_url_var.set(self.api_client.base_url)
-        self.api_key_var.set(self.api_client.api_key)
-        self.api_timeout_var.set(self.api_client.timeout)
+        for name, var in self._api_vars.items():
+            var.set(getattr(self.api_client, name))
+        self._store_api_settings()
         self.api_status_var.set("Settings reset to default values.")
     
     def test_api_connection(self):
         """Test the API connection with current settings."""
         self.save_api_settings()
         self.api_status_var.set("Testing connection...")
-        self.root.update_idletasks()
         
-        try:
-            success = self.api_client.test_connection()
+        def on_done(success):
             if success:
                 self.api_status_var.set("✓ Connection successful! API is available.")
             else:
                 self.api_status_var.set("✗ Connection failed. Check API URL and credentials.")
-        except Exception as e:
+        
+        def on_error(e):
             self.api_status_var.set(f"✗ Error testing connection: {str(e)}")
+        
+        self._run_async(self.api_client.test_connection, on_done, on_error)
+    
+    def _browse(self, dialog, **options):
+        """
+        Show a file dialog that opens in the folder of the last file picked.
+        
+        Args:
+            dialog: filedialog function to show, e.g. filedialog.askopenfilename
+            **options: Options for the dialog, such as title and filetypes
+            
+        Returns:
+            The selected path, or an empty string if the dialog was cancelled
+        """
+        filename = dialog(initialdir=self._last_browse_dir, **options)
+        if filename:
+            self._last_browse_dir = os.path.dirname(filename)
+        return filename
     
     def browse_resume(self):
         """Open file dialog to select a resume PDF."""
-        filetypes = [("PDF files", "*.pdf"), ("All files", "*.*")]
-        filename = filedialog.askopenfilename(title="Select Resume PDF", filetypes=filetypes)
+        filename = self._browse(filedialog.askopenfilename, title="Select Resume PDF", filetypes=PDF_FILETYPES)
         
         if filename:
             self.file_path_var.set(filename)
             self.input_pdf_path = filename
+            
+            # Read the file once; the extraction cache and extractor reuse the bytes
+            with open(filename, 'rb') as f:
+                self.input_pdf_bytes = f.read()
     
     def extract_resume(self):
         """Extract content from the selected resume PDF."""
@@ -680,59 +1047,157 @@ class ResumeRebuilderApp:
             messagebox.showerror("Error", "Please select a resume PDF file first.")
             return
         
-        try:
-            self.status_var.set("Extracting resume content...")
-            self.root.update_idletasks()
-            
-            # Set the OpenAI API key if provided
-            api_key = self.api_key_var.get().strip()
-            if api_key:
-                os.environ["OPENAI_API_KEY"] = api_key
-            
-            # Extract content from the PDF
-            extractor = PDFExtractor()
+        self.status_var.set("Extracting resume content...")
+        
+        # The results are shown in the Edit and Generate tabs
+        self._build_all_tabs()
+        
+        # Read the options once here; Tk variables must only be used on the UI thread
+        api_key = self.api_key_var.get().strip()
+        pdf_path = self.input_pdf_path
+        pdf_bytes = self.input_pdf_bytes
+        use_fast_pdf = self.use_fast_pdf_var.get() and self.has_pdfium
+        use_llm = self.use_llm_var.get()
+        model = self.llm_model_var.get() if self.use_local_llm_var.get() else None
+        batch = self.llm_batch_var.get()
+        use_cache = self.use_extract_cache_var.get()
+        llm_host = self.llm_host_var.get()
+        llm_port = self._llm_port
+        
+        if use_llm and model and llm_port is None:
+            self.status_var.set("Error: invalid LLM Studio port.")
+            messagebox.showerror("Error", "Please enter a valid port for the local LLM server.")
+            return
+        
+        # Set the OpenAI API key if provided
+        if api_key:
+            os.environ["OPENAI_API_KEY"] = api_key
+        
+        # Keep pending edits before the streamed output replaces the editor text
+        if self.resume_content and self._sections_dirty:
+            self._apply_sections_text()
+        self._extracting = True
+        
+        def extract():
+            # Re-extracting the same PDF with the same options and prompts gives the same result
+            prompt_version = None
+            if use_llm:
+                from utils.llm_refiner import PROMPT_VERSION as prompt_version
+            cache_key = analysis_cache.make_key(
+                "extract", analysis_cache.data_digest(pdf_bytes), use_fast_pdf, use_llm, model, batch, prompt_version
+            )
+            resume_content = analysis_cache.get(cache_key) if use_cache else None
+            if resume_content is None:
+                resume_content, complete = extract_uncached()
+                # An unrefined copy after a failed LLM call isn't the result to reuse
+                if complete:
+                    analysis_cache.put(cache_key, resume_content)
+            return resume_content
+        
+        def extract_uncached():
+            """Returns (resume content, whether the LLM refinement, if any, succeeded)."""
+            # Extract content from the PDF. The fast extractor parses the bytes
+            # already in memory; the full extractor (and its OCR) reads the file
+            if use_fast_pdf:
+                from utils.pdf_extractor_fast import FastPDFExtractor
+                extractor = FastPDFExtractor()
+                extract_basic = lambda: extractor.extract_bytes(pdf_bytes)
+            else:
+                extractor = load_component('PDFExtractor')()
+                extract_basic = lambda: extractor.extract(pdf_path)
             
             # Use LLM refinement if enabled
-            if self.use_llm_var.get():
-                self.status_var.set("Extracting and refining resume content with LLM...")
-                self.root.update_idletasks()
+            if use_llm:
+                self._post(self.status_var.set, "Extracting and refining resume content with LLM...")
                 
                 # Import here to ensure we have the latest API key
                 from utils.llm_refiner import LLMRefiner
+                from utils.local_llm_adapter import IncompleteResponseError
                 
                 # Extract basic content
-                basic_resume = extractor.extract(self.input_pdf_path)
+                basic_resume = extract_basic()
                 
-                # Refine with LLM
-                refiner = LLMRefiner(api_key=api_key)
-                self.resume_content = refiner.refine_resume(basic_resume)
-            else:
-                # Just use regular extraction without LLM refinement
-                self.resume_content = extractor.extract(self.input_pdf_path)
-            
-            # Update edit tab with extracted content
-            self.name_var.set(self.resume_content.contact_info.get('name', ''))
-            self.email_var.set(self.resume_content.contact_info.get('email', ''))
-            self.phone_var.set(self.resume_content.contact_info.get('phone', ''))
-            self.linkedin_var.set(self.resume_content.contact_info.get('linkedin', ''))
-            
-            # Add sections to the text widget
-            self.sections_text.delete(1.0, tk.END)
-            for section in self.resume_content.sections:
-                self.sections_text.insert(tk.END, f"{section.title}\n{'-' * len(section.title)}\n{section.content}\n\n")
-            
-            # Update preview
-            self.update_preview()
-            
-            # Switch to edit tab
-            self.notebook.select(1)  # Switch to the edit tab (index 1)
+                # Refine with LLM, streaming from LLM Studio when the local LLM is selected
+                llm_adapter = None
+                if model:
+                    llm_adapter = self._get_llm(llm_host, llm_port, model)
+                refiner = LLMRefiner(api_key=api_key, model=model, batch=batch, llm_adapter=llm_adapter)
+                
+                # Show the improved text as it is generated; the structured
+                # content replaces it once the response is complete
+                self._post(self.sections_text.delete, 1.0, tk.END)
+                chunks = []
+                pending = []
+                try:
+                    for chunk in refiner.refine_resume_stream(basic_resume):
+                        chunks.append(chunk)
+                        pending.append(chunk)
+                        if len(pending) >= STREAM_CHUNKS_PER_UPDATE:
+                            self._post(self.sections_text.insert, tk.END, "".join(pending))
+                            pending = []
+                except IncompleteResponseError as e:
+                    # A partial resume would drop whatever the LLM didn't get to;
+                    # ask for the whole text at once instead, and don't cache it
+                    print(f"Streamed refinement incomplete, retrying without streaming: {e}")
+                    self._post(self.status_var.set, "LLM response was cut off, refining again...")
+                    improved_text = refiner.improve_text(basic_resume)
+                    return refiner.apply_improved_text(basic_resume, improved_text), False
+                if pending:
+                    self._post(self.sections_text.insert, tk.END, "".join(pending))
+                
+                improved_text = "".join(chunks)
+                return refiner.apply_improved_text(basic_resume, improved_text), bool(improved_text.strip())
             
-            self.status_var.set("Resume content extracted successfully.")
-            messagebox.showinfo("Success", "Resume content extracted successfully.")
-        except ImportError as e:
+            # Just use regular extraction without LLM refinement
+            return extract_basic(), True
+        
+        self._run_async(extract, self._on_resume_extracted, self._on_resume_extraction_failed, button=self.extract_button)
+    
+    def _on_resume_extracted(self, resume_content):
+        """Show the extracted resume content in the UI."""
+        self._extracting = False
+        self.resume_content = resume_content
+        
+        # Update edit tab with extracted content
+        self.name_var.set(self.resume_content.contact_info.get('name', ''))
+        self.email_var.set(self.resume_content.contact_info.get('email', ''))
+        self.phone_var.set(self.resume_content.contact_info.get('phone', ''))
+        self.linkedin_var.set(self.resume_content.contact_info.get('linkedin', ''))
+        
+        self._show_sections()
+        
+        # Update preview
+        self.update_preview()
+        
+        # Switch to edit tab
+        self.notebook.select(1)  # Switch to the edit tab (index 1)
+        
+        self.status_var.set("Resume content extracted successfully.")
+        messagebox.showinfo("Success", "Resume content extracted successfully.")
+    
+    def _show_sections(self):
+        """Fill the sections editor from the resume content."""
+        # Add sections to the text widget in one insert
+        self.sections_text.bulk_replace("".join(
+            f"{section.title}\n{_dashes(len(section.title))}\n{section.content}\n\n"
+            for section in self.resume_content.sections
+        ))
+        
+        # The widget now mirrors resume_content, so there is nothing to parse back
+        self.sections_text.edit_modified(False)
+        self._sections_dirty = False
+    
+    def _on_resume_extraction_failed(self, e):
+        """Report a failed resume extraction in the UI."""
+        self._extracting = False
+        # Replace any partial LLM output streamed into the editor
+        if self.resume_content:
+            self._show_sections()
+        
+        if isinstance(e, ImportError):
             self.status_var.set("Error: LLM refinement module not available.")
             messagebox.showerror("Error", "LLM refinement module not available. Make sure all required packages are installed.")
-        except Exception as e:
+        else:
             self.status_var.set(f"Error: {str(e)}")
             messagebox.showerror("Error", f"Failed to extract resume content: {str(e)}")
     
@@ -744,29 +1209,11 @@ class ResumeRebuilderApp:
         
         try:
             # Update contact info
-            self.resume_content.set_contact_info(
-                name=self.name_var.get(),
-                email=self.email_var.get(),
-                phone=self.phone_var.get(),
-                linkedin=self.linkedin_var.get()
-            )
-            
-            # Update sections (this is a simplified approach)
-            # In a more robust application, you'd have a better UI for editing sections
-            self.resume_content.sections = []
-            
-            sections_text = self.sections_text.get(1.0, tk.END)
-            sections = sections_text.split('\n\n')
+            self._apply_contact_info()
             
-            for section_text in sections:
-                if not section_text.strip():
-                    continue
-                    
-                lines = section_text.strip().split('\n')
-                if len(lines) >= 2:
-                    title = lines[0]
-                    content = '\n'.join(lines[2:]) if len(lines) > 2 else ''
-                    self.resume_content.add_section(title, content)
+            # Only re-parse the sections editor if it was edited since the last parse
+            if self._sections_dirty:
+                self._apply_sections_text()
             
             self.status_var.set("Changes saved.")
             self.update_preview()
@@ -777,18 +1224,33 @@ class ResumeRebuilderApp:
     
     def browse_job_description(self):
         """Open file dialog to select a job description file."""
-        filetypes = [("Text files", "*.txt"), ("All files", "*.*")]
-        filename = filedialog.askopenfilename(title="Select Job Description File", filetypes=filetypes)
+        filename = self._browse(filedialog.askopenfilename, title="Select Job Description File", filetypes=TEXT_FILETYPES)
         
-        if filename:
-            self.job_file_path_var.set(filename)
-            try:
-                with open(filename, 'r') as f:
-                    job_text = f.read()
-                    self.job_text.delete(1.0, tk.END)
-                    self.job_text.insert(tk.END, job_text)
-            except Exception as e:
-                messagebox.showerror("Error", f"Failed to read job description file: {str(e)}")
+        if not filename:
+            return
+        
+        self.job_file_path_var.set(filename)
+        
+        def read():
+            # One bounded binary read and a single decode; one byte more than
+            # the limit tells us whether the file was cut short
+            with open(filename, 'rb') as f:
+                raw = f.read(MAX_JOB_DESCRIPTION_BYTES + 1)
+            truncated = len(raw) > MAX_JOB_DESCRIPTION_BYTES
+            return raw[:MAX_JOB_DESCRIPTION_BYTES].decode('utf-8', errors='replace'), truncated
+        
+        def on_done(result):
+            job_text, truncated = result
+            self.job_text.bulk_replace(job_text)
+            if truncated:
+                self.status_var.set(
+                    f"Job description truncated to the first {MAX_JOB_DESCRIPTION_BYTES // 1024} KB."
+                )
+        
+        def on_error(e):
+            messagebox.showerror("Error", f"Failed to read job description file: {str(e)}")
+        
+        self._run_async(read, on_done, on_error)
     
     def analyze_job(self):
         """Analyze the resume against the job description."""
@@ -801,55 +1263,129 @@ class ResumeRebuilderApp:
             messagebox.showerror("Error", "Please enter a job description.")
             return
         
-        try:
-            self.status_var.set("Analyzing resume against job description...")
-            self.root.update_idletasks()
-            
-            analyzer = JobAnalyzer()
-            keywords, suggestions = analyzer.analyze(job_text, self.resume_content)
+        resume_content = self.resume_content
+        
+        # The results on screen already belong to this resume and job description
+        cache_key = analysis_cache.make_key("analyze", job_text, resume_content)
+        if cache_key == self._last_analysis_key:
+            self.status_var.set("Analysis complete (resume and job description unchanged).")
+            return
+        
+        self.status_var.set("Analyzing resume against job description...")
+        
+        def on_done(result):
+            keywords, suggestions = result
+            self._last_analysis_key = cache_key
             
             # Update results
             self.keywords_var.set(", ".join(keywords))
             
-            self.suggestions_text.config(state=tk.NORMAL)
-            self.suggestions_text.delete(1.0, tk.END)
-            for suggestion in suggestions:
-                self.suggestions_text.insert(tk.END, f"• {suggestion}\n\n")
-            self.suggestions_text.config(state=tk.DISABLED)
+            self.suggestions_text.bulk_replace("".join(f"• {suggestion}\n\n" for suggestion in suggestions))
             
             self.status_var.set("Analysis complete.")
             messagebox.showinfo("Success", "Resume analysis complete.")
-        except Exception as e:
+        
+        def on_error(e):
             self.status_var.set(f"Error: {str(e)}")
             messagebox.showerror("Error", f"Failed to analyze resume: {str(e)}")
+        
+        def analyze():
+            result = analysis_cache.get(cache_key)
+            if result is None:
+                result = self.job_analyzer.analyze(job_text, resume_content)
+                analysis_cache.put(cache_key, result)
+            return result
+        
+        self._run_async(analyze, on_done, on_error, button=self.analyze_job_button)
     
     def browse_output_location(self):
         """Open file dialog to select output location."""
-        filetypes = [("PDF files", "*.pdf"), ("All files", "*.*")]
-        filename = filedialog.asksaveasfilename(title="Save Resume PDF As", filetypes=filetypes, defaultextension=".pdf")
+        filename = self._browse(
+            filedialog.asksaveasfilename, title="Save Resume PDF As", filetypes=PDF_FILETYPES, defaultextension=".pdf"
+        )
         
         if filename:
             self.output_path_var.set(filename)
             self.output_pdf_path = filename
     
-    def update_preview(self):
-        """Update the preview of the resume content."""
-        if not self.resume_content:
-            return
+    def _apply_sections_text(self):
+        """Parse the sections editor back into the resume content."""
+        # Update sections (this is a simplified approach)
+        # In a more robust application, you'd have a better UI for editing sections
+        # "end-1c" leaves out the newline Tk keeps after the last line
+        sections_text = self.sections_text.get("1.0", "end-1c")
+        self.resume_content.sections = []
+        self.resume_content.add_sections(
+            (match.group(1).strip(), match.group(2).strip())
+            for match in _SECTION_RE.finditer(sections_text)
+        )
         
-        # Update the resume content with current values from UI
+        self._sections_dirty = False
+    
+    def _apply_contact_info(self):
+        """Copy the contact fields into the resume content if they have changed."""
+        if not self._contact_dirty and self._contact_applied_to is self.resume_content:
+            return
         self.resume_content.set_contact_info(
             name=self.name_var.get(),
             email=self.email_var.get(),
             phone=self.phone_var.get(),
             linkedin=self.linkedin_var.get()
         )
+        self._contact_dirty = False
+        self._contact_applied_to = self.resume_content
+    
+    def _on_contact_modified(self):
+        """Schedule a preview refresh after an edit in a contact field."""
+        self._contact_dirty = True
+        self.schedule_update_preview()
+    
+    def _on_sections_modified(self, event=None):
+        """Schedule a preview refresh after an edit in the sections editor."""
+        # Clearing the flag fires <<Modified>> again, ignore that one
+        if not self.sections_text.edit_modified():
+            return
+        self.sections_text.edit_modified(False)
+        # Streamed extraction output is replaced once the extraction finishes
+        if self._extracting:
+            return
+        self._sections_dirty = True
+        self.schedule_update_preview()
+    
+    def schedule_update_preview(self, delay_ms=PREVIEW_DELAY_MS):
+        """
+        Refresh the preview once the user pauses typing.
+        
+        Args:
+            delay_ms: Quiet period before the preview is rebuilt
+        """
+        if self._preview_after_id:
+            self.root.after_cancel(self._preview_after_id)
+        self._preview_after_id = self.root.after(delay_ms, self.update_preview)
+    
+    def update_preview(self):
+        """Update the preview of the resume content."""
+        # Called directly (save, generate, extraction), this refresh makes
+        # a pending debounced one redundant
+        if self._preview_after_id:
+            self.root.after_cancel(self._preview_after_id)
+            self._preview_after_id = None
+        if not self.resume_content:
+            return
+        
+        # Update the resume content with current values from UI
+        self._apply_contact_info()
+        if self._sections_dirty:
+            self._apply_sections_text()
+        
+        # Skip the redraw when the content is unchanged
+        new_text = str(self.resume_content)
+        if new_text == self._last_preview:
+            return
+        self._last_preview = new_text
         
         # Show preview in text widget
-        self.preview_text.config(state=tk.NORMAL)
-        self.preview_text.delete(1.0, tk.END)
-        self.preview_text.insert(tk.END, str(self.resume_content))
-        self.preview_text.config(state=tk.NORMAL)
+        self.preview_text.bulk_replace(new_text)
     
     def generate_resume(self):
         """Generate the new resume PDF."""
@@ -862,26 +1398,31 @@ class ResumeRebuilderApp:
             messagebox.showerror("Error", "Please specify an output file path.")
             return
         
-        try:
-            self.status_var.set("Generating resume PDF...")
-            self.root.update_idletasks()
-            
-            # Update resume content with current values
-            self.update_preview()
-            
+        self.status_var.set("Generating resume PDF...")
+        
+        # Update resume content with current values
+        self.update_preview()
+        resume_content = self.resume_content
+        template = self.template_var.get()
+        
+        def generate():
             # Generate the PDF
-            generator = ResumeGenerator()
-            output_file = generator.generate(
-                self.resume_content,
-                template=self.template_var.get(),
+            generator = load_component('ResumeGenerator')()
+            return generator.generate(
+                resume_content,
+                template=template,
                 output_path=output_path
             )
-            
+        
+        def on_done(output_file):
             self.status_var.set(f"Resume generated successfully: {output_file}")
             messagebox.showinfo("Success", f"Resume PDF generated successfully: {output_file}")
-        except Exception as e:
+        
+        def on_error(e):
             self.status_var.set(f"Error: {str(e)}")
             messagebox.showerror("Error", f"Failed to generate resume: {str(e)}")
+        
+        self._run_async(generate, on_done, on_error, button=self.generate_button)
     
     def test_api_connection(self):
         """Test the API connection."""
@@ -890,22 +1431,25 @@ class ResumeRebuilderApp:
             messagebox.showerror("Error", "Please enter an API key.")
             return
         
-        try:
-            self.status_var.set("Testing API connection...")
-            self.root.update_idletasks()
-            
+        self.status_var.set("Testing API connection...")
+        
+        def test_connection():
             self.api_client.set_api_key(api_key)
-            success = self.api_client.test_connection()
-            
+            return self.api_client.test_connection()
+        
+        def on_done(success):
             if success:
                 self.status_var.set("API connection successful.")
                 messagebox.showinfo("Success", "API connection successful.")
             else:
                 self.status_var.set("API connection failed.")
                 messagebox.showerror("Error", "API connection failed.")
-        except Exception as e:
+        
+        def on_error(e):
             self.status_var.set(f"Error: {str(e)}")
             messagebox.showerror("Error", f"Failed to test API connection: {str(e)}")
+        
+        self._run_async(test_connection, on_done, on_error, button=self.test_api_button)
     
     def continue_iteration(self):
         """Allow the user to continue iterating on the resume after initial generation."""
@@ -927,23 +1471,39 @@ class ResumeRebuilderApp:
         
         feedback_text = scrolledtext.ScrolledText(feedback_frame, wrap=tk.WORD, width=70, height=10)
         feedback_text.pack(fill=tk.BOTH, expand=True)
-        feedback_text.insert(tk.END, "Example: Make the summary more concise and highlight my leadership skills more prominently.")
+        feedback_text.insert(tk.END, EXAMPLE_FEEDBACK)
         feedback_text.bind("<FocusIn>", lambda e: feedback_text.delete("1.0", tk.END) if feedback_text.get("1.0", tk.END).strip().startswith("Example:") else None)
         
         options_frame = ttk.Frame(dialog)
         options_frame.pack(fill=tk.X, pady=10)
         
-        focus_var = tk.StringVar(value="skills")
+        focus_var = tk.StringVar(value=FOCUS_AREAS[0])
         ttk.Label(options_frame, text="Focus area:").pack(side=tk.LEFT, padx=5)
         focus_combo = ttk.Combobox(
             options_frame,
             textvariable=focus_var,
-            values=["skills", "experience", "education", "summary", "formatting", "keywords"],
+            values=FOCUS_AREAS,
             state="readonly",
             width=15
         )
         focus_combo.pack(side=tk.LEFT, padx=5)
         
+        # The feedback is already structured, so ManageAI can skip reformatting it
+        reprocess_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(
+            options_frame,
+            text="Full reprocessing",
+            variable=reprocess_var
+        ).pack(side=tk.LEFT, padx=10)
+        
+        # Retrying the same feedback on the same resume normally reuses the earlier answer
+        use_cache_var = tk.BooleanVar(value=True)
+        ttk.Checkbutton(
+            options_frame,
+            text="Reuse earlier results",
+            variable=use_cache_var
+        ).pack(side=tk.LEFT, padx=10)
+        
         buttons_frame = ttk.Frame(dialog)
         buttons_frame.pack(fill=tk.X, pady=10)
         
@@ -956,7 +1516,9 @@ class ResumeRebuilderApp:
                 return
             
             dialog.destroy()
-            self.process_iteration_feedback(feedback, focus)
+            self.process_iteration_feedback(
+                feedback, focus, reprocess=reprocess_var.get(), use_cache=use_cache_var.get()
+            )
         
         ttk.Button(
             buttons_frame,
@@ -971,153 +1533,325 @@ class ResumeRebuilderApp:
             command=dialog.destroy
         ).pack(side=tk.RIGHT)
         
-    def process_iteration_feedback(self, feedback, focus):
-        """Process the iteration feedback and update the resume."""
+    def _ensure_llm(self):
+        """
+        Import the LLM helpers on first use.
+        
+        Called from the worker thread, so the import cost of the first
+        iteration doesn't freeze the window.
+        """
+        if self._llm_refiner_cls is None:
+            from utils.llm_refiner import LLMRefiner
+            from utils.local_llm_adapter import LocalLLMAdapter
+            self._llm_adapter_cls = LocalLLMAdapter
+            self._llm_refiner_cls = LLMRefiner
+    
+    def _get_llm(self, host, port, model="qwen-14b"):
+        """
+        Get an LLM Studio adapter, reusing the one made earlier for the same server and model.
+        
+        Args:
+            host: LLM Studio host
+            port: LLM Studio port
+            model: Model name; iterations use the default model
+            
+        Returns:
+            LocalLLMAdapter for the given server and model
+        """
+        key = (host, port, model)
+        adapter = self._llm_adapters.get(key)
+        if adapter is None:
+            if self._llm_adapter_cls is None:
+                from utils.local_llm_adapter import LocalLLMAdapter
+                self._llm_adapter_cls = LocalLLMAdapter
+            adapter = self._llm_adapter_cls(
+                host=host,
+                port=port,
+                model_name=model,
+                session=self.http_session
+            )
+            if len(self._llm_adapters) >= LLM_ADAPTER_CACHE_SIZE:
+                self._llm_adapters.clear()
+            self._llm_adapters[key] = adapter
+        return adapter
+    
+    def _refine_locally(self, resume_content, job_description):
+        """
+        Refine the resume with the LLM refiner, the fallback when the API can't be used.
+        
+        Args:
+            resume_content: Resume content to refine
+            job_description: Job description to tailor the resume for, may be empty
+            
+        Returns:
+            Refined copy of the resume content, or None if refinement failed
+        """
+        self._ensure_llm()
+        refiner = self._llm_refiner_cls()
+        improved_text = refiner.improve_text(resume_content, job_description=job_description or None)
+        if not improved_text:
+            return None
+        return refiner.apply_improved_text(resume_content, improved_text)
+    
+    def process_iteration_feedback(self, feedback, focus, reprocess=False, use_cache=True):
+        """
+        Process the iteration feedback and update the resume.
+        
+        Args:
+            feedback: The user's feedback on the current version
+            focus: Focus area, one of FOCUS_AREAS
+            reprocess: Let ManageAI match and reformat the input before improving it
+            use_cache: Reuse the result of an earlier identical iteration if there is one
+        """
+        if not self._has_llm_refiner:
+            messagebox.showerror("Error", "LLM refinement module not available. Make sure all required packages are installed.")
+            return
+        
         self.status_var.set("Processing iteration feedback...")
-        self.root.update_idletasks()
         
-        try:
-            # Use the API integration with the currently configured backend
+        # Read everything the worker needs here; Tk variables must only be used on the UI thread
+        resume_content = self.resume_content
+        job_description = self.job_description
+        llm_host = self.llm_host_var.get()
+        llm_port = self._llm_port
+        
+        def iterate():
+            # The same feedback on the same resume, job and backend gives the same answer
+            cache_key = analysis_cache.make_key(
+                "iterate", self.api_integration.connection_type, resume_content, job_description,
+                feedback, focus, reprocess, llm_host, llm_port
+            )
+            if use_cache:
+                improved_content = analysis_cache.get(cache_key)
+                if improved_content is not None:
+                    return improved_content, None, None
+            
+            result = iterate_uncached()
+            improved_content, api_error, warning = result
+            # A local fallback result after an API error isn't what the backend
+            # would return, and a backend echoing the resume back changed nothing
+            if improved_content and api_error is None and str(improved_content) != str(resume_content):
+                analysis_cache.put(cache_key, improved_content)
+            return result
+        
+        def api_result(improved_resume):
+            """Pick the improved content out of an API response, as iterate_uncached returns it."""
+            if not improved_resume:
+                return None, None, "No improvements returned from API."
+            if 'improved_resume' in improved_resume:
+                return improved_resume['improved_resume'], None, None
+            if 'content' in improved_resume:
+                return improved_resume['content'], None, None
+            # Just use what we got back
+            return improved_resume, None, None
+        
+        def iterate_uncached():
+            """Returns (improved content, API error or None, warning or None)."""
             try:
+                # Use the API integration with the currently configured backend
                 # Ensure server is running (applies to ManageAI mode)
                 self.api_integration.ensure_server_running()
+                ConnectionType = load_component('ConnectionType')
                 
                 # Process the iteration based on the current connection type
                 if self.api_integration.connection_type == ConnectionType.MANAGE_AI:
-                    improved_resume = self.api_integration.improve_resume(
-                        resume_content=self.resume_content,
-                        job_description=self.job_description,
-                        feedback=feedback
-                    )
-                    
-                    if improved_resume:
-                        if 'improved_resume' in improved_resume:
-                            self.resume_content = improved_resume['improved_resume']
-                        elif 'content' in improved_resume:
-                            self.resume_content = improved_resume['content']
-                        else:
-                            # Just use what we got back
-                            self.resume_content = improved_resume
-                    else:
-                        messagebox.showwarning("Warning", "No improvements returned from API.")
-                        return
+                    return api_result(self.api_integration.improve_resume(
+                        resume_content=resume_content,
+                        job_description=job_description,
+                        feedback=feedback,
+                        skip_preprocessing=not reprocess
+                    ))
                 elif self.api_integration.connection_type == ConnectionType.LLM_DIRECT:
                     # Direct LLM mode - send a tailored prompt
-                    system_prompt = (
-                        "You are a professional resume writer. Your task is to improve the user's resume "
-                        "based on their feedback. Focus on making the improvements requested while maintaining "
-                        "a professional tone and format."
+                    user_prompt = _iteration_prompt(focus).format(
+                        resume=resume_content,
+                        feedback=feedback
                     )
                     
-                    user_prompt = f"Please improve this resume with a focus on {focus}.\n\n"
-                    user_prompt += f"Resume content:\n{self.resume_content}\n\n"
-                    user_prompt += f"Feedback: {feedback}\n\n"
-                    user_prompt += "Please return the complete improved resume."
-                    
-                    from utils.local_llm_adapter import LocalLLMAdapter
-                    llm = LocalLLMAdapter(
-                        host=self.llm_host_var.get(),
-                        port=int(self.llm_port_var.get()),
-                        model_name="qwen-14b"  # Default model
-                    )
+                    if llm_port is None:
+                        raise ValueError("The LLM Studio port must be a number between 1 and 65535.")
+                    llm = self._get_llm(llm_host, llm_port)
                     
                     improved_content = llm.generate(
-                        system_prompt=system_prompt,
+                        system_prompt=ITERATION_SYSTEM_PROMPT,
                         user_prompt=user_prompt,
                         temperature=0.3,  # Lower temperature for more consistent results
                         max_tokens=4000
                     )
                     
-                    if improved_content:
-                        self.resume_content = improved_content
-                    else:
-                        messagebox.showwarning("Warning", "No improvements returned from LLM.")
-                        return
-                        
-                # Fallback for other connection types
-                else:
-                    # Use the LLM refiner utility as fallback
-                    from utils.llm_refiner import refine_resume
-                    improved_content = refine_resume(
-                        self.resume_content, 
-                        feedback=feedback,
-                        focus_area=focus
-                    )
-                    
-                    if improved_content:
-                        self.resume_content = improved_content
-                    else:
-                        messagebox.showwarning("Warning", "No improvements generated.")
-                        return
+                    if not improved_content:
+                        return None, None, "No improvements returned from LLM."
+                    return improved_content, None, None
                 
-                # Update the preview with new content
-                self.update_preview()
-                self.status_var.set(f"Resume updated with focus on {focus}")
-                
-                # Show confirmation dialog
-                messagebox.showinfo("Success", "Resume has been updated based on your feedback.")
+                # Local server: its iterate endpoint takes the feedback and focus area
+                return api_result(self.api_integration.improve_resume(
+                    resume_content=str(resume_content),
+                    job_description=job_description,
+                    feedback=feedback,
+                    focus=focus
+                ))
                 
             except Exception as api_error:
                 print(f"API error during iteration: {api_error}")  # Use print instead of logger
-                messagebox.showwarning("API Error", f"Error using API for iteration: {str(api_error)}. Falling back to local processing.")
                 
-                # Fallback to local processing
-                from utils.llm_refiner import refine_resume
-                improved_content = refine_resume(
-                    self.resume_content, 
-                    feedback=feedback,
-                    focus_area=focus
-                )
-                
-                if improved_content:
-                    self.resume_content = improved_content
-                    self.update_preview()
-                    self.status_var.set(f"Resume updated with focus on {focus} (local processing)")
-                else:
+                # Fallback to local processing, which can't take the feedback into
+                # account; its errors are reported by on_error
+                return self._refine_locally(resume_content, job_description), api_error, None
+        
+        def on_done(result):
+            improved_content, api_error, warning = result
+            self.status_var.set("Ready")
+            
+            if api_error is not None:
+                messagebox.showwarning("API Error", f"Error using API for iteration: {str(api_error)}. Falling back to local processing, which can't apply your feedback.")
+                if not improved_content:
                     messagebox.showerror("Error", "Failed to improve resume with local processing.")
                     return
-            messagebox.showinfo("Success", "Resume has been updated based on your feedback.")
+            elif warning:
+                messagebox.showwarning("Warning", warning)
+                return
             
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to process iteration: {str(e)}")
-        finally:
+            self.resume_content = improved_content
+            
+            # Update the preview with new content
+            self.update_preview()
+            if api_error is not None:
+                self.status_var.set("Resume refined with local processing; feedback not applied")
+                messagebox.showinfo("Success", "Resume has been refined locally. Your feedback could not be applied.")
+                return
+            self.status_var.set(f"Resume updated with focus on {focus}")
+            
+            # Show confirmation dialog
+            messagebox.showinfo("Success", "Resume has been updated based on your feedback.")
+        
+        def on_error(e):
             self.status_var.set("Ready")
+            messagebox.showerror("Error", f"Failed to process iteration: {str(e)}")
+        
+        self._run_async(iterate, on_done, on_error, button=self.iterate_button)
     
-    def _stop_manageai_server(self):
-        """Stop the ManageAI API server if it was started by this application."""
-        if hasattr(self, 'manageai_api_manager'):
-            self.manageai_api_manager.stop_server()
+    def _stop_manageai_server(self, timeout=None):
+        """
+        Stop the ManageAI API server if it was started by this application.
+        
+        Args:
+            timeout: Seconds to wait for the server to stop, or None to wait until it has
+        """
+        if self._manageai_api_manager is None:
+            return
+        stopper = threading.Thread(target=self._manageai_api_manager.stop_server, daemon=True)
+        stopper.start()
+        stopper.join(timeout)
+        if stopper.is_alive():
+            print("ManageAI API server is still shutting down")
+        else:
             self.status_var.set("ManageAI API server stopped.")
     
     def _start_manageai_server(self):
-        """Start the ManageAI API server if it's not already running."""
-        try:
-            if hasattr(self, 'manageai_api_manager'):
-                # Try to start the server
-                success = self.manageai_api_manager.start_server()
-                if success:
-                    self.status_var.set("ManageAI API server started.")
-                    return True
-                else:
-                    self.status_var.set("Failed to start ManageAI API server.")
-                    return False
-        except Exception as e:
+        """Start the ManageAI API server on a worker thread if it's not already running."""
+        def start():
+            manager = self.manageai_api_manager
+            success = manager.start_server()
+            if self._closing.is_set():
+                # The window was closed while the server was starting up
+                manager.stop_server()
+            return success
+        
+        def on_done(success):
+            if success:
+                self.status_var.set("ManageAI API server ready.")
+            else:
+                self.status_var.set("Failed to start ManageAI API server.")
+        
+        def on_error(e):
             self.status_var.set(f"Error starting ManageAI API server: {str(e)}")
-            return False
+        
+        # Startup can take a while, so it gets its own thread rather than
+        # holding one of the executor's workers
+        def worker():
+            try:
+                self._post(on_done, start())
+            except Exception as e:
+                self._post(on_error, e)
+        
+        threading.Thread(target=worker, daemon=True).start()
+    
+    def _post(self, callback, *args):
+        """
+        Schedule a callback on the Tk thread; safe to call from any thread.
+        
+        Args:
+            callback: Callable to run on the Tk thread
+            *args: Arguments passed to the callback
+        """
+        self._work_queue.put((callback, args))
     
-    def _check_pymupdf_availability(self):
-        """Check if PyMuPDF is available for direct PDF manipulation."""
+    def _poll_queue(self):
+        """Run the callbacks posted by worker threads, then check again shortly."""
+        # The window may have been destroyed while work was running
+        if self._closing.is_set():
+            return
         try:
-            import fitz  # PyMuPDF
-            return True
-        except ImportError:
-            return False
+            while True:
+                callback, args = self._work_queue.get_nowait()
+                try:
+                    callback(*args)
+                except Exception as e:
+                    print(f"Error in background task callback: {e}")
+        except queue.Empty:
+            pass
+        self.root.after(QUEUE_POLL_MS, self._poll_queue)
+    
+    def _run_async(self, fn, on_done, on_error, button=None):
+        """
+        Run a slow operation on a worker thread without blocking the Tk event loop.
+        
+        Args:
+            fn: Callable doing the work; it must not touch any Tk widgets or variables
+            on_done: Called on the Tk thread with the result of fn
+            on_error: Called on the Tk thread with the exception raised by fn
+            button: Optional button disabled until the operation has finished
+        """
+        if button is not None:
+            button.state(['disabled'])
+        
+        def finish(callback, value):
+            if button is not None:
+                button.state(['!disabled'])
+            callback(value)
+        
+        def done(future):
+            try:
+                result = future.result()
+            except Exception as e:
+                self._post(finish, on_error, e)
+            else:
+                self._post(finish, on_done, result)
+        
+        self._executor.submit(fn).add_done_callback(done)
+    
+    @property
+    def has_pymupdf(self):
+        """Whether PyMuPDF is available for direct PDF manipulation."""
+        return module_available('fitz')
+    
+    @property
+    def has_pdfium(self):
+        """Whether pypdfium2 is available for fast PDF text extraction."""
+        return module_available('pypdfium2')
     
     def _on_window_close(self):
         """Handle window close event."""
+        # Stop background work from posting back to the window
+        self._closing.set()
         try:
             # Stop the ManageAI API server
-            self._stop_manageai_server()
+            self._stop_manageai_server(timeout=SERVER_STOP_TIMEOUT)
+            # Drop queued work; a task already running finishes in the background
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            # Release pooled HTTP connections
+            if self.http_session is not None:
+                self.http_session.close()
             # Destroy the window
             self.root.destroy()
         except Exception as e:
@@ -1126,68 +1860,125 @@ class ResumeRebuilderApp:
 
     def browse_pdf_file(self, path_var):
         """Open file dialog to select a PDF file and set it to the provided StringVar."""
-        filetypes = [("PDF files", "*.pdf"), ("All files", "*.*")]
-        filename = filedialog.askopenfilename(title="Select PDF File", filetypes=filetypes)
+        filename = self._browse(filedialog.askopenfilename, title="Select PDF File", filetypes=PDF_FILETYPES)
         
         if filename:
             path_var.set(filename)
     
     def browse_output_location_for_var(self, path_var):
         """Open file dialog to select output location and set it to the provided StringVar."""
-        filetypes = [("PDF files", "*.pdf"), ("All files", "*.*")]
-        filename = filedialog.asksaveasfilename(title="Save PDF As", filetypes=filetypes, defaultextension=".pdf")
+        filename = self._browse(
+            filedialog.asksaveasfilename, title="Save PDF As", filetypes=PDF_FILETYPES, defaultextension=".pdf"
+        )
         
         if filename:
             path_var.set(filename)
     
+    def _stat_pdf(self, path):
+        """
+        Look up the size and file name of a PDF with a single stat call.
+        
+        Args:
+            path: Path to the PDF file
+            
+        Returns:
+            (size in bytes, file name) tuple, or None if the file doesn't exist
+        """
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        cached = self._pdf_stat_cache.get(path)
+        if cached is None or cached[0] != st.st_mtime:
+            cached = (st.st_mtime, st.st_size, os.path.basename(path))
+            self._pdf_stat_cache[path] = cached
+        return cached[1], cached[2]
+    
+    def _pdf_digest(self, path):
+        """
+        Hash a PDF for the analysis cache, rehashing only after the file has changed.
+        
+        Args:
+            path: Path to the PDF file
+            
+        Returns:
+            Hex SHA-256 digest of the file contents
+        """
+        st = os.stat(path)
+        cached = self._pdf_digests.get(path)
+        if cached is None or cached[:2] != (st.st_mtime_ns, st.st_size):
+            cached = (st.st_mtime_ns, st.st_size, analysis_cache.file_digest(path))
+            self._pdf_digests[path] = cached
+        return cached[2]
+    
     def analyze_pdf_structure(self):
         """Analyze the structure of the selected PDF for content replacement."""
         pdf_path = self.replace_pdf_path_var.get()
         
-        if not pdf_path or not os.path.exists(pdf_path):
+        if not pdf_path or self._stat_pdf(pdf_path) is None:
             messagebox.showerror("Error", "Please select a valid PDF file first.")
             return
         
-        try:
-            self.status_var.set("Analyzing PDF structure...")
-            self.root.update_idletasks()
-            
-            # Configure the PDF replacer based on UI selections
-            self.pdf_replacer.use_enhanced = True
-            self.pdf_replacer.use_ocr = self.use_ocr_var.get()
-            self.pdf_replacer.use_direct = self.use_direct_var.get() and self.has_pymupdf
-            
-            # Analyze the structure
-            structure = self.pdf_replacer.analyze_structure(pdf_path)
-            
-            # Format the result for display
-            result_text = "PDF Structure Analysis:\n\n"
+        self.status_var.set("Analyzing PDF structure...")
+        
+        # Configure the PDF replacer based on UI selections
+        use_ocr = self.use_ocr_var.get()
+        use_direct = self.use_direct_var.get() and self.has_pymupdf
+        self.pdf_replacer.use_enhanced = True
+        self.pdf_replacer.use_ocr = use_ocr
+        self.pdf_replacer.use_direct = use_direct
+        self.pdf_replacer.backend = 'pymupdf' if self.has_pymupdf else 'pdfminer'
+        
+        def on_done(structure):
+            # Format the result for display, joining the lines once at the end
+            parts = ["PDF Structure Analysis:", "", "Detected Sections:"]
             
             # Add sections info
-            result_text += "Detected Sections:\n"
-            for section_name, section_data in structure.get('sections', {}).items():
-                word_count = len(section_data.get('content', '').split())
-                result_text += f"• {section_name}: {word_count} words\n"
+            parts.extend(
+                f"• {section_name}: {sum(1 for _ in _WORD_RE.finditer(section_data.get('content', '')))} words"
+                for section_name, section_data in structure.get('sections', {}).items()
+            )
             
             # Add layout info
-            result_text += "\nLayout Information:\n"
-            result_text += f"• Pages: {structure.get('page_count', 0)}\n"
-            result_text += f"• Text blocks: {structure.get('text_block_count', 0)}\n"
-            result_text += f"• Detected format: {structure.get('format_type', 'Standard')}\n"
+            parts += [
+                "",
+                "Layout Information:",
+                f"• Pages: {structure.get('page_count', 0)}",
+                f"• Text blocks: {structure.get('text_block_count', 0)}",
+                f"• Detected format: {structure.get('format_type', 'Standard')}",
+            ]
             
             # Add strategy info
-            result_text += f"\nSelected Strategy: {'PyMuPDF Direct' if self.use_direct_var.get() and self.has_pymupdf else 'Enhanced PDF Processing'}"
-            result_text += f"\nOCR Enabled: {'Yes' if self.use_ocr_var.get() else 'No'}"
+            parts += [
+                "",
+                f"Selected Strategy: {'PyMuPDF Direct' if use_direct else 'Enhanced PDF Processing'}",
+                f"OCR Enabled: {'Yes' if use_ocr else 'No'}",
+            ]
+            result_text = "\n".join(parts)
             
             # Update the results text
-            self.replace_results_text.delete(1.0, tk.END)
-            self.replace_results_text.insert(tk.END, result_text)
+            self.replace_results_text.bulk_replace(result_text)
             
             self.status_var.set("PDF structure analysis complete.")
-            
-        except Exception as e:
+        
+        def on_error(e):
             self.status_var.set(f"Error: {str(e)}")
             messagebox.showerror("Error", f"Failed to analyze PDF structure: {str(e)}")
+        
+        backend = self.pdf_replacer.backend
+        
+        def analyze():
+            # The same file analyzed with the same options gives the same structure
+            cache_key = analysis_cache.make_key(
+                "structure", self._pdf_digest(pdf_path), use_ocr, use_direct, backend
+            )
+            structure = analysis_cache.get(cache_key)
+            if structure is None:
+                structure = self.pdf_replacer.analyze_structure(pdf_path)
+                analysis_cache.put(cache_key, structure)
+            return structure
+        
+        self._run_async(analyze, on_done, on_error, button=self.analyze_pdf_button)
     
     def replace_pdf_content(self):
         """Replace content in the PDF while preserving formatting."""
@@ -1195,7 +1986,7 @@ class ResumeRebuilderApp:
         output_pdf = self.replace_output_path_var.get()
         job_text = self.replace_job_text.get(1.0, tk.END).strip()
         
-        if not input_pdf or not os.path.exists(input_pdf):
+        if not input_pdf or self._stat_pdf(input_pdf) is None:
             messagebox.showerror("Error", "Please select a valid input PDF file.")
             return
             
@@ -1208,102 +1999,140 @@ class ResumeRebuilderApp:
             response = messagebox.askyesno("PDF Not Loaded", 
                                         "You haven't loaded the PDF content yet. Would you like to load it now?")
             if response:
-                self.load_pdf_for_replacement()
-                if not hasattr(self, 'pdf_replacement_content'):
-                    return  # Loading failed
-            else:
-                return  # User cancelled
+                # Carry on with the replacement once the content has loaded
+                self.load_pdf_for_replacement(on_loaded=self.replace_pdf_content)
+            return
         
-        try:
-            self.status_var.set("Replacing PDF content...")
-            self.root.update_idletasks()
-            
-            # Configure the PDF replacer based on UI selections
-            self.pdf_replacer.use_enhanced = True
-            self.pdf_replacer.use_ocr = self.use_ocr_var.get()
-            self.pdf_replacer.use_direct = self.use_direct_var.get() and self.has_pymupdf
-            self.pdf_replacer.use_llm = True  # Always use LLM for content improvement
-            
+        self.status_var.set("Replacing PDF content...")
+        
+        # Configure the PDF replacer based on UI selections
+        self.pdf_replacer.use_enhanced = True
+        self.pdf_replacer.use_ocr = self.use_ocr_var.get()
+        self.pdf_replacer.use_direct = self.use_direct_var.get() and self.has_pymupdf
+        self.pdf_replacer.use_llm = True  # Always use LLM for content improvement
+        
+        replacement_content = getattr(self, 'pdf_replacement_content', None)
+        
+        def replace():
             # Process the replacement - use the pre-loaded content if available
-            if hasattr(self, 'pdf_replacement_content'):
-                result = self.pdf_replacer.replace_content_with_data(
-                    input_path=input_pdf,
-                    output_path=output_pdf,
-                    content=self.pdf_replacement_content,
-                    job_description=job_text if job_text else None
-                )
-            else:
-                # Fallback to original method
-                result = self.pdf_replacer.replace_content(
+            if replacement_content is not None:
+                return self.pdf_replacer.replace_content_with_data(
                     input_path=input_pdf,
                     output_path=output_pdf,
+                    content=replacement_content,
                     job_description=job_text if job_text else None
                 )
             
-            if result and os.path.exists(output_pdf):
-                self.status_var.set("PDF content replacement complete.")
-                
-                # Show success details
-                message = (
-                    f"PDF content has been successfully replaced and saved to:\n\n"
-                    f"{output_pdf}\n\n"
-                    f"Would you like to open the file now?"
-                )
-                
-                if messagebox.askyesno("Success", message):
-                    # Open the PDF with the system's default PDF viewer
+            # Fallback to original method
+            return self.pdf_replacer.replace_content(
+                input_path=input_pdf,
+                output_path=output_pdf,
+                job_description=job_text if job_text else None
+            )
+        
+        def on_done(result):
+            if not (result and os.path.exists(output_pdf)):
+                on_error(Exception("PDF processing completed but the output file was not created."))
+                return
+            
+            self.status_var.set("PDF content replacement complete.")
+            
+            # Show success details
+            message = (
+                f"PDF content has been successfully replaced and saved to:\n\n"
+                f"{output_pdf}\n\n"
+                f"Would you like to open the file now?"
+            )
+            
+            if messagebox.askyesno("Success", message):
+                # Open the PDF with the system's default PDF viewer. The viewer is
+                # started directly rather than through a shell, so the path needs no
+                # quoting and the GUI doesn't wait on it.
+                try:
                     if sys.platform == "darwin":  # macOS
-                        os.system(f"open '{output_pdf}'")
+                        subprocess.Popen(["open", output_pdf])
                     elif sys.platform == "win32":  # Windows
-                        os.system(f'start "" "{output_pdf}"')
+                        os.startfile(output_pdf)
                     else:  # Linux/Unix
-                        os.system(f"xdg-open '{output_pdf}'")
-            else:
-                raise Exception("PDF processing completed but the output file was not created.")
-                
-        except Exception as e:
+                        subprocess.Popen(["xdg-open", output_pdf])
+                except OSError as e:
+                    messagebox.showerror("Error", f"Could not open the PDF: {str(e)}")
+        
+        def on_error(e):
             self.status_var.set(f"Error: {str(e)}")
             messagebox.showerror("Error", f"Failed to replace PDF content: {str(e)}")
+        
+        self._run_async(replace, on_done, on_error, button=self.replace_pdf_button)
     
-    def load_pdf_for_replacement(self):
-        """Load and extract content from the selected PDF for replacement."""
+    def load_pdf_for_replacement(self, on_loaded=None):
+        """
+        Load the selected PDF for replacement.
+        
+        Only a summary of the file is kept; its text is read one page at a time
+        and the full parse happens when the content is replaced.
+        
+        Args:
+            on_loaded: Optional callback run on the Tk thread once the content is loaded
+        """
         pdf_path = self.replace_pdf_path_var.get()
+        pdf_stat = self._stat_pdf(pdf_path) if pdf_path else None
         
-        if not pdf_path or not os.path.exists(pdf_path):
+        if pdf_stat is None:
             messagebox.showerror("Error", "Please select a valid PDF file first.")
             return
-        
-        try:
-            self.status_var.set("Loading PDF content...")
-            self.root.update_idletasks()
-            
-            # Configure the PDF replacer based on UI selections
-            self.pdf_replacer.use_enhanced = True
-            self.pdf_replacer.use_ocr = self.use_ocr_var.get()
-            self.pdf_replacer.use_direct = self.use_direct_var.get() and self.has_pymupdf
-            
-            # Extract the content
-            content = self.pdf_replacer.extract_content(pdf_path)
-            
+        size, base = pdf_stat
+        
+        self.status_var.set("Loading PDF content...")
+        
+        # Configure the PDF replacer based on UI selections
+        use_ocr = self.use_ocr_var.get()
+        use_direct = self.use_direct_var.get() and self.has_pymupdf
+        backend = 'pymupdf' if self.has_pymupdf else 'pdfminer'
+        self.pdf_replacer.use_enhanced = True
+        self.pdf_replacer.use_ocr = use_ocr
+        self.pdf_replacer.use_direct = use_direct
+        self.pdf_replacer.backend = backend
+        
+        def load():
+            # Reloading the same file with the same options gives the same summary
+            sha = self._pdf_digest(pdf_path)
+            cache_key = analysis_cache.make_key("content", sha, use_ocr, backend)
+            content = analysis_cache.get(cache_key)
+            if content is None:
+                content = {'sha': sha, 'page_count': 0, 'char_count': 0, 'word_count': 0}
+                for page_text in self.pdf_replacer.iter_page_text(pdf_path):
+                    content['page_count'] += 1
+                    content['char_count'] += len(page_text)
+                    content['word_count'] += sum(1 for _ in _WORD_RE.finditer(page_text))
+                analysis_cache.put(cache_key, content)
+            # An identical copy of the file may have been cached under another path
+            return dict(content, pdf_path=pdf_path)
+        
+        def on_done(content):
             # Show content summary
             result_text = "PDF Content Loaded Successfully:\n\n"
-            result_text += f"• File: {os.path.basename(pdf_path)}\n"
-            result_text += f"• Size: {os.path.getsize(pdf_path) / 1024:.1f} KB\n"
-            result_text += f"• Content extracted: {len(content)} characters\n"
+            result_text += f"• File: {base}\n"
+            result_text += f"• Size: {size / 1024:.1f} KB\n"
+            result_text += f"• Pages: {content['page_count']}\n"
+            result_text += f"• Content extracted: {content['char_count']} characters, {content['word_count']} words\n"
             result_text += "\nYou can now analyze the structure or replace the content."
             
             # Update the results text
-            self.replace_results_text.delete(1.0, tk.END)
-            self.replace_results_text.insert(tk.END, result_text)
+            self.replace_results_text.bulk_replace(result_text)
             
             self.status_var.set("PDF content loaded successfully.")
             
-            # Store the extracted content for later use
+            # Store the file summary for the replacement step
             self.pdf_replacement_content = content
             
-        except Exception as e:
+            if on_loaded is not None:
+                on_loaded()
+        
+        def on_error(e):
             self.status_var.set(f"Error: {str(e)}")
             messagebox.showerror("Error", f"Failed to load PDF content: {str(e)}")
+        
+        self._run_async(load, on_done, on_error, button=self.load_pdf_button)
 
     def setup_chat_workspace_tab(self):
         """Setup the unified Chat Workspace tab with enhanced components."""
@@ -1479,7 +2308,7 @@ class ResumeRebuilderApp:
         ttk.Button(pdf_controls, text="Save Changes", command=self.save_workspace_changes).pack(side=tk.LEFT, padx=5)
         
         # PDF display area (placeholder for now)
-        self.pdf_display = scrolledtext.ScrolledText(
+        self.pdf_display = FastScrolledText(
             pdf_frame,
             wrap=tk.WORD,
             height=20,
@@ -1509,7 +2338,7 @@ class ResumeRebuilderApp:
         ttk.Button(section_controls, text="Reorder", command=self.reorder_sections).pack(side=tk.LEFT, padx=2)
         
         # Content editor
-        self.content_editor = scrolledtext.ScrolledText(
+        self.content_editor = FastScrolledText(
             edit_frame,
             wrap=tk.WORD,
             height=15
@@ -1633,7 +2462,7 @@ class ResumeRebuilderApp:
         """Load a resume for the workspace."""
         filename = filedialog.askopenfilename(
             title="Select Resume PDF",
-            filetypes=[("PDF files", "*.pdf"), ("All files", "*.*")]
+            filetypes=PDF_FILETYPES
         )
         
         if filename:
@@ -1646,15 +2475,10 @@ class ResumeRebuilderApp:
                     analysis = self.pdf_replacer.analyze_resume(filename)
                     self.workspace_resume_content = analysis.get('basic_resume', 'Could not extract content')
                     
-                    # Update PDF display
-                    self.pdf_display.config(state=tk.NORMAL)
-                    self.pdf_display.delete(1.0, tk.END)
-                    self.pdf_display.insert(tk.END, str(self.workspace_resume_content))
-                    self.pdf_display.config(state=tk.DISABLED)
-                    
-                    # Update content editor
-                    self.content_editor.delete(1.0, tk.END)
-                    self.content_editor.insert(tk.END, str(self.workspace_resume_content))
+                    # Update PDF display and content editor
+                    resume_text = str(self.workspace_resume_content)
+                    self.pdf_display.bulk_replace(resume_text)
+                    self.content_editor.bulk_replace(resume_text)
                     
                     self.status_var.set("Resume loaded successfully")
                     self.add_chat_message("System", f"Resume loaded: {os.path.basename(filename)}")
@@ -1668,10 +2492,7 @@ class ResumeRebuilderApp:
     def refresh_pdf_preview(self):
         """Refresh the PDF preview with current content."""
         if self.workspace_resume_content:
-            self.pdf_display.config(state=tk.NORMAL)
-            self.pdf_display.delete(1.0, tk.END)
-            self.pdf_display.insert(tk.END, str(self.workspace_resume_content))
-            self.pdf_display.config(state=tk.DISABLED)
+            self.pdf_display.bulk_replace(str(self.workspace_resume_content))
             self.status_var.set("Preview refreshed")
 
     def save_workspace_changes(self):
@@ -1689,7 +2510,7 @@ class ResumeRebuilderApp:
             output_path = filedialog.asksaveasfilename(
                 title="Save Resume As",
                 defaultextension=".pdf",
-                filetypes=[("PDF files", "*.pdf"), ("All files", "*.*")]
+                filetypes=PDF_FILETYPES
             )
             
             if output_path:
@@ -1824,7 +2645,7 @@ class ResumeRebuilderApp:
             filename = filedialog.asksaveasfilename(
                 title="Export Workspace Session",
                 defaultextension=".json",
-                filetypes=[("JSON files", "*.json"), ("All files", "*.*")]
+                filetypes=JSON_FILETYPES
             )
             
             if filename:
@@ -1863,7 +2684,7 @@ class ResumeRebuilderApp:
             
             filename = filedialog.askopenfilename(
                 title="Import Workspace Session",
-                filetypes=[("JSON files", "*.json"), ("All files", "*.*")]
+                filetypes=JSON_FILETYPES
             )
             
             if filename:
@@ -2047,17 +2868,22 @@ Please provide specific, actionable advice for improving this resume. Focus on:
 
 def main():
     """Main function to start the application."""
+    for name in QUIET_LOGGERS:
+        logging.getLogger(name).setLevel(logging.ERROR)
+    
     root = tk.Tk()
-    app = ResumeRebuilderApp(root)
     
-    # Set up a more modern style
-    style = ttk.Style()
+    # Set up a more modern style before any widgets exist; switching the theme
+    # afterwards makes Tk restyle and re-lay out every widget already built
+    style = ttk.Style(root)
     if 'clam' in style.theme_names():
         style.theme_use('clam')
     
     # Define custom styles
     style.configure("Accent.TButton", font=("", 10, "bold"))
     
+    app = ResumeRebuilderApp(root)
+    
     root.mainloop()
 
 
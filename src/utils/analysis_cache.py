@@ -0,0 +1,132 @@
+"""
+Analysis cache for the Resume Rebuilder application.
+
+Stores the results of slow resume extraction, PDF analysis and job analysis
+calls, keyed by a hash of their inputs, so repeating them with the same PDF or
+job description skips the parsing and LLM round trips. Results are kept on disk
+with diskcache when it is installed, and in memory for the current session
+otherwise.
+"""
+
+import os
+import copy
+import hashlib
+import logging
+from collections import OrderedDict
+from typing import Any, Optional
+
+try:
+    import diskcache
+    DISKCACHE_AVAILABLE = True
+except ImportError:
+    DISKCACHE_AVAILABLE = False
+
+# Set up logger
+logger = logging.getLogger(__name__)
+
+# Where cached results are stored and how long they are kept (7 days)
+CACHE_DIR = os.path.join(".cache", "resume_analysis")
+CACHE_EXPIRE = 7 * 24 * 60 * 60
+
+# Number of results kept by the in-memory fallback, least recently used dropped first
+MEMORY_CACHE_SIZE = 16
+
+_disk_cache = None
+_memory_cache = OrderedDict()
+
+def _get_disk_cache():
+    """Open the disk cache on first use."""
+    global _disk_cache
+    if _disk_cache is None:
+        _disk_cache = diskcache.Cache(CACHE_DIR)
+    return _disk_cache
+
+def file_digest(path: str) -> str:
+    """
+    Hash the contents of a file.
+    
+    Args:
+        path: Path to the file
+        
+    Returns:
+        Hex SHA-256 digest of the file contents
+    """
+    with open(path, 'rb') as f:
+        # Python 3.11+ hashes the file in C with a reused buffer
+        if hasattr(hashlib, 'file_digest'):
+            return hashlib.file_digest(f, 'sha256').hexdigest()
+        digest = hashlib.sha256()
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def data_digest(data: bytes) -> str:
+    """
+    Hash data that is already in memory, such as the contents of a file.
+    
+    Args:
+        data: Bytes to hash
+        
+    Returns:
+        Hex SHA-256 digest of the data
+    """
+    return hashlib.sha256(data).hexdigest()
+
+def make_key(*parts: Any) -> str:
+    """
+    Build a cache key from the inputs of an operation.
+    
+    Args:
+        *parts: Values the cached result depends on; they are hashed by their str()
+        
+    Returns:
+        Hex SHA-256 digest identifying the inputs
+    """
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(str(part).encode('utf-8'))
+        digest.update(b'\0')
+    return digest.hexdigest()
+
+def get(key: str) -> Optional[Any]:
+    """
+    Look up a cached result.
+    
+    Args:
+        key: Key built with make_key
+        
+    Returns:
+        The cached value, or None if there is none. Each call returns a new
+        copy, so callers may modify it
+    """
+    if DISKCACHE_AVAILABLE:
+        try:
+            return _get_disk_cache().get(key)
+        except Exception as e:
+            logger.warning(f"Error reading analysis cache: {e}")
+            return None
+    if key not in _memory_cache:
+        return None
+    _memory_cache.move_to_end(key)
+    # Like an unpickled disk entry, hand out a copy the caller can change freely
+    return copy.deepcopy(_memory_cache[key])
+
+def put(key: str, value: Any) -> None:
+    """
+    Store a result in the cache.
+    
+    Args:
+        key: Key built with make_key
+        value: Picklable value to store
+    """
+    if DISKCACHE_AVAILABLE:
+        try:
+            _get_disk_cache().set(key, value, expire=CACHE_EXPIRE)
+        except Exception as e:
+            logger.warning(f"Error writing analysis cache: {e}")
+        return
+    # Later changes the caller makes to value must not reach the cache
+    _memory_cache[key] = copy.deepcopy(value)
+    _memory_cache.move_to_end(key)
+    while len(_memory_cache) > MEMORY_CACHE_SIZE:
+        _memory_cache.popitem(last=False)
@@ -5,6 +5,8 @@ API Client module for communicating with resume-related web services.
 import os
 import json
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from urllib.parse import urljoin
 import logging
 from src.utils.env_loader import get_api_key, get_setting
@@ -14,29 +16,73 @@ logging.basicConfig(level=logging.INFO,
                     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Connection pool sizing for the shared session: a handful of hosts at most,
+# with a few concurrent requests each from the GUI worker threads
+POOL_CONNECTIONS = 4
+POOL_MAXSIZE = 16
+
+# Failed connections and 502/503/504 responses are retried with a short backoff
+MAX_RETRIES = 2
+RETRY_BACKOFF = 0.3
+
+# Request timeout in seconds unless configured otherwise
+DEFAULT_TIMEOUT = 30
+
+# The health check only needs the server to answer, so it gives up sooner
+CONNECTION_TEST_TIMEOUT = 3
+
+def make_session(retries=True):
+    """
+    Create a keep-alive HTTP session with pooled connections and retries.
+    
+    Args:
+        retries: Retry failed connections and 502/503/504 responses; off for
+            health checks, so their timeout bounds the whole wait
+    
+    Returns:
+        requests.Session to share between the clients talking to the same hosts
+    """
+    session = requests.Session()
+    max_retries = 0
+    if retries:
+        max_retries = Retry(total=MAX_RETRIES, backoff_factor=RETRY_BACKOFF, status_forcelist=(502, 503, 504))
+    adapter = HTTPAdapter(pool_connections=POOL_CONNECTIONS, pool_maxsize=POOL_MAXSIZE, max_retries=max_retries)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
 class APIClient:
     """Client for interacting with resume API endpoints."""
     
-    def __init__(self, base_url=None, api_key=None):
+    def __init__(self, base_url=None, api_key=None, session=None):
         """
         Initialize the API client.
         
         Args:
             base_url: Base URL for the API endpoints
             api_key: API key for authentication
+            session: Optional shared session from make_session; a new one is made if omitted
         """
         self.base_url = base_url or get_setting("RESUME_API_URL", "http://localhost:8080/")
         self.api_key = api_key or get_api_key("RESUME_API_KEY", "")
+        self.timeout = DEFAULT_TIMEOUT
         
         # Ensure base_url ends with a slash
         if not self.base_url.endswith('/'):
             self.base_url += '/'
         
+        # One keep-alive session for the lifetime of the client, so repeated
+        # calls reuse the TCP/TLS connection instead of reconnecting each time
+        self.session = session or make_session()
+        
+        # Health checks get their own session without retries, see test_connection
+        self._check_session = None
+        
         logger.info(f"Initialized API client with base URL: {self.base_url}")
         if not self.api_key:
             logger.warning("No API key provided. Some endpoints may require authentication.")
     
-    def _make_request(self, method, endpoint, data=None, params=None, files=None, timeout=30):
+    def _make_request(self, method, endpoint, data=None, params=None, files=None, timeout=None):
         """
         Make a request to the API.
         
@@ -46,7 +92,7 @@ class APIClient:
             data: Data to send in the request body
             params: Query parameters to include
             files: Files to upload
-            timeout: Request timeout in seconds
+            timeout: Request timeout in seconds; the client's timeout setting if omitted
             
         Returns:
             Response data as dictionary
@@ -55,6 +101,8 @@ class APIClient:
             Exception: If the request fails
         """
         url = urljoin(self.base_url, endpoint)
+        if timeout is None:
+            timeout = self.timeout
         headers = {
             'Authorization': f'Bearer {self.api_key}' if self.api_key else None,
             'Accept': 'application/json',
@@ -67,21 +115,21 @@ class APIClient:
             logger.debug(f"Making {method} request to {url}")
             
             if method.upper() == 'GET':
-                response = requests.get(url, params=params, headers=headers, timeout=timeout)
+                response = self.session.get(url, params=params, headers=headers, timeout=timeout)
             elif method.upper() == 'POST':
                 if files:
                     # Don't include Content-Type header when using files
                     if 'Content-Type' in headers:
                         del headers['Content-Type']
-                    response = requests.post(url, data=data, files=files, headers=headers, timeout=timeout)
+                    response = self.session.post(url, data=data, files=files, headers=headers, timeout=timeout)
                 else:
                     headers['Content-Type'] = 'application/json'
-                    response = requests.post(url, json=data, headers=headers, timeout=timeout)
+                    response = self.session.post(url, json=data, headers=headers, timeout=timeout)
             elif method.upper() == 'PUT':
                 headers['Content-Type'] = 'application/json'
-                response = requests.put(url, json=data, headers=headers, timeout=timeout)
+                response = self.session.put(url, json=data, headers=headers, timeout=timeout)
             elif method.upper() == 'DELETE':
-                response = requests.delete(url, headers=headers, timeout=timeout)
+                response = self.session.delete(url, headers=headers, timeout=timeout)
             else:
                 raise ValueError(f"Unsupported HTTP method: {method}")
             
@@ -208,6 +256,14 @@ class APIClient:
         if api_key:
             self.api_key = api_key
             
+    def reset_to_defaults(self):
+        """Reset the URL, API key and timeout to their environment defaults."""
+        self.base_url = get_setting("RESUME_API_URL", "http://localhost:8080/")
+        if not self.base_url.endswith('/'):
+            self.base_url += '/'
+        self.api_key = get_api_key("RESUME_API_KEY", "")
+        self.timeout = DEFAULT_TIMEOUT
+    
     def set_api_key(self, api_key):
         """
         Set or update the API key.
@@ -257,7 +313,10 @@ class APIClient:
             headers = {k: v for k, v in headers.items() if v is not None}
             
             logger.info(f"Testing connection to {url}")
-            response = requests.get(url, headers=headers, timeout=10)
+            # Retries on the main session would multiply the timeout
+            if self._check_session is None:
+                self._check_session = make_session(retries=False)
+            response = self._check_session.get(url, headers=headers, timeout=CONNECTION_TEST_TIMEOUT)
             
             # Return True if the status code is 2xx (success)
             return 200 <= response.status_code < 300
@@ -3,8 +3,37 @@ Job Analyzer module for comparing resumes against job descriptions.
 """
 
 import re
+import functools
 from collections import Counter
 
+# RE2 matches in linear time, which matters for the long keyword alternations
+# built below; the standard library engine is used when it isn't installed.
+# Patterns use inline (?i) flags so they compile the same way on either engine.
+try:
+    import re2 as regex_engine
+    RE2_AVAILABLE = True
+except ImportError:
+    regex_engine = re
+    RE2_AVAILABLE = False
+
+# TF-IDF scoring of job description terms runs in scikit-learn's compiled code;
+# without it the most frequent words are counted in Python instead
+try:
+    import numpy as np
+    from sklearn.feature_extraction.text import TfidfVectorizer
+    SKLEARN_AVAILABLE = True
+except ImportError:
+    SKLEARN_AVAILABLE = False
+
+# Compiled keyword patterns kept per analyzer, keyed by the keyword set
+KEYWORD_RE_CACHE_SIZE = 32
+
+# Compiled single-keyword patterns, shared by all analyzers
+SINGLE_KEYWORD_RE_CACHE_SIZE = 1024
+
+# Number of job description terms added to the matched skills as keywords
+TOP_TERMS = 20
+
 class JobAnalyzer:
     """Class for analyzing job descriptions and comparing them to resumes."""
     
@@ -44,6 +73,31 @@ class JobAnalyzer:
             'other', 'some', 'such', 'no', 'nor', 'not', 'only', 'own', 'same', 'so',
             'than', 'too', 'very', 'can', 'will', 'just', 'should', 'now'
         }
+        self._skill_res = [regex_engine.compile(r'(?i)\b' + pattern + r'\b') for pattern in self.skill_patterns]
+        self._keyword_res = {}
+    
+    def _keyword_re(self, keywords):
+        """
+        Get a single compiled pattern matching any of the given keywords.
+        
+        Args:
+            keywords: Iterable of keyword strings
+            
+        Returns:
+            Compiled pattern, cached for repeated analyses of the same job
+        """
+        key = frozenset(keywords)
+        keyword_re = self._keyword_res.get(key)
+        if keyword_re is None:
+            # Longest first so a phrase wins over a keyword it starts with
+            alternatives = sorted(key, key=lambda k: (-len(k), k))
+            keyword_re = regex_engine.compile(
+                r'(?i)\b(?:' + '|'.join(regex_engine.escape(k) for k in alternatives) + r')\b'
+            )
+            if len(self._keyword_res) >= KEYWORD_RE_CACHE_SIZE:
+                self._keyword_res.clear()
+            self._keyword_res[key] = keyword_re
+        return keyword_re
     
     def analyze(self, job_description, resume_content):
         """
@@ -58,41 +112,64 @@ class JobAnalyzer:
                 - list of relevant keywords found in the job description
                 - list of suggestions for improving the resume
         """
-        # Extract relevant keywords from job description
-        job_keywords = self._extract_keywords(job_description)
-        
         # Convert resume content to string for analysis
         resume_text = str(resume_content)
         
-        # Check which keywords from job are present in resume
-        missing_keywords = []
-        present_keywords = []
+        # Extract relevant keywords from job description
+        job_keywords = self._extract_keywords(job_description, resume_text)
         
-        for keyword in job_keywords:
-            if re.search(r'\b' + re.escape(keyword) + r'\b', resume_text, re.IGNORECASE):
-                present_keywords.append(keyword)
-            else:
-                missing_keywords.append(keyword)
+        # Check which keywords from job are present in resume
+        present_keywords, missing_keywords = self._match_keywords(job_keywords, resume_text)
         
         # Generate suggestions based on analysis
         suggestions = self._generate_suggestions(job_keywords, present_keywords, missing_keywords, job_description, resume_text)
         
         return (job_keywords, suggestions)
     
-    def _extract_keywords(self, text):
-        """Extract important keywords from text."""
+    def _match_keywords(self, keywords, resume_text):
+        """
+        Split keywords into those found in the resume and those missing from it.
+        
+        Args:
+            keywords: List of keyword strings
+            resume_text: Resume text to search
+            
+        Returns:
+            (present, missing) tuple of keyword lists, each in the order given
+        """
+        # One pass over the resume for all keywords. Matches of the alternation
+        # don't overlap, so it only settles the keywords it returned; the rest
+        # are confirmed with their own pattern, unless nothing matched at all.
+        found = set()
+        if keywords:
+            found = {match.group(0).lower() for match in self._keyword_re(keywords).finditer(resume_text)}
+        
+        present = []
+        missing = []
+        for keyword in keywords:
+            if keyword.lower() in found or (found and _single_keyword_re(keyword).search(resume_text)):
+                present.append(keyword)
+            else:
+                missing.append(keyword)
+        return present, missing
+    
+    def _extract_keywords(self, text, resume_text=None):
+        """Extract important keywords from text, weighed against the resume text if given."""
         # Find all skill matches
         skill_matches = []
-        for pattern in self.skill_patterns:
-            matches = re.findall(r'\b' + pattern + r'\b', text, re.IGNORECASE)
+        for skill_re in self._skill_res:
+            matches = skill_re.findall(text)
             skill_matches.extend([match for match in matches])
         
-        # Count word frequency in text (excluding stop words)
-        words = re.findall(r'\b[a-zA-Z][a-zA-Z0-9+#-.]+\b', text.lower())
-        word_counts = Counter([word for word in words if word not in self.stop_words and len(word) > 2])
-        
-        # Get most frequent words (likely to be important)
-        common_words = [word for word, count in word_counts.most_common(20) if count > 1]
+        if SKLEARN_AVAILABLE and resume_text is not None:
+            common_words = self._top_tfidf_terms(text, resume_text)
+        else:
+            # Count word frequency in text (excluding stop words)
+            words = re.findall(r'\b[a-zA-Z][a-zA-Z0-9+#-.]+\b', text.lower())
+            word_counts = Counter([word for word in words if word not in self.stop_words and len(word) > 2])
+            
+            # Get most frequent words (likely to be important)
+            common_words = [word for word, count in word_counts.most_common(TOP_TERMS) if count > 1]
         
         # Combine skill matches with common words for final keywords list
         keywords = list(set([s.strip() for s in skill_matches]))
@@ -100,6 +177,37 @@ class JobAnalyzer:
         
         return keywords
     
+    def _top_tfidf_terms(self, job_text, resume_text):
+        """
+        Find the highest scoring terms of a job description with TF-IDF.
+        
+        The resume is the second document of the corpus, so terms the job
+        description shares with it score lower than terms unique to the job.
+        
+        Args:
+            job_text: Job description text
+            resume_text: Resume text
+            
+        Returns:
+            Up to TOP_TERMS terms (words and two-word phrases), highest score first
+        """
+        vectorizer = TfidfVectorizer(ngram_range=(1, 2), max_features=10000, stop_words='english')
+        try:
+            matrix = vectorizer.fit_transform([job_text, resume_text])
+        except ValueError:
+            # Nothing but stop words in either text
+            return []
+        
+        scores = matrix[0].toarray().ravel()
+        if len(scores) > TOP_TERMS:
+            top = np.argpartition(-scores, TOP_TERMS)[:TOP_TERMS]
+        else:
+            top = np.arange(len(scores))
+        top = top[np.argsort(-scores[top])]
+        
+        terms = vectorizer.get_feature_names_out()
+        return [terms[i] for i in top if scores[i] > 0]
+    
     def _generate_suggestions(self, job_keywords, present_keywords, missing_keywords, job_description, resume_text):
         """Generate suggestions for improving the resume."""
         suggestions = []
@@ -143,4 +251,18 @@ class JobAnalyzer:
             suggestions.append("Tailor your resume to use similar language and terminology as the job description.")
             suggestions.append("Quantify your achievements with specific metrics and results when possible.")
         
-        return suggestions
\ No newline at end of file
+        return suggestions
+
+
+@functools.lru_cache(maxsize=SINGLE_KEYWORD_RE_CACHE_SIZE)
+def _single_keyword_re(keyword):
+    """
+    Get a compiled pattern matching one keyword as a whole word or phrase.
+    
+    Args:
+        keyword: Keyword string
+        
+    Returns:
+        Compiled case-insensitive pattern
+    """
+    return regex_engine.compile(r'(?i)\b' + regex_engine.escape(keyword) + r'\b')
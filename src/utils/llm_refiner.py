@@ -2,14 +2,21 @@
 LLM-based resume refinement module.
 
 This module uses your local ManageAI API to refine and improve extracted resume content.
+
+Prompts sent to a local LLM keep their fixed text at the start: the system
+prompt never varies, and in the user prompt the job description comes before
+the resume. LLM servers reuse the computed prefix of a prompt they have seen
+before, so keep new instructions in the constants below rather than
+interleaving them with the resume text, and bump PROMPT_VERSION when they change.
 """
 
 import os
+import re
 import json
 import logging
 import requests
 import time
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Iterator, Optional, List
 
 # Configure logging
 logging.basicConfig(
@@ -21,6 +28,29 @@ logger = logging.getLogger(__name__)
 # Default ManageAI API configuration
 DEFAULT_API_URL = "http://localhost:8080"
 
+# Sections sent in one batched request are wrapped in these tags; the response
+# is mapped back by the position in id, as titles need not be unique
+SECTION_TAG_TEMPLATE = '<section id="{index}" name="{title}">\n{content}\n</section>'
+SECTION_TAG_PATTERN = re.compile(r'<section id="(\d+)"[^>]*>\s*(.*?)\s*</section>', re.DOTALL)
+
+# Bump whenever the prompts below or the refinement requests change, so
+# cached refinement results made with the old prompts are not reused
+PROMPT_VERSION = 3
+
+# Instructions for refining a resume directly with a local LLM
+REFINE_SYSTEM_PROMPT = (
+    "You are an expert resume editor. Improve the wording, structure and impact of "
+    "the resume you are given without inventing experience. Keep every section title "
+    "and any <section id=\"...\" name=\"...\"> tags exactly as they are, and return only the "
+    "improved resume."
+)
+
+# Refining for a job: the same instructions plus tailoring, so the whole system
+# prompt stays a fixed prefix and the user prompt holds only the job and resume
+REFINE_FOR_JOB_SYSTEM_PROMPT = (
+    REFINE_SYSTEM_PROMPT + " Tailor the resume to the job description given before it."
+)
+
 
 class LLMRefiner:
     """
@@ -30,14 +60,29 @@ class LLMRefiner:
     and enhance the overall quality of extracted resume content.
     """
     
-    def __init__(self, api_url=None):
+    def __init__(self, api_url=None, api_key=None, model=None, batch=False, llm_adapter=None):
         """
         Initialize the LLM refiner with API settings.
         
         Args:
             api_url: URL to the ManageAI API (default: http://localhost:8080)
+            api_key: Optional API key, sent as a bearer token
+            model: Optional name of the model the API should use
+                (default: None, the API's configured model)
+            batch: Send all sections in one request, each wrapped in a
+                <section id="..." name="..."> tag, and map the tagged response
+                back onto the sections
+            llm_adapter: Optional LocalLLMAdapter that refine_resume_stream
+                streams the improved resume from
         """
         self.api_url = api_url or os.environ.get("MANAGERAI_API_URL", DEFAULT_API_URL)
+        self.model = model
+        self.batch = batch
+        self.llm_adapter = llm_adapter
+        
+        self.headers = {"Content-Type": "application/json"}
+        if api_key:
+            self.headers["Authorization"] = f"Bearer {api_key}"
         
         # Ensure API URL doesn't have a trailing slash
         if self.api_url.endswith('/'):
@@ -46,6 +91,12 @@ class LLMRefiner:
         logger.info(f"Initialized LLM Refiner with API URL: {self.api_url}")
         self._check_api_connection()
     
+    def _payload(self, **fields) -> Dict[str, Any]:
+        """Build a request body, adding the selected model if there is one."""
+        if self.model:
+            fields["model"] = self.model
+        return fields
+    
     def _check_api_connection(self):
         """Check if the ManageAI API is accessible."""
         try:
@@ -69,27 +120,100 @@ class LLMRefiner:
         Returns:
             Refined resume content
         """
-        # Create a deep copy to avoid modifying the original
-        from copy import deepcopy
-        refined_content = deepcopy(resume_content)
+        return self.apply_improved_text(resume_content, self.improve_text(resume_content, job_description))
+    
+    def improve_text(self, resume_content, job_description=None) -> Optional[str]:
+        """
+        Get the improved resume text from the ManageAI API.
+        
+        Unlike refine_resume, which falls back to a copy of the original,
+        this reports a failed refinement.
         
+        Args:
+            resume_content: Resume content object or text
+            job_description: Optional job description to tailor the resume for
+            
+        Returns:
+            Improved resume text for apply_improved_text, or None if refinement failed
+        """
         # Convert resume content to string if it's an object
         resume_text = self._extract_text(resume_content)
         
         if not resume_text:
             logger.error("No resume text could be extracted")
-            return refined_content
+            return None
         
         # If job description is provided, use the matching endpoint
         if job_description:
-            improved_resume = self._improve_resume_for_job(resume_text, job_description)
-        else:
-            # Otherwise, just analyze and improve the resume
-            improved_resume = self._analyze_and_improve_resume(resume_text)
+            return self._improve_resume_for_job(resume_text, job_description)
+        # Otherwise, just analyze and improve the resume
+        return self._analyze_and_improve_resume(resume_text)
+    
+    def refine_resume_stream(self, resume_content, job_description=None) -> Iterator[str]:
+        """
+        Refine the extracted resume content, yielding the improved text as it is generated.
+        
+        The text is streamed from the local LLM adapter when one is set; otherwise
+        (or if the local LLM returns nothing) the ManageAI API is used and the whole
+        text is yielded at once. Pass the joined text to apply_improved_text to get
+        the refined resume content.
+        
+        Args:
+            resume_content: Resume content object or text
+            job_description: Optional job description to tailor the resume for
+            
+        Yields:
+            Pieces of the improved resume text
+            
+        Raises:
+            IncompleteResponseError: If the local LLM's response broke off or was
+                truncated after part of it had been yielded; the text so far is
+                not a usable resume, see improve_text for the non-streaming path
+        """
+        resume_text = self._extract_text(resume_content)
+        if not resume_text:
+            logger.error("No resume text could be extracted")
+            return
+        
+        streamed = False
+        if self.llm_adapter:
+            system_prompt = REFINE_SYSTEM_PROMPT
+            user_prompt = f"RESUME:\n{resume_text}"
+            if job_description:
+                system_prompt = REFINE_FOR_JOB_SYSTEM_PROMPT
+                user_prompt = f"JOB DESCRIPTION:\n{job_description}\n\n{user_prompt}"
+            for chunk in self.llm_adapter.generate_stream(system_prompt, user_prompt):
+                streamed = True
+                yield chunk
+        
+        if not streamed:
+            if job_description:
+                improved_resume = self._improve_resume_for_job(resume_text, job_description)
+            else:
+                improved_resume = self._analyze_and_improve_resume(resume_text)
+            if improved_resume:
+                yield improved_resume
+    
+    def apply_improved_text(self, resume_content, improved_resume):
+        """
+        Build refined resume content from the improved resume text.
+        
+        Args:
+            resume_content: Original resume content object or text
+            improved_resume: Improved resume text, or None if refinement failed
+            
+        Returns:
+            Refined resume content; the original is not modified
+        """
+        # Create a deep copy to avoid modifying the original
+        from copy import deepcopy
+        refined_content = deepcopy(resume_content)
         
         if improved_resume:
-            # Update the resume content with the improved text
-            self._update_resume_content(refined_content, improved_resume)
+            # Update the resume content with the improved text, preferring the
+            # section tags of a batched request and falling back to the titles
+            if not (self.batch and self._update_tagged_sections(refined_content, improved_resume)):
+                self._update_resume_content(refined_content, improved_resume)
         else:
             logger.warning("Failed to get improved resume from API, returning original")
             
@@ -113,9 +237,14 @@ class LLMRefiner:
                     sections_text.append(contact_text)
             
             # Add each section's content
-            for section in resume_content.sections:
+            for index, section in enumerate(resume_content.sections):
                 if hasattr(section, 'title') and hasattr(section, 'content'):
-                    sections_text.append(f"{section.title}\n{section.content}")
+                    if self.batch:
+                        sections_text.append(SECTION_TAG_TEMPLATE.format(
+                            index=index, title=section.title.replace('"', "'"), content=section.content
+                        ))
+                    else:
+                        sections_text.append(f"{section.title}\n{section.content}")
                     
             return "\n\n".join(sections_text)
         
@@ -156,8 +285,8 @@ class LLMRefiner:
                 try:
                     analyze_response = requests.post(
                         analyze_url,
-                        json={"resume": resume_text},
-                        headers={"Content-Type": "application/json"},
+                        json=self._payload(resume=resume_text),
+                        headers=self.headers,
                         timeout=30
                     )
                     analyze_response.raise_for_status()
@@ -190,12 +319,12 @@ class LLMRefiner:
             
             improve_response = requests.post(
                 improve_url,
-                json={
-                    "resume": resume_text,
-                    "job_description": generic_job,
-                    "match_result": None
-                },
-                headers={"Content-Type": "application/json"},
+                json=self._payload(
+                    resume=resume_text,
+                    job_description=generic_job,
+                    match_result=None
+                ),
+                headers=self.headers,
                 timeout=60  # Longer timeout for improvement
             )
             improve_response.raise_for_status()
@@ -234,11 +363,11 @@ class LLMRefiner:
                 try:
                     match_response = requests.post(
                         match_url,
-                        json={
-                            "resume": resume_text,
-                            "job_description": job_description
-                        },
-                        headers={"Content-Type": "application/json"},
+                        json=self._payload(
+                            resume=resume_text,
+                            job_description=job_description
+                        ),
+                        headers=self.headers,
                         timeout=45  # Matching can take longer
                     )
                     match_response.raise_for_status()
@@ -262,12 +391,12 @@ class LLMRefiner:
             
             improve_response = requests.post(
                 improve_url,
-                json={
-                    "resume": resume_text,
-                    "job_description": job_description,
-                    "match_result": match_result if match_result.get("success", False) else None
-                },
-                headers={"Content-Type": "application/json"},
+                json=self._payload(
+                    resume=resume_text,
+                    job_description=job_description,
+                    match_result=match_result if match_result.get("success", False) else None
+                ),
+                headers=self.headers,
                 timeout=60  # Longer timeout for improvement
             )
             improve_response.raise_for_status()
@@ -287,6 +416,34 @@ class LLMRefiner:
             logger.error(f"Error during resume improvement: {e}")
             return None
             
+    def _update_tagged_sections(self, resume_content, improved_text) -> bool:
+        """
+        Update the sections of a resume from a response with <section> tags.
+        
+        Args:
+            resume_content: Resume content object to update
+            improved_text: Improved resume text returned for a batched request
+            
+        Returns:
+            True if every section was found in the response, False otherwise
+            (the resume content is then left unchanged)
+        """
+        if not hasattr(resume_content, 'sections'):
+            return False
+        
+        improved_sections = {
+            int(index): content for index, content in SECTION_TAG_PATTERN.findall(improved_text)
+        }
+        count = len(resume_content.sections)
+        if not count or any(index not in improved_sections for index in range(count)):
+            logger.warning("Batched response is missing section tags, parsing by section titles")
+            return False
+        
+        for index, section in enumerate(resume_content.sections):
+            if improved_sections[index]:
+                section.content = improved_sections[index]
+        return True
+    
     def _update_resume_content(self, resume_content, improved_text):
         """Update the resume content object with improved text."""
         if isinstance(resume_content, str):
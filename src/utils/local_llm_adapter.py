@@ -8,13 +8,16 @@ like Qwen 14B running in LLM Studio.
 import json
 import requests
 import logging
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Iterator, List, Optional
 
 # Set up logging
 logging.basicConfig(level=logging.INFO,
                    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+class IncompleteResponseError(RuntimeError):
+    """A streamed response stopped early, after part of it had been yielded."""
+
 class LocalLLMAdapter:
     """
     Adapter for connecting to locally hosted LLM models.
@@ -28,7 +31,8 @@ class LocalLLMAdapter:
         model_name: str = "qwen-14b", 
         host: str = "localhost", 
         port: int = 1234,
-        api_path: str = "/v1/chat/completions"
+        api_path: str = "/v1/chat/completions",
+        session: Optional[requests.Session] = None
     ):
         """
         Initialize the local LLM adapter.
@@ -38,9 +42,13 @@ class LocalLLMAdapter:
             host: Hostname where LLM Studio is running
             port: Port number for LLM Studio API
             api_path: API endpoint path
+            session: Optional shared session; a new one is made if omitted
         """
         self.model_name = model_name
         self.api_url = f"http://{host}:{port}{api_path}"
+        
+        # Keep-alive session, so repeated calls reuse the connection to LLM Studio
+        self.session = session or requests.Session()
         logger.info(f"Initialized LocalLLMAdapter with API URL: {self.api_url}")
     
     def generate(
@@ -76,7 +84,7 @@ class LocalLLMAdapter:
             
             # Send request to local LLM Studio API
             headers = {"Content-Type": "application/json"}
-            response = requests.post(
+            response = self.session.post(
                 self.api_url,
                 headers=headers,
                 json=data,
@@ -115,6 +123,100 @@ class LocalLLMAdapter:
             logger.exception(error_msg)
             return None
     
+    def generate_stream(
+        self, 
+        system_prompt: str, 
+        user_prompt: str,
+        temperature: float = 0.2,
+        max_tokens: int = 4000
+    ) -> Iterator[str]:
+        """
+        Generate a response from the local LLM, yielding the text as it arrives.
+        
+        Args:
+            system_prompt: System instructions for the model
+            user_prompt: User query or input for the model
+            temperature: Controls randomness (lower = more deterministic)
+            max_tokens: Maximum number of tokens to generate
+            
+        Yields:
+            Pieces of the generated text; nothing if there was an error before the first
+            
+        Raises:
+            IncompleteResponseError: If the response broke off after text was yielded,
+                or was cut short by max_tokens
+        """
+        yielded = False
+        finish_reason = None
+        try:
+            data = {
+                "model": self.model_name,
+                "messages": [
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": user_prompt}
+                ],
+                "temperature": temperature,
+                "max_tokens": max_tokens,
+                "stream": True
+            }
+            
+            # LLM Studio streams server-sent events, one "data: {...}" line per chunk
+            headers = {"Content-Type": "application/json"}
+            with self.session.post(
+                self.api_url,
+                headers=headers,
+                json=data,
+                timeout=120,  # Local inference might take longer
+                stream=True
+            ) as response:
+                if response.status_code != 200:
+                    logger.error(f"LLM Studio API error: {response.status_code}, {response.text}")
+                    return
+                
+                for line in response.iter_lines(decode_unicode=True):
+                    if not line or not line.startswith("data:"):
+                        continue
+                    payload = line[len("data:"):].strip()
+                    if payload == "[DONE]":
+                        break
+                    
+                    choices = json.loads(payload).get("choices")
+                    if choices:
+                        finish_reason = choices[0].get("finish_reason") or finish_reason
+                        content = choices[0].get("delta", {}).get("content")
+                        if content:
+                            yielded = True
+                            yield content
+                
+        except requests.exceptions.ConnectionError as e:
+            logger.error(f"Connection error to local LLM: {str(e)}")
+            self._raise_if_incomplete(yielded, e)
+        except requests.exceptions.Timeout as e:
+            logger.error(f"Timeout while calling local LLM: {str(e)}")
+            self._raise_if_incomplete(yielded, e)
+        except requests.exceptions.RequestException as e:
+            logger.error(f"Request error to local LLM: {str(e)}")
+            self._raise_if_incomplete(yielded, e)
+        except Exception as e:
+            logger.exception(f"Unexpected error calling local LLM: {str(e)}")
+            self._raise_if_incomplete(yielded, e)
+        
+        # The text so far is only the start of the answer
+        if finish_reason == "length":
+            raise IncompleteResponseError(f"The local LLM response was cut off at {max_tokens} tokens")
+    
+    @staticmethod
+    def _raise_if_incomplete(yielded: bool, error: Exception) -> None:
+        """
+        Turn an error in the middle of a stream into an IncompleteResponseError.
+        
+        Args:
+            yielded: Whether part of the response was already yielded
+            error: The error that stopped the stream
+        """
+        if yielded:
+            raise IncompleteResponseError(f"The local LLM response broke off: {error}") from error
+    
     def test_connection(self) -> bool:
         """
         Test the connection to the local LLM.
@@ -132,7 +234,7 @@ class LocalLLMAdapter:
             }
             
             headers = {"Content-Type": "application/json"}
-            response = requests.post(
+            response = self.session.post(
                 self.api_url,
                 headers=headers,
                 json=data,
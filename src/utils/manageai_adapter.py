@@ -27,7 +27,8 @@ class ManageAIResumeAdapter:
     def __init__(
         self,
         api_url: str = "http://localhost:8080",
-        api_key: Optional[str] = None
+        api_key: Optional[str] = None,
+        session: Optional[requests.Session] = None
     ):
         """
         Initialize the adapter with connection settings.
@@ -35,9 +36,11 @@ class ManageAIResumeAdapter:
         Args:
             api_url: URL of the ManageAI Resume API
             api_key: Optional API key for authentication
+            session: Optional shared session; a new one is made if omitted
         """
         self.api_url = api_url.rstrip('/')
         self.api_key = api_key
+        self.session = session or requests.Session()
         logger.info(f"ManageAI Resume API adapter initialized with URL: {self.api_url}")
     
     def _make_request(self, endpoint: str, method: str = "POST", data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
@@ -68,9 +71,9 @@ class ManageAIResumeAdapter:
             logger.debug(f"Making {method} request to {url}")
             
             if method.upper() == "GET":
-                response = requests.get(url, headers=headers, timeout=30)
+                response = self.session.get(url, headers=headers, timeout=30)
             elif method.upper() == "POST":
-                response = requests.post(url, json=data, headers=headers, timeout=30)
+                response = self.session.post(url, json=data, headers=headers, timeout=30)
             else:
                 raise ValueError(f"Unsupported HTTP method: {method}")
             
@@ -110,7 +113,7 @@ class ManageAIResumeAdapter:
         try:
             # Try to access the API root or health endpoint
             url = f"{self.api_url}/health"
-            response = requests.get(url, timeout=5)
+            response = self.session.get(url, timeout=5)
             
             if response.status_code == 200:
                 logger.info("Successfully connected to ManageAI Resume API")
@@ -118,7 +121,7 @@ class ManageAIResumeAdapter:
             else:
                 # If health endpoint doesn't exist, try the root endpoint
                 url = self.api_url
-                response = requests.get(url, timeout=5)
+                response = self.session.get(url, timeout=5)
                 
                 if response.status_code == 200:
                     logger.info("Successfully connected to ManageAI Resume API")
@@ -219,7 +222,8 @@ class ManageAIResumeAdapter:
         self, 
         resume_content: Dict[str, Any], 
         job_description: str,
-        match_result: Optional[Dict[str, Any]] = None
+        match_result: Optional[Dict[str, Any]] = None,
+        infer: bool = True
     ) -> Dict[str, Any]:
         """
         Improve a resume for a specific job using the ManageAI Resume API.
@@ -228,6 +232,8 @@ class ManageAIResumeAdapter:
             resume_content: Dictionary containing resume content
             job_description: Job description text
             match_result: Optional pre-computed match results
+            infer: Whether the API should run its LLM over the input to extract
+                and reformat it first; pass False when it is already structured
             
         Returns:
             Dictionary with improved resume content
@@ -239,6 +245,9 @@ class ManageAIResumeAdapter:
         
         if match_result:
             data["match_result"] = match_result
+        
+        if not infer:
+            data["infer"] = False
             
         return self._make_request("improve", data=data)
 
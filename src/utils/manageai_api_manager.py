@@ -8,6 +8,7 @@ It provides functionality to start and stop the server as needed.
 import os
 import sys
 import time
+import select
 import logging
 import threading
 import importlib.util
@@ -23,11 +24,16 @@ logging.basicConfig(level=logging.INFO,
                     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# How long a health check result is reused before the server is queried again
+HEALTH_CACHE_TTL = 0.5
+LOCAL_HOSTS = ("localhost", "127.0.0.1")
+
 class ManageAIAPIManager:
     """Manager for the ManageAI Resume API server."""
     
     def __init__(self, api_path: Optional[str] = None, host: str = "localhost", 
-                 port: int = 8080, config: Optional[Dict[str, Any]] = None):
+                 port: int = 8080, config: Optional[Dict[str, Any]] = None,
+                 session: Optional[requests.Session] = None):
         """
         Initialize the API manager.
         
@@ -36,6 +42,7 @@ class ManageAIAPIManager:
             host: Host to bind the API server to
             port: Port for the API server to listen on
             config: Configuration dictionary for the Resume API
+            session: Optional shared session for health checks
         """
         self.host = host
         self.port = port
@@ -61,6 +68,10 @@ class ManageAIAPIManager:
         self._health_check_thread = None
         self._stop_health_check = threading.Event()
         
+        # Reuse one HTTP session for health checks and cache the last result briefly
+        self._session = session or requests.Session()
+        self._last_health_check = None  # (timestamp, result)
+        
         # Register shutdown handler to ensure server is stopped on exit
         atexit.register(self.stop_server)
         
@@ -121,12 +132,14 @@ class ManageAIAPIManager:
                 
                 # Wait for the server to be ready if requested
                 if wait_for_startup:
+                    # A local server answers in microseconds, so poll it more often
+                    poll_interval = 0.05 if self.host in LOCAL_HOSTS else 0.5
                     start_time = time.time()
                     while time.time() - start_time < timeout:
-                        if self.is_server_running():
+                        if self.is_server_running(use_cache=False):
                             logger.info("ManageAI Resume API server is ready")
                             return True
-                        time.sleep(0.5)
+                        time.sleep(poll_interval)
                     
                     logger.warning(f"ManageAI Resume API server didn't respond within {timeout} seconds")
                     # Don't return False here, as the server might still become available
@@ -307,8 +320,7 @@ class ManageAIAPIManager:
         logger.info(f"Resume API process started with PID {self._api_process.pid}")
         
         # Wait briefly and check if the process is still running
-        time.sleep(1)
-        if self._api_process.poll() is not None:
+        if self._wait_for_process_exit(self._api_process, timeout=1.0):
             stdout, stderr = self._api_process.communicate()
             logger.error(f"Resume API process terminated immediately after starting!")
             logger.error(f"Exit code: {self._api_process.returncode}")
@@ -316,6 +328,44 @@ class ManageAIAPIManager:
             logger.error(f"Stderr: {stderr}")
             raise RuntimeError(f"Resume API process failed to start and terminated with code {self._api_process.returncode}")
     
+    @staticmethod
+    def _wait_for_process_exit(process: subprocess.Popen, timeout: float) -> bool:
+        """
+        Wait up to ``timeout`` seconds for a child process to exit.
+        
+        On Linux the wait blocks on a pidfd so the kernel wakes us as soon as the
+        process exits; elsewhere it falls back to ``Popen.wait``.
+        
+        Args:
+            process: The child process to wait for
+            timeout: Maximum time to wait in seconds
+            
+        Returns:
+            bool: True if the process has exited, False if it is still running
+        """
+        if process.poll() is not None:
+            return True
+        
+        try:
+            pidfd = os.pidfd_open(process.pid)
+        except (AttributeError, OSError):
+            pidfd = None
+        
+        if pidfd is not None:
+            try:
+                poller = select.poll()
+                poller.register(pidfd, select.POLLIN)
+                poller.poll(int(timeout * 1000))
+            finally:
+                os.close(pidfd)
+            return process.poll() is not None
+        
+        try:
+            process.wait(timeout=timeout)
+            return True
+        except subprocess.TimeoutExpired:
+            return False
+    
     def restart_server(self) -> bool:
         """
         Restart the ManageAI Resume API server.
@@ -337,6 +387,7 @@ class ManageAIAPIManager:
         """
         # Stop health check first
         self._stop_health_check_thread()
+        self._last_health_check = None
         
         if not self._server_started:
             logger.info("ManageAI API server is not running.")
@@ -348,10 +399,7 @@ class ManageAIAPIManager:
                 logger.info(f"Stopping Resume API process with PID {self._api_process.pid}")
                 self._api_process.terminate()
                 # Give it some time to shut down gracefully
-                for _ in range(5):
-                    if self._api_process.poll() is not None:
-                        break
-                    time.sleep(0.5)
+                self._wait_for_process_exit(self._api_process, timeout=2.5)
                 
                 # If it's still running, force kill it
                 if self._api_process.poll() is None:
@@ -384,19 +432,34 @@ class ManageAIAPIManager:
         self._server_started = False
         return True
     
-    def is_server_running(self) -> bool:
+    def is_server_running(self, use_cache: bool = True) -> bool:
         """
         Check if the ManageAI Resume API server is running.
         
+        Args:
+            use_cache: Whether a health result from the last HEALTH_CACHE_TTL
+                seconds may be returned instead of querying the server again
+        
         Returns:
             bool: True if the server is running, False otherwise
         """
         if not self._server_started:
             return False
-            
+        
+        if use_cache and self._last_health_check:
+            checked_at, result = self._last_health_check
+            if time.monotonic() - checked_at < HEALTH_CACHE_TTL:
+                return result
+        
+        result = self._check_health()
+        self._last_health_check = (time.monotonic(), result)
+        return result
+    
+    def _check_health(self) -> bool:
+        """Query the server's health (or test) endpoint."""
         # Try the health endpoint first
         try:
-            response = requests.get(f"http://{self.host}:{self.port}/health", timeout=2)
+            response = self._session.get(f"http://{self.host}:{self.port}/health", timeout=2)
             if response.status_code == 200:
                 return True
         except requests.RequestException:
@@ -404,7 +467,7 @@ class ManageAIAPIManager:
             
         # If health endpoint failed, try the test endpoint as fallback
         try:
-            response = requests.post(
+            response = self._session.post(
                 f"http://{self.host}:{self.port}/test", 
                 json={"check": "connectivity"}, 
                 timeout=2
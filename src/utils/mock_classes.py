@@ -25,14 +25,14 @@ class MockJobAnalyzer:
         return {"score": 85, "suggestions": ["Mock suggestion 1", "Mock suggestion 2"]}
 
 class MockAPIClient:
-    def __init__(self):
+    def __init__(self, base_url=None, api_key=None, session=None):
         self.connected = False
     
     def test_connection(self):
         return True
 
 class MockManageAIAPIManager:
-    def __init__(self, host="localhost", port=8080):
+    def __init__(self, host="localhost", port=8080, session=None):
         self.host = host
         self.port = port
         self.server_running = False
@@ -57,7 +57,7 @@ class MockConnectionType:
     LLM_DIRECT = "llm_direct"
 
 class MockResumeAPIIntegration:
-    def __init__(self, connection_type=None, local_url=None, manageai_url=None, api_key=None, api_client=None):
+    def __init__(self, connection_type=None, local_url=None, manageai_url=None, api_key=None, api_client=None, session=None):
         self.connection_type = connection_type
         self._connection_active = True
         self.api_client = api_client
@@ -75,7 +75,7 @@ class MockResumeAPIIntegration:
         else:
             return f"Based on your question '{user_input}', here's my advice for your resume: Consider focusing on quantifiable achievements and using action verbs to make your experience more impactful."
     
-    def improve_resume(self, resume_content, job_description=None, feedback=None):
+    def improve_resume(self, resume_content, job_description=None, feedback=None, skip_preprocessing=False, focus=None):
         return {
             "improved_resume": f"Mock improved content based on: {feedback or 'general improvements'}",
             "generated_at": None
@@ -7,6 +7,8 @@ capabilities to enable replacing resume content while preserving the original la
 
 import os
 import re
+import asyncio
+import functools
 import logging
 import tempfile
 from typing import Dict, List, Optional, Union
@@ -42,6 +44,14 @@ logging.basicConfig(level=logging.INFO,
                    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Backends for the plain-text pass of extract_content: PyMuPDF reads the text in
+# a single fast pass, pdfminer runs the full multi-method PDFExtractor
+TEXT_BACKENDS = ('pymupdf', 'pdfminer')
+
+# PDFs whose page text is kept in memory; extracting and analyzing the
+# same file reuse it instead of opening the PDF again
+PAGE_TEXT_CACHE_SIZE = 8
+
 
 class PDFContentReplacer:
     """
@@ -51,7 +61,7 @@ class PDFContentReplacer:
     replacing resume content while preserving the original layout.
     """
     
-    def __init__(self, use_enhanced=True, use_llm=True, use_ocr=False, use_direct=True):
+    def __init__(self, use_enhanced=True, use_llm=True, use_ocr=False, use_direct=True, backend='pymupdf'):
         """
         Initialize the PDF content replacer.
         
@@ -60,11 +70,13 @@ class PDFContentReplacer:
             use_llm: Whether to use LLM for content refinement
             use_ocr: Whether to use OCR for text extraction (requires external tools)
             use_direct: Whether to use direct PDF manipulation (preferred method)
+            backend: Plain-text extraction backend, one of TEXT_BACKENDS
         """
         self.use_enhanced = use_enhanced
         self.use_llm = use_llm and HAS_LLM
         self.use_ocr = use_ocr
         self.use_direct = use_direct
+        self.backend = backend
         
         # Initialize components
         if use_direct:
@@ -120,6 +132,35 @@ class PDFContentReplacer:
             'structure_analysis': structure_analysis,
         }
     
+    async def improve_resume_async(self, pdf_path, job_description=None, output_path=None):
+        """
+        Improve a resume PDF like improve_resume, but send the per-section LLM
+        requests concurrently when the direct replacer is used.
+        
+        Args:
+            pdf_path: Path to the original resume PDF
+            job_description: Optional job description to tailor the resume for
+            output_path: Path for the output PDF (default: new_resume.pdf)
+            
+        Returns:
+            Path to the improved resume PDF
+        """
+        if output_path is None:
+            output_path = os.path.join(os.path.dirname(pdf_path), 'new_resume.pdf')
+        
+        if self.use_direct and isinstance(self.pdf_replacer, PDFDirectReplacer) and job_description:
+            try:
+                return await self.pdf_replacer.rebuild_resume_with_llm_async(
+                    pdf_path,
+                    job_description,
+                    output_path
+                )
+            except Exception as e:
+                logger.error(f"Direct PDF replacement failed: {e}. Falling back to standard approach.")
+        
+        # The standard approach refines the whole resume in a single LLM call
+        return await asyncio.to_thread(self._improve_resume_standard, pdf_path, job_description, output_path)
+    
     def improve_resume(self, pdf_path, job_description=None, output_path=None):
         """
         Improve a resume PDF while preserving its layout.
@@ -148,7 +189,10 @@ class PDFContentReplacer:
                 logger.error(f"Direct PDF replacement failed: {e}. Falling back to standard approach.")
         
         # Fall back to standard approach if direct replacement isn't available
-        
+        return self._improve_resume_standard(pdf_path, job_description, output_path)
+    
+    def _improve_resume_standard(self, pdf_path, job_description, output_path):
+        """Improve a resume by refining its extracted text and rebuilding the PDF."""
         # Step 1: Analyze the resume to extract structure and content
         analysis = self.analyze_resume(pdf_path)
         document = analysis['formatted_document']
@@ -268,8 +312,8 @@ class PDFContentReplacer:
                 # Classify sections for other replacers
                 section_classifications = self.section_classifier.classify_sections_in_document(document.sections)
             
-            # Extract plaintext content using the regular extractor
-            basic_resume = self.pdf_extractor.extract(pdf_path)
+            # Extract plaintext content
+            basic_resume = self._extract_basic_resume(pdf_path)
             
             # Create a complete content object
             content = {
@@ -284,6 +328,68 @@ class PDFContentReplacer:
             logger.error(f"Error extracting PDF content: {e}")
             raise
     
+    def iter_page_text(self, pdf_path):
+        """
+        Yield the plain text of a PDF one page at a time.
+        
+        Pages are read with Tesseract when use_ocr is set, so scanned PDFs
+        without a text layer are counted too, and with the configured
+        backend otherwise.
+        
+        Args:
+            pdf_path: Path to the PDF file
+            
+        Yields:
+            The text of each page, in order
+        """
+        # Only one page of text is held at a time, so this doesn't go
+        # through the whole-document cache of _page_texts
+        if self.use_ocr:
+            from pdf2image import pdfinfo_from_path
+            for page_index in range(pdfinfo_from_path(pdf_path)["Pages"]):
+                yield self.pdf_extractor.extract_page(pdf_path, page_index)
+        elif self.backend == 'pymupdf':
+            import fitz
+            with fitz.open(pdf_path) as doc:
+                for page in doc:
+                    yield page.get_text("text")
+        else:
+            from pdfminer.high_level import extract_pages
+            from pdfminer.layout import LTTextContainer
+            for page_layout in extract_pages(pdf_path):
+                yield "".join(
+                    element.get_text() for element in page_layout if isinstance(element, LTTextContainer)
+                )
+    
+    def _page_texts(self, pdf_path):
+        """
+        Get the plain text of every page of a PDF, read once per version of the file.
+        
+        Args:
+            pdf_path: Path to the PDF file
+            
+        Returns:
+            Tuple with the text of each page, in order
+        """
+        return _cached_page_texts(os.path.abspath(pdf_path), os.stat(pdf_path).st_mtime_ns)
+    
+    def _extract_basic_resume(self, pdf_path):
+        """
+        Extract the plain-text resume content with the configured backend.
+        
+        Args:
+            pdf_path: Path to the PDF file
+            
+        Returns:
+            ResumeContent object containing the structured resume content
+        """
+        # OCR only runs in the full extractor, so scanned PDFs always go through it
+        if self.backend == 'pymupdf' and not self.use_ocr:
+            raw_text = "\n".join(self._page_texts(pdf_path))
+            return self.pdf_extractor._build_resume_content(raw_text)
+        
+        return self.pdf_extractor.extract(pdf_path)
+    
     def replace_content(self, input_path, output_path=None, job_description=None):
         """
         Replace content in a PDF while preserving the layout.
@@ -306,7 +412,8 @@ class PDFContentReplacer:
         Args:
             input_path: Path to the input PDF
             output_path: Path for the output PDF
-            content: Pre-loaded content data from extract_content()
+            content: Pre-loaded content data from extract_content(), or a summary of
+                the file without it, in which case the PDF is parsed here
             job_description: Optional job description to tailor the resume for
             
         Returns:
@@ -315,6 +422,9 @@ class PDFContentReplacer:
         if output_path is None:
             output_path = os.path.join(os.path.dirname(input_path), 'new_resume.pdf')
         
+        if 'formatted_document' not in content:
+            content = self.extract_content(input_path)
+        
         # If we have the direct replacer and a job description, use the optimized approach
         if self.use_direct and isinstance(self.pdf_replacer, PDFDirectReplacer) and job_description:
             try:
@@ -451,11 +561,18 @@ class PDFContentReplacer:
             if extracted_sections and len(extracted_sections) > 1:
                 logger.info(f"Successfully extracted {len(extracted_sections)} sections using SectionExtractor")
                 
-                # Get page count and other metadata using PyMuPDF
-                import fitz
-                doc = fitz.open(pdf_path)
-                page_count = len(doc)
-                text_block_count = sum(len(page.get_text("dict").get("blocks", [])) for page in doc)
+                if self.use_direct and isinstance(self.pdf_replacer, PDFDirectReplacer):
+                    # Reuse the direct replacer's cached parse instead of reading the PDF again
+                    document = self.pdf_replacer.extract_document_structure(pdf_path)
+                    page_count = document['meta']['page_count']
+                    text_block_count = sum(len(page['blocks']) for page in document['pages'])
+                else:
+                    # Get page count and other metadata using PyMuPDF; the
+                    # "blocks" output skips the per-span detail of "dict"
+                    import fitz
+                    with fitz.open(pdf_path) as doc:
+                        page_count = len(doc)
+                        text_block_count = sum(len(page.get_text("blocks")) for page in doc)
                 format_type = "Standard"
                 
                 # Build comprehensive structure analysis with extracted sections
@@ -486,9 +603,7 @@ class PDFContentReplacer:
                     doc = fitz.open(pdf_path)
                     
                     # Extract full text
-                    full_text = ""
-                    for page in doc:
-                        full_text += page.get_text("text") + "\n"
+                    full_text = "".join(page_text + "\n" for page_text in self._page_texts(pdf_path))
                     
                     # Try to identify sections based on common section headers with expanded patterns
                     section_patterns = [
@@ -895,3 +1010,20 @@ class PDFContentReplacer:
             print(f"Error in section name matching: {e}")
             # If there's any error, assume they don't match
             return False
+
+
+@functools.lru_cache(maxsize=PAGE_TEXT_CACHE_SIZE)
+def _cached_page_texts(pdf_path, mtime_ns):
+    """
+    Read and cache the plain text of each page of a PDF file.
+    
+    Args:
+        pdf_path: Absolute path to the PDF file
+        mtime_ns: Modification time of the file, so edited files are read again
+        
+    Returns:
+        Tuple with the text of each page, in order
+    """
+    import fitz
+    with fitz.open(pdf_path) as doc:
+        return tuple(page.get_text("text") for page in doc)
@@ -7,6 +7,9 @@ rather than recreating them, preserving all visual elements while updating conte
 
 import os
 import re
+import copy
+import asyncio
+import functools
 import logging
 from typing import Dict, List, Tuple, Optional, Union, Any
 from collections import defaultdict
@@ -50,6 +53,23 @@ class PDFDirectReplacer:
         """
         Extract document structure including sections, formatting, and text.
         
+        Parsed structures are cached per file and modification time, so repeated
+        analysis of the same PDF only parses it once.
+        
+        Args:
+            pdf_path: Path to the PDF file
+            
+        Returns:
+            Dictionary containing the document structure
+        """
+        structure = _cached_document_structure(os.path.abspath(pdf_path), os.path.getmtime(pdf_path))
+        # Callers are free to modify the result, so never hand out the cached copy
+        return copy.deepcopy(structure)
+    
+    def _parse_document_structure(self, pdf_path) -> Dict:
+        """
+        Parse the document structure of a PDF file without caching.
+        
         Args:
             pdf_path: Path to the PDF file
             
@@ -551,34 +571,116 @@ class PDFDirectReplacer:
         structure = self.extract_document_structure(pdf_path)
         
         try:
-            # Import LLM refiner with fallback for different contexts
-            try:
-                from src.utils.llm_refiner import LLMRefiner
-            except ImportError:
-                from utils.llm_refiner import LLMRefiner
-            refiner = LLMRefiner()
-            
-            # Prepare sections for LLM processing
-            sections_for_llm = {}
-            for section_title, section_info in structure['classified_sections'].items():
-                section_type = section_info['type']
-                content = section_info['content']
-                
-                # Create a formatted version for the LLM
-                formatted_section = f"# {section_title}\n\n{content}"
-                sections_for_llm[section_type] = formatted_section
+            refiner = self._create_llm_refiner()
             
-            # Send to LLM for improvement
+            # Process each section with the LLM
             improved_sections = {}
+            for section_type, section_content in self._prepare_sections_for_llm(structure).items():
+                improved_content = self._improve_section_with_llm(
+                    refiner, section_type, section_content, job_description
+                )
+                if improved_content:
+                    improved_sections[section_type] = improved_content
             
-            # Process each section with the LLM
-            for section_type, section_content in sections_for_llm.items():
-                if section_type in ['contact', 'header']:
-                    # Skip contact info/header sections as they shouldn't be modified
-                    continue
-                
-                # Create a tailored prompt for this section
-                prompt = f"""
+            # Replace content in the PDF
+            return self.replace_content_direct(pdf_path, improved_sections, output_path)
+            
+        except ImportError:
+            logger.warning("LLM refiner not available. Using original content.")
+            return pdf_path
+        except Exception as e:
+            logger.error(f"Error during LLM improvement: {e}")
+            return pdf_path
+    
+    async def rebuild_resume_with_llm_async(self, pdf_path, job_description, output_path=None):
+        """
+        Rebuild a resume like rebuild_resume_with_llm, but send all sections to the
+        LLM concurrently instead of one request after another.
+        
+        Args:
+            pdf_path: Path to the original PDF file
+            job_description: Job description text to target
+            output_path: Path for the output PDF file
+            
+        Returns:
+            Path to the improved resume PDF
+        """
+        if output_path is None:
+            output_path = pdf_path.replace('.pdf', '_improved.pdf')
+        
+        # Extract document structure
+        structure = await asyncio.to_thread(self.extract_document_structure, pdf_path)
+        
+        try:
+            refiner = self._create_llm_refiner()
+            
+            # The LLM requests are I/O-bound, so run them in parallel threads
+            sections_for_llm = self._prepare_sections_for_llm(structure)
+            results = await asyncio.gather(*(
+                asyncio.to_thread(self._improve_section_with_llm,
+                                  refiner, section_type, section_content, job_description)
+                for section_type, section_content in sections_for_llm.items()
+            ))
+            improved_sections = {
+                section_type: improved_content
+                for section_type, improved_content in zip(sections_for_llm, results)
+                if improved_content
+            }
+            
+            # Replace content in the PDF
+            return await asyncio.to_thread(self.replace_content_direct, pdf_path, improved_sections, output_path)
+            
+        except ImportError:
+            logger.warning("LLM refiner not available. Using original content.")
+            return pdf_path
+        except Exception as e:
+            logger.error(f"Error during LLM improvement: {e}")
+            return pdf_path
+    
+    def _create_llm_refiner(self):
+        """Create an LLM refiner, importing it with fallback for different contexts."""
+        try:
+            from src.utils.llm_refiner import LLMRefiner
+        except ImportError:
+            from utils.llm_refiner import LLMRefiner
+        return LLMRefiner()
+    
+    def _prepare_sections_for_llm(self, structure) -> Dict[str, str]:
+        """
+        Format the classified sections of a document for LLM processing.
+        
+        Args:
+            structure: Document structure from extract_document_structure
+            
+        Returns:
+            Dictionary mapping section types to formatted section text
+        """
+        sections_for_llm = {}
+        for section_title, section_info in structure['classified_sections'].items():
+            section_type = section_info['type']
+            if section_type in ['contact', 'header']:
+                # Skip contact info/header sections as they shouldn't be modified
+                continue
+            
+            # Create a formatted version for the LLM
+            sections_for_llm[section_type] = f"# {section_title}\n\n{section_info['content']}"
+        return sections_for_llm
+    
+    def _improve_section_with_llm(self, refiner, section_type, section_content, job_description) -> Optional[str]:
+        """
+        Ask the LLM for an improved version of one resume section.
+        
+        Args:
+            refiner: LLMRefiner used to reach the LLM
+            section_type: Type of the section (e.g. 'experience')
+            section_content: Formatted section text
+            job_description: Job description text to target
+            
+        Returns:
+            The improved section content, or None if the LLM returned nothing
+        """
+        # Create a tailored prompt for this section
+        prompt = f"""
                 Improve this resume section for the following job description:
                 
                 JOB DESCRIPTION:
@@ -591,29 +693,17 @@ class PDFDirectReplacer:
                 Keep a similar length and formatting style as the original.
                 Only return the improved section content, not an explanation.
                 """
-                
-                # Get LLM improvement
-                improved_content = refiner._analyze_and_improve_resume(prompt)
-                
-                if improved_content:
-                    # Extract just the content part (removing any headers the LLM might add)
-                    if '#' in improved_content:
-                        # Try to remove section header
-                        content_parts = improved_content.split('\n', 2)
-                        if len(content_parts) >= 3:  # [header, blank line, content]
-                            improved_content = content_parts[2].strip()
-                    
-                    improved_sections[section_type] = improved_content
-            
-            # Replace content in the PDF
-            return self.replace_content_direct(pdf_path, improved_sections, output_path)
-            
-        except ImportError:
-            logger.warning("LLM refiner not available. Using original content.")
-            return pdf_path
-        except Exception as e:
-            logger.error(f"Error during LLM improvement: {e}")
-            return pdf_path
+        
+        # Get LLM improvement
+        improved_content = refiner._analyze_and_improve_resume(prompt)
+        
+        if improved_content and '#' in improved_content:
+            # Extract just the content part (removing any headers the LLM might add)
+            content_parts = improved_content.split('\n', 2)
+            if len(content_parts) >= 3:  # [header, blank line, content]
+                improved_content = content_parts[2].strip()
+        
+        return improved_content
 
     def _fallback_section_detection(self, doc) -> List[Dict]:
         """
@@ -705,6 +795,21 @@ class PDFDirectReplacer:
         return sections
 # Helper functions for font matching
 
+@functools.lru_cache(maxsize=8)
+def _cached_document_structure(pdf_path, mtime) -> Dict:
+    """
+    Parse and cache the structure of a PDF file.
+    
+    Args:
+        pdf_path: Absolute path to the PDF file
+        mtime: Modification time of the file, so edited files are parsed again
+        
+    Returns:
+        Dictionary containing the document structure
+    """
+    return PDFDirectReplacer()._parse_document_structure(pdf_path)
+
+
 def match_font(pdf_font_name):
     """Match PDF font name to a PyMuPDF font name."""
     pdf_font_name = pdf_font_name.lower()
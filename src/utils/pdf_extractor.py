@@ -14,14 +14,18 @@ from pdfminer.pdfinterp import PDFResourceManager, PDFPageInterpreter
 from pdfminer.pdfpage import PDFPage
 from PyPDF2 import PdfReader
 import subprocess
+from concurrent.futures import ProcessPoolExecutor
 import pytesseract
-from pdf2image import convert_from_path
+from pdf2image import convert_from_path, pdfinfo_from_path
 from PIL import Image
 import logging
 
 # Set up logger
 logger = logging.getLogger(__name__)
 
+# OCR Configuration for better section header detection
+OCR_CONFIG = r'--oem 3 --psm 6 -l eng'  # Page segmentation mode 6: Assume a single uniform block of text
+
 class ResumeSection:
     """Class representing a section of a resume."""
     def __init__(self, title, content):
@@ -42,6 +46,10 @@ class ResumeContent:
         """Add a section to the resume content."""
         self.sections.append(ResumeSection(title, content))
     
+    def add_sections(self, sections):
+        """Add several sections to the resume content from (title, content) pairs."""
+        self.sections.extend(ResumeSection(title, content) for title, content in sections)
+    
     def set_contact_info(self, name="", email="", phone="", address="", linkedin=""):
         """Set contact information."""
         self.contact_info = {
@@ -118,6 +126,39 @@ class PDFExtractor:
         # Combine and clean extracted text
         raw_text = self._combine_extracted_text([raw_text1, raw_text2, raw_text3, raw_text4])
         
+        return self._build_resume_content(raw_text)
+    
+    def extract_bytes(self, data):
+        """
+        Extract content from a PDF resume held in memory.
+        
+        The extraction methods used here (including OCR) read the PDF from disk,
+        so the data is written to a temporary file first.
+        
+        Args:
+            data: Contents of the PDF file
+            
+        Returns:
+            ResumeContent object containing the structured resume content
+        """
+        with tempfile.NamedTemporaryFile(suffix='.pdf', delete=False) as tmp:
+            tmp.write(data)
+            tmp_path = tmp.name
+        try:
+            return self.extract(tmp_path)
+        finally:
+            os.remove(tmp_path)
+    
+    def _build_resume_content(self, raw_text):
+        """
+        Build the structured resume content from extracted text.
+        
+        Args:
+            raw_text: Text extracted from the PDF
+            
+        Returns:
+            ResumeContent object containing the structured resume content
+        """
         # Create resume content object
         resume = ResumeContent()
         resume.raw_text = raw_text
@@ -332,35 +373,19 @@ class PDFExtractor:
                 logger.warning(f"Tesseract OCR is not properly installed: {e}")
                 return ""
                 
-            # Convert PDF to images
-            logger.info(f"Converting PDF to images: {pdf_path}")
-            images = convert_from_path(pdf_path, dpi=300)  # Higher DPI for better quality
-            
-            if not images:
-                logger.warning("No images extracted from PDF")
+            # Pages are OCR'd independently, so spread them over worker processes
+            page_count = pdfinfo_from_path(pdf_path)["Pages"]
+            if not page_count:
+                logger.warning("No pages found in PDF")
                 return ""
-                
-            logger.info(f"Successfully converted {len(images)} pages to images")
-            
-            # Process each page with OCR
-            all_text = []
-            
-            # OCR Configuration for better section header detection
-            custom_config = r'--oem 3 --psm 6 -l eng'  # Page segmentation mode 6: Assume a single uniform block of text
             
-            for i, img in enumerate(images):
-                logger.info(f"Processing page {i+1} with OCR")
-                
-                # Apply preprocessing to enhance text readability if needed
-                # img = self._preprocess_image_for_ocr(img)  # Uncomment if needed
-                
-                # Extract text using Tesseract
-                page_text = pytesseract.image_to_string(img, config=custom_config)
-                
-                # Post-process the extracted text
-                processed_text = self._post_process_ocr_text(page_text)
-                
-                all_text.append(processed_text)
+            logger.info(f"Processing {page_count} pages with OCR")
+            pages = range(page_count)
+            if page_count > 1:
+                with ProcessPoolExecutor(max_workers=min(os.cpu_count() or 1, page_count)) as executor:
+                    all_text = list(executor.map(self.extract_page, [pdf_path] * page_count, pages))
+            else:
+                all_text = [self.extract_page(pdf_path, page_index) for page_index in pages]
             
             combined_text = "\n\n".join(all_text)
             
@@ -374,6 +399,34 @@ class PDFExtractor:
             logger.error(f"Error during OCR extraction: {str(e)}")
             return ""
             
+    def extract_page(self, pdf_path, page_index):
+        """
+        Extract the text of a single PDF page with Tesseract OCR.
+        
+        Args:
+            pdf_path: Path to the PDF file
+            page_index: 0-based index of the page
+            
+        Returns:
+            str: Post-processed OCR text of the page
+        """
+        logger.info(f"Processing page {page_index + 1} with OCR")
+        
+        # Convert only this page to an image
+        images = convert_from_path(pdf_path, dpi=300,  # Higher DPI for better quality
+                                   first_page=page_index + 1, last_page=page_index + 1)
+        if not images:
+            return ""
+        
+        # Apply preprocessing to enhance text readability if needed
+        # img = self._preprocess_image_for_ocr(images[0])  # Uncomment if needed
+        
+        # Extract text using Tesseract
+        page_text = pytesseract.image_to_string(images[0], config=OCR_CONFIG)
+        
+        # Post-process the extracted text
+        return self._post_process_ocr_text(page_text)
+    
     def _post_process_ocr_text(self, text):
         """
         Post-process OCR-extracted text to correct common OCR issues.
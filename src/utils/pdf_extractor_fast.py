@@ -0,0 +1,73 @@
+"""
+Fast PDF Extractor module for extracting text from text-based PDF resumes.
+
+Uses pypdfium2 (the PDFium engine used by Chrome) for plain-text extraction,
+which is considerably faster than running the multiple extraction methods of
+PDFExtractor. It does not OCR scanned resumes, so use PDFExtractor for those.
+"""
+
+import logging
+
+try:
+    import pypdfium2 as pdfium
+    PDFIUM_AVAILABLE = True
+except ImportError:
+    PDFIUM_AVAILABLE = False
+
+# Import with fallback for different contexts (module vs. package)
+try:
+    from src.utils.pdf_extractor import PDFExtractor
+except ImportError:
+    from utils.pdf_extractor import PDFExtractor
+
+# Set up logger
+logger = logging.getLogger(__name__)
+
+class FastPDFExtractor(PDFExtractor):
+    """Class for quickly extracting content from text-based PDF resumes."""
+    
+    def __init__(self):
+        if not PDFIUM_AVAILABLE:
+            raise ImportError("pypdfium2 is required for fast PDF extraction. "
+                              "Install it with: pip install pypdfium2")
+        super().__init__()
+    
+    def extract(self, pdf_path):
+        """
+        Extract content from a PDF resume with pypdfium2.
+        
+        Args:
+            pdf_path: Path to the PDF file
+            
+        Returns:
+            ResumeContent object containing the structured resume content
+        """
+        return self._build_resume_content(self._extract_with_pdfium(pdf_path))
+    
+    def extract_bytes(self, data):
+        """
+        Extract content from a PDF resume held in memory, without touching the disk.
+        
+        Args:
+            data: Contents of the PDF file
+            
+        Returns:
+            ResumeContent object containing the structured resume content
+        """
+        return self._build_resume_content(self._extract_with_pdfium(data))
+    
+    def _extract_with_pdfium(self, pdf):
+        """Extract the plain text of every page using PDFium, from a path or bytes."""
+        pages = []
+        pdf = pdfium.PdfDocument(pdf)
+        try:
+            for page in pdf:
+                textpage = page.get_textpage()
+                # PDFium separates lines with CRLF
+                pages.append(textpage.get_text_range().replace("\r\n", "\n"))
+                textpage.close()
+                page.close()
+        finally:
+            pdf.close()
+        
+        return "\n".join(pages)
@@ -47,7 +47,8 @@ class ResumeAPIIntegration:
         llm_host: str = "localhost",
         llm_port: int = 1234,
         llm_model: str = "qwen-14b",
-        api_key: Optional[str] = None
+        api_key: Optional[str] = None,
+        session=None
     ):
         """
         Initialize the integration with connection settings.
@@ -60,6 +61,7 @@ class ResumeAPIIntegration:
             llm_port: Port for direct LLM Studio connection
             llm_model: Model name for direct LLM Studio connection
             api_key: API key for authentication (used with local server and ManageAI API)
+            session: Optional requests session shared by every client this integration creates
         """
         if isinstance(connection_type, str):
             try:
@@ -75,6 +77,7 @@ class ResumeAPIIntegration:
         self.llm_port = llm_port
         self.llm_model = llm_model
         self.api_key = api_key
+        self.session = session
         
         # Initialize the appropriate client based on connection type
         self._init_client()
@@ -83,12 +86,12 @@ class ResumeAPIIntegration:
         """Initialize the client based on the connection type."""
         if self.connection_type == ConnectionType.LOCAL_SERVER:
             logger.info(f"Initializing connection to local server at {self.local_url}")
-            self.client = APIClient(base_url=self.local_url, api_key=self.api_key)
+            self.client = APIClient(base_url=self.local_url, api_key=self.api_key, session=self.session)
             self._connection_active = self.client.test_connection()
             
         elif self.connection_type == ConnectionType.MANAGE_AI:
             logger.info(f"Initializing connection to ManageAI Resume API at {self.manageai_url}")
-            self.client = ManageAIResumeAdapter(api_url=self.manageai_url, api_key=self.api_key)
+            self.client = ManageAIResumeAdapter(api_url=self.manageai_url, api_key=self.api_key, session=self.session)
             self._connection_active = self.client.test_connection()
             
         elif self.connection_type == ConnectionType.LLM_DIRECT:
@@ -96,7 +99,8 @@ class ResumeAPIIntegration:
             self.client = LocalLLMAdapter(
                 host=self.llm_host,
                 port=self.llm_port,
-                model_name=self.llm_model
+                model_name=self.llm_model,
+                session=self.session
             )
             self._connection_active = self.client.test_connection()
             
@@ -240,7 +244,7 @@ class ResumeAPIIntegration:
                 "generated_at": None
             }
     
-    def improve_resume(self, resume_content, job_description=None, feedback=None):
+    def improve_resume(self, resume_content, job_description=None, feedback=None, skip_preprocessing=False, focus=None):
         """
         Get suggestions for improving a resume.
         
@@ -248,6 +252,11 @@ class ResumeAPIIntegration:
             resume_content: Dictionary or string with resume content
             job_description: Optional job description to tailor for
             feedback: Optional specific feedback to incorporate
+            skip_preprocessing: With ManageAI, skip the match step and the API's
+                own LLM reformatting of the input, for callers whose input is
+                already structured
+            focus: With the local server, the area the feedback is about
+                (e.g. skills, experience, summary)
             
         Returns:
             Dictionary with improvement suggestions
@@ -261,7 +270,7 @@ class ResumeAPIIntegration:
         # Handle different client types
         if self.connection_type == ConnectionType.LOCAL_SERVER:
             if feedback:
-                return self.client.iterate_resume(resume_content, feedback)
+                return self.client.iterate_resume(resume_content, feedback, focus_area=focus or "general")
             else:
                 return self.client.keyword_optimization(resume_content, job_description)
         
@@ -273,6 +282,10 @@ class ResumeAPIIntegration:
                 # Without job description, just analyze the resume
                 return self.client.analyze_resume(structured_resume)
             
+            if skip_preprocessing:
+                # One round trip instead of match + improve, each an LLM call
+                return self.client.improve_resume(structured_resume, job_description, infer=False)
+            
             # With job description, get improvement suggestions
             match_result = self.client.match_resume_to_job(structured_resume, job_description)
             return self.client.improve_resume(structured_resume, job_description, match_result)
@@ -403,7 +416,7 @@ class ResumeAPIIntegration:
                     host, port = "localhost", 8080
                     
                 # Create and start API manager if needed
-                api_manager = ManageAIAPIManager(host=host, port=port)
+                api_manager = ManageAIAPIManager(host=host, port=port, session=self.session)
                 
                 # Try to start the server if it's not running
                 if not api_manager.is_server_running():
@@ -423,13 +436,9 @@ class ResumeAPIIntegration:
                 
         # For LLM Studio connection, just test if it's accessible
         elif self.connection_type == ConnectionType.LLM_DIRECT:
-            # Just verify the connection works
-            adapter = LocalLLMAdapter(
-                host=self.llm_host,
-                port=self.llm_port,
-                model_name=self.llm_model
-            )
-            if adapter.test_connection():
+            # Just verify the connection works; the client was made for this
+            # host, port and model by _init_client
+            if self.client.test_connection():
                 logger.info(f"LLM Studio is accessible at {self.llm_host}:{self.llm_port}")
                 return True
             else:
@@ -461,13 +470,14 @@ class ResumeAPIIntegration:
                 logger.info("Connection to ManageAI Resume API failed, attempting to start the server...")
                 api_manager = ManageAIAPIManager(
                     host=self.manageai_url.split('://')[1].split(':')[0] if '://' in self.manageai_url else 'localhost',
-                    port=int(self.manageai_url.split(':')[-1].split('/')[0]) if ':' in self.manageai_url else 8080
+                    port=int(self.manageai_url.split(':')[-1].split('/')[0]) if ':' in self.manageai_url else 8080,
+                    session=self.session
                 )
                 
                 if api_manager.start_server(wait_for_startup=True, timeout=30, retries=2):
                     logger.info("ManageAI Resume API server started successfully")
                     # Re-initialize the client
-                    self.client = ManageAIResumeAdapter(api_url=self.manageai_url, api_key=self.api_key)
+                    self.client = ManageAIResumeAdapter(api_url=self.manageai_url, api_key=self.api_key, session=self.session)
                     self._connection_active = self.client.test_connection()
                     return self._connection_active
                 else:
@@ -127,6 +127,18 @@ class SectionClassifier:
         
         return best_match
     
+    def classify_batch(self, sections: List[Tuple[str, str]]) -> List[Tuple[str, float]]:
+        """
+        Classify several resume sections in one call.
+        
+        Args:
+            sections: List of (section_title, section_content) pairs
+            
+        Returns:
+            List of (section_type, confidence_score) tuples, in input order
+        """
+        return [self.classify_section(title, content) for title, content in sections]
+    
     def _match_by_title(self, title) -> Tuple[str, float]:
         """
         Match a section based on its title.
@@ -7,6 +7,7 @@ This file provides a centralized location for application settings and preferenc
 import os
 import json
 import logging
+import tempfile
 from pathlib import Path
 from enum import Enum
 from typing import Dict, Any, Optional
@@ -122,8 +123,17 @@ class Settings:
             # Create directory if it doesn't exist
             self.settings_file.parent.mkdir(parents=True, exist_ok=True)
             
-            with open(self.settings_file, 'w') as f:
-                json.dump(self.settings, f, indent=2)
+            # Write to a temporary file next to the settings and swap it in, so a
+            # crash mid-write never leaves a truncated file. mkstemp creates it
+            # readable by the owner only, since it holds API keys.
+            fd, tmp_path = tempfile.mkstemp(dir=self.settings_file.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, 'w') as f:
+                    json.dump(self.settings, f, indent=2)
+                os.replace(tmp_path, self.settings_file)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
                 
             logger.info(f"Saved settings to {self.settings_file}")
             return True
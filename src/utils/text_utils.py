@@ -9,6 +9,21 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# A word is any run of non-whitespace characters, as in str.split()
+_WORD_RE = re.compile(r'\S+')
+
+def word_count(text):
+    """
+    Count the words in a text without building a list of them.
+    
+    Args:
+        text (str): The text to count
+        
+    Returns:
+        int: Number of whitespace-separated words
+    """
+    return sum(1 for _ in _WORD_RE.finditer(text))
+
 def detect_broken_lines(text):
     """
     Detect lines that were likely broken incorrectly during OCR.
@@ -19,11 +19,13 @@ import time
 import logging
 import argparse
 import re
+import multiprocessing
 from datetime import datetime
 from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 
 import pytesseract
-from pdf2image import convert_from_path
+from pdf2image import convert_from_path, pdfinfo_from_path
 import cv2
 import numpy as np
 from PIL import Image, ImageEnhance, ImageFilter
@@ -33,21 +35,63 @@ logging.basicConfig(level=logging.INFO,
                    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Location pattern: city, state ZIP
+LOCATION_PATTERN = re.compile(r'(\w+),\s*([A-Z]{2})\s*(\d{5})')
+# Two-character word (e.g. a state code) followed by at least one more word
+STATE_AFTER_WORD_PATTERN = re.compile(r' (\S{2}) \S')
+
 class TargetedOCRImprover:
     """
     Class that focuses on improving OCR for specific problematic words and phrases
     through specialized image processing and OCR techniques.
     """
     
-    def __init__(self, dpi=1500, known_problematic_words=None):
+    def __init__(self, dpi=1500, known_problematic_words=None, fallback_dpi=None, min_confidence=60,
+                 n_workers=1, use_gpu=False, model_precision="float", tessdata_dir=None,
+                 pin_workers=False):
         """
         Initialize the targeted OCR improver
         
         Args:
             dpi: DPI for PDF to image conversion (default: 1500)
             known_problematic_words: Dict of known problematic words and their correct forms
+            fallback_dpi: DPI to re-render a page at when its OCR confidence is low
+                (default: None, never re-render)
+            min_confidence: Mean Tesseract word confidence (0-100) below which a page
+                is re-processed at fallback_dpi
+            n_workers: Number of worker processes used to OCR pages in parallel
+                (default: 1, process pages in order in this process)
+            use_gpu: Recognize text with PaddleOCR on the GPU instead of the
+                multi-pass Tesseract pipeline (requires paddleocr)
+            model_precision: "float" for Tesseract's default models or "int8" for the
+                integer-quantized "fast" LSTM models (tessdata_fast)
+            tessdata_dir: Directory containing the tessdata_fast models used when
+                model_precision is "int8" (default: $TESSDATA_FAST_DIR)
+            pin_workers: Pin each page worker process to its own physical core
+                (Linux only) so the workers don't get moved between CPUs
         """
         self.dpi = dpi
+        self.n_workers = n_workers or 1
+        self.pin_workers = pin_workers
+        self.use_gpu = use_gpu
+        self._gpu_ocr = None
+        self.model_precision = model_precision
+        self.tessdata_dir = tessdata_dir
+        
+        # Point Tesseract at the int8 "fast" models when requested
+        model_options = ""
+        if model_precision == "int8":
+            self.tessdata_dir = tessdata_dir or os.environ.get("TESSDATA_FAST_DIR")
+            if self.tessdata_dir:
+                model_options = f' --tessdata-dir "{self.tessdata_dir}"'
+            else:
+                logger.warning("No tessdata_fast directory given (set TESSDATA_FAST_DIR); "
+                               "using Tesseract's default models")
+        elif model_precision != "float":
+            raise ValueError(f"Unsupported model precision: {model_precision}")
+        self.fallback_dpi = fallback_dpi
+        self.min_confidence = min_confidence
+        self._fallback_improver = None
         
         # Set default problematic words if none provided
         self.known_problem_words = known_problematic_words or {
@@ -89,17 +133,27 @@ class TargetedOCRImprover:
             # Add more known substitutions here
         }
         
+        # Match every correctable word in one pass. Lookups use the lowercased
+        # word, so only lowercase keys can ever match; "villereek" is always
+        # handled as a location fallback.
+        lowercase_keys = [word for word in self.known_problem_words if word == word.lower()]
+        alternatives = sorted(map(re.escape, lowercase_keys), key=len, reverse=True)
+        alternatives.append('villereek,*')
+        self._problem_word_pattern = re.compile(
+            r'(?<!\S)(?:' + '|'.join(alternatives) + r')(?!\S)', re.IGNORECASE
+        )
+        
         # Set PIL decompression bomb threshold for high-res images
         Image.MAX_IMAGE_PIXELS = 300000000
         
         # Base OCR configurations with various PSM values
-        self.base_config_psm3 = f"--oem 3 --psm 3 -l eng --dpi {dpi} -c preserve_interword_spaces=1"
-        self.base_config_psm4 = f"--oem 3 --psm 4 -l eng --dpi {dpi} -c preserve_interword_spaces=1"
-        self.base_config_psm6 = f"--oem 3 --psm 6 -l eng --dpi {dpi} -c preserve_interword_spaces=1"
-        self.base_config_psm11 = f"--oem 3 --psm 11 -l eng --dpi {dpi} -c preserve_interword_spaces=1"
+        self.base_config_psm3 = f"--oem 3 --psm 3 -l eng --dpi {dpi} -c preserve_interword_spaces=1{model_options}"
+        self.base_config_psm4 = f"--oem 3 --psm 4 -l eng --dpi {dpi} -c preserve_interword_spaces=1{model_options}"
+        self.base_config_psm6 = f"--oem 3 --psm 6 -l eng --dpi {dpi} -c preserve_interword_spaces=1{model_options}"
+        self.base_config_psm11 = f"--oem 3 --psm 11 -l eng --dpi {dpi} -c preserve_interword_spaces=1{model_options}"
         
         # Specialized configs for better character differentiation
-        self.special_config = f"--oem 3 --psm 6 -l eng --dpi {dpi} -c preserve_interword_spaces=1 -c textord_min_linesize=1.2"
+        self.special_config = f"--oem 3 --psm 6 -l eng --dpi {dpi} -c preserve_interword_spaces=1 -c textord_min_linesize=1.2{model_options}"
         
         # Create character confusion matrix to help with substitutions
         self.char_confusions = {
@@ -134,18 +188,7 @@ class TargetedOCRImprover:
             str: The improved OCR text
         """
         try:
-            logger.info(f"Converting PDF to images with DPI={self.dpi}")
-            images = convert_from_path(pdf_path, dpi=self.dpi)
-            logger.info(f"Converted {len(images)} pages")
-            
-            all_text = []
-            
-            for i, img in enumerate(images):
-                logger.info(f"Processing page {i+1}")
-                page_text = self._process_page(img)
-                all_text.append(page_text)
-            
-            return "\n\n".join(all_text)
+            return "\n\n".join(self.process_pdf_iter(pdf_path))
         
         except Exception as e:
             logger.error(f"Error processing PDF: {e}")
@@ -153,6 +196,135 @@ class TargetedOCRImprover:
             traceback.print_exc()
             return ""
     
+    def process_pdf_iter(self, pdf_path):
+        """
+        Process a PDF file and yield the improved OCR text one page at a time
+        
+        Args:
+            pdf_path: Path to the PDF file
+            
+        Yields:
+            str: The improved OCR text of each page, in page order
+        """
+        if self.use_gpu:
+            logger.info(f"Converting PDF to images with DPI={self.dpi}")
+            images = convert_from_path(pdf_path, dpi=self.dpi)
+            logger.info(f"Recognizing {len(images)} pages on the GPU")
+            for img in images:
+                yield self._process_page_gpu(img)
+            return
+        
+        page_count = pdfinfo_from_path(pdf_path)["Pages"]
+        logger.info(f"Processing {page_count} pages with DPI={self.dpi}")
+        page_numbers = range(1, page_count + 1)
+        
+        if self.n_workers > 1 and page_count > 1:
+            # Pages are independent, so OCR them in parallel worker processes
+            cpus = None
+            if self.pin_workers and hasattr(os, "sched_setaffinity"):
+                cpus = _physical_cpus()
+            with ProcessPoolExecutor(max_workers=min(self.n_workers, page_count),
+                                     initializer=_init_page_worker,
+                                     initargs=(self, multiprocessing.Value("i", 0), cpus)) as executor:
+                yield from executor.map(_process_pdf_page, [pdf_path] * page_count, page_numbers)
+        else:
+            for page_number in page_numbers:
+                yield self._process_pdf_page(pdf_path, page_number)
+    
+    def _process_pdf_page(self, pdf_path, page_number):
+        """
+        Render and process a single page of a PDF file
+        
+        Args:
+            pdf_path: Path to the PDF file
+            page_number: 1-based page number
+            
+        Returns:
+            str: Improved OCR text for the page
+        """
+        logger.info(f"Processing page {page_number}")
+        img = convert_from_path(pdf_path, dpi=self.dpi,
+                                first_page=page_number, last_page=page_number)[0]
+        
+        # Pages that OCR poorly are processed at a higher resolution instead;
+        # checking first skips the full pipeline on a render that is discarded
+        if self.fallback_dpi and self.fallback_dpi > self.dpi:
+            confidence = self._page_confidence(img)
+            if confidence < self.min_confidence:
+                logger.info(f"Page {page_number} confidence {confidence:.1f} is below "
+                            f"{self.min_confidence}, processing at DPI={self.fallback_dpi}")
+                return self._process_page_at_fallback_dpi(pdf_path, page_number)
+        
+        return self._process_page(img)
+    
+    def _get_gpu_ocr(self):
+        """Create the PaddleOCR GPU pipeline on first use."""
+        if self._gpu_ocr is None:
+            try:
+                from paddleocr import PaddleOCR
+            except ImportError:
+                raise ImportError("GPU OCR requires PaddleOCR: pip install paddleocr paddlepaddle-gpu")
+            self._gpu_ocr = PaddleOCR(use_angle_cls=True, lang='en', use_gpu=True, show_log=False)
+        return self._gpu_ocr
+    
+    def _process_page_gpu(self, img):
+        """
+        Recognize a page image with PaddleOCR on the GPU
+        
+        Args:
+            img: PIL Image object of the page
+            
+        Returns:
+            str: Corrected OCR text for the page
+        """
+        result = self._get_gpu_ocr().ocr(np.array(img.convert('RGB')), cls=True)
+        lines = result[0] or []
+        
+        # Order recognized lines top-to-bottom, then left-to-right, by their top-left corner
+        lines.sort(key=lambda line: (line[0][0][1], line[0][0][0]))
+        text = "\n".join(line[1][0] for line in lines)
+        
+        return self._apply_corrections(text)
+    
+    def _page_confidence(self, img):
+        """
+        Estimate how reliably Tesseract reads a page image
+        
+        Args:
+            img: PIL Image object of the page
+            
+        Returns:
+            float: Mean word confidence (0-100), or 0 if no words were found
+        """
+        data = pytesseract.image_to_data(img, config=self.base_config_psm6,
+                                         output_type=pytesseract.Output.DICT)
+        confidences = [float(conf) for conf in data.get('conf', []) if float(conf) >= 0]
+        if not confidences:
+            return 0.0
+        return sum(confidences) / len(confidences)
+    
+    def _process_page_at_fallback_dpi(self, pdf_path, page_number):
+        """
+        Render a single page at the fallback DPI and process it
+        
+        Args:
+            pdf_path: Path to the PDF file
+            page_number: 1-based page number
+            
+        Returns:
+            str: Improved OCR text for the page
+        """
+        if self._fallback_improver is None:
+            self._fallback_improver = TargetedOCRImprover(
+                dpi=self.fallback_dpi,
+                known_problematic_words=self.known_problem_words,
+                model_precision=self.model_precision,
+                tessdata_dir=self.tessdata_dir
+            )
+        images = convert_from_path(pdf_path, dpi=self.fallback_dpi,
+                                   first_page=page_number, last_page=page_number)
+        return self._fallback_improver._process_page(images[0])
+    
     def _process_page(self, img):
         """
         Process a single page image with multiple techniques and combine results
@@ -767,59 +939,15 @@ class TargetedOCRImprover:
         Returns:
             str: Corrected text
         """
-        # Split text into words for processing
-        words = text.split()
-        corrected_words = []
-        
-        # Look for location patterns: city, state ZIP
-        # For example: "villereek, UT 84106" should become "millcreek, UT 84106"
-        location_pattern = re.compile(r'(\w+),\s*([A-Z]{2})\s*(\d{5})')
-        
-        for i, word in enumerate(words):
-            # Convert to lowercase for checking
-            word_lower = word.lower()
-            
-            # Check if word is in known problem words
-            if word_lower in self.known_problem_words:
-                # Replace with correct word, preserving capitalization
-                correct_word = self.known_problem_words[word_lower]
-                
-                # Preserve original capitalization pattern
-                if word.isupper():
-                    corrected = correct_word.upper()
-                elif word[0].isupper():
-                    corrected = correct_word.capitalize()
-                else:
-                    corrected = correct_word
-                    
-                corrected_words.append(corrected)
-                logger.info(f"Corrected '{word}' to '{corrected}'")
-            else:
-                # Special handling for location patterns
-                if i < len(words) - 2 and word.endswith(',') and len(words[i+1]) == 2 and words[i+1].isupper():
-                    # This might be part of a location pattern: "villereek, UT 84106"
-                    city_part = word.rstrip(',')
-                    if city_part.lower() == 'villereek':
-                        corrected = 'millcreek,'
-                        corrected_words.append(corrected)
-                        logger.info(f"Corrected location '{word}' to '{corrected}'")
-                    else:
-                        corrected_words.append(word)
-                else:
-                    # Look for standalone instances of villereek without comma
-                    if word_lower == 'villereek':
-                        corrected = 'millcreek'
-                        if word[0].isupper():
-                            corrected = corrected.capitalize()
-                        corrected_words.append(corrected)
-                        logger.info(f"Corrected '{word}' to '{corrected}'")
-                    else:
-                        corrected_words.append(word)
+        # Normalize whitespace so words are separated by single spaces
+        corrected_text = " ".join(text.split())
         
-        corrected_text = " ".join(corrected_words)
+        # Replace all problem words in a single regex pass
+        corrected_text = self._problem_word_pattern.sub(self._correct_problem_word, corrected_text)
         
         # Also do a pattern-based replacement for location formats
-        corrected_text = location_pattern.sub(
+        # For example: "villereek, UT 84106" should become "millcreek, UT 84106"
+        corrected_text = LOCATION_PATTERN.sub(
             lambda m: (f"millcreek, {m.group(2)} {m.group(3)}" 
                       if m.group(1).lower() == 'villereek' 
                       else m.group(0)), 
@@ -827,6 +955,110 @@ class TargetedOCRImprover:
         )
         
         return corrected_text
+    
+    def _correct_problem_word(self, match):
+        """
+        Correct a single word matched by the problem word pattern
+        
+        Args:
+            match: Regex match object for a whole word
+            
+        Returns:
+            str: Corrected word
+        """
+        word = match.group(0)
+        word_lower = word.lower()
+        
+        # Check if word is in known problem words
+        if word_lower in self.known_problem_words:
+            # Replace with correct word, preserving capitalization
+            correct_word = self.known_problem_words[word_lower]
+            
+            # Preserve original capitalization pattern
+            if word.isupper():
+                corrected = correct_word.upper()
+            elif word[0].isupper():
+                corrected = correct_word.capitalize()
+            else:
+                corrected = correct_word
+            
+            logger.info(f"Corrected '{word}' to '{corrected}'")
+            return corrected
+        
+        if word.endswith(','):
+            # This might be part of a location pattern: "villereek, UT 84106"
+            state = STATE_AFTER_WORD_PATTERN.match(match.string, match.end())
+            if state and state.group(1).isupper():
+                corrected = 'millcreek,'
+                logger.info(f"Corrected location '{word}' to '{corrected}'")
+                return corrected
+            return word
+        
+        # Standalone instance of villereek without comma
+        corrected = 'millcreek'
+        if word[0].isupper():
+            corrected = corrected.capitalize()
+        logger.info(f"Corrected '{word}' to '{corrected}'")
+        return corrected
+
+
+# Improver used by each page worker process, set once by _init_page_worker
+_page_worker_improver = None
+
+def _init_page_worker(improver, worker_counter, cpus=None):
+    """
+    Store the improver for this worker process so it is only sent once
+    
+    Args:
+        improver: TargetedOCRImprover used to process the pages
+        worker_counter: Shared counter used to number the workers
+        cpus: CPUs to pin the workers to, one per worker in turn
+            (default: None, leave scheduling to the OS)
+    """
+    global _page_worker_improver
+    _page_worker_improver = improver
+    
+    if cpus:
+        with worker_counter.get_lock():
+            worker_index = worker_counter.value
+            worker_counter.value += 1
+        # Tesseract subprocesses inherit the affinity of the worker
+        os.sched_setaffinity(0, {cpus[worker_index % len(cpus)]})
+
+def _physical_cpus():
+    """
+    List the CPUs this process may run on, keeping one CPU per physical core
+    
+    Returns:
+        list: CPU numbers, all allowed CPUs if the core layout is unknown
+    """
+    allowed = sorted(os.sched_getaffinity(0))
+    
+    # Map each logical CPU to its (physical id, core id) pair
+    cores = {}
+    try:
+        with open("/proc/cpuinfo") as f:
+            for block in f.read().split("\n\n"):
+                fields = dict(line.split(":", 1) for line in block.splitlines() if ":" in line)
+                fields = {key.strip(): value.strip() for key, value in fields.items()}
+                if "processor" in fields and "core id" in fields:
+                    cores[int(fields["processor"])] = (fields.get("physical id"), fields["core id"])
+    except (OSError, ValueError):
+        return allowed
+    
+    # Skip hyperthread siblings of cores we already have
+    cpus = []
+    seen_cores = set()
+    for cpu in allowed:
+        core = cores.get(cpu, cpu)
+        if core not in seen_cores:
+            seen_cores.add(core)
+            cpus.append(cpu)
+    return cpus
+
+def _process_pdf_page(pdf_path, page_number):
+    """Process one PDF page in a worker process."""
+    return _page_worker_improver._process_pdf_page(pdf_path, page_number)
 
 
 def main():
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Tests for keyword matching in the JobAnalyzer
+"""
+
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+from utils.job_analyzer import JobAnalyzer
+
+
+class TestKeywordMatching(unittest.TestCase):
+    """Tests for splitting job keywords into present and missing ones."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.analyzer = JobAnalyzer()
+
+    def test_overlapping_phrases(self):
+        """Phrases that overlap each other in the resume are all found."""
+        keywords = ['machine learning', 'learning systems', 'data pipelines', 'pipelines tooling']
+        present, missing = self.analyzer._match_keywords(
+            keywords, "Built machine learning systems and data pipelines tooling"
+        )
+        self.assertEqual(present, keywords)
+        self.assertEqual(missing, [])
+
+    def test_keyword_inside_longer_phrase(self):
+        """A keyword that only appears inside a longer matched phrase is found."""
+        present, missing = self.analyzer._match_keywords(
+            ['machine learning', 'learning'], "Five years of machine learning research"
+        )
+        self.assertEqual(present, ['machine learning', 'learning'])
+        self.assertEqual(missing, [])
+
+    def test_missing_keywords(self):
+        """Keywords absent from the resume, or only present as part of a word, are missing."""
+        present, missing = self.analyzer._match_keywords(
+            ['Python', 'Go', 'Kubernetes'], "Python developer, Google alumnus"
+        )
+        self.assertEqual(present, ['Python'])
+        self.assertEqual(missing, ['Go', 'Kubernetes'])
+
+    def test_case_insensitive(self):
+        """Keywords match regardless of case."""
+        present, missing = self.analyzer._match_keywords(['AWS', 'docker'], "aws and Docker")
+        self.assertEqual(present, ['AWS', 'docker'])
+        self.assertEqual(missing, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Tests for mapping batched, section-tagged LLM responses back onto a resume
+"""
+
+import os
+import sys
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+from utils.llm_refiner import LLMRefiner
+
+
+def make_resume(*sections):
+    """Build a minimal resume object from (title, content) pairs."""
+    return SimpleNamespace(
+        contact_info={},
+        sections=[SimpleNamespace(title=title, content=content) for title, content in sections]
+    )
+
+
+class TestTaggedSections(unittest.TestCase):
+    """Tests for LLMRefiner._update_tagged_sections."""
+
+    def setUp(self):
+        """Set up a batching refiner without contacting the API."""
+        with mock.patch.object(LLMRefiner, '_check_api_connection'):
+            self.refiner = LLMRefiner(batch=True)
+
+    def test_round_trip(self):
+        """A response that keeps the tags updates every section."""
+        resume = make_resume(("Summary", "old summary"), ("Skills", "old skills"))
+        response = self.refiner._extract_text(resume).replace("old", "new")
+        self.assertTrue(self.refiner._update_tagged_sections(resume, response))
+        self.assertEqual([s.content for s in resume.sections], ["new summary", "new skills"])
+
+    def test_missing_tag(self):
+        """A response missing a section's tag leaves the resume unchanged."""
+        resume = make_resume(("Summary", "old summary"), ("Skills", "old skills"))
+        response = '<section id="0" name="Summary">\nnew summary\n</section>'
+        self.assertFalse(self.refiner._update_tagged_sections(resume, response))
+        self.assertEqual([s.content for s in resume.sections], ["old summary", "old skills"])
+
+    def test_duplicate_titles(self):
+        """Sections with the same title, or titles equal after quoting, keep their own content."""
+        resume = make_resume(
+            ("Experience", "first job"),
+            ("Experience", "second job"),
+            ('The "Best" Bits', "quoted"),
+            ("The 'Best' Bits", "single quoted"),
+        )
+        response = self.refiner._extract_text(resume).replace("job", "role").replace("quoted", "kept")
+        self.assertTrue(self.refiner._update_tagged_sections(resume, response))
+        self.assertEqual(
+            [s.content for s in resume.sections],
+            ["first role", "second role", "kept", "single kept"]
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()